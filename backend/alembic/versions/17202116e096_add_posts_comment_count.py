@@ -0,0 +1,39 @@
+"""Add posts comment_count
+
+Revision ID: 17202116e096
+Revises: 58ed7947a742
+Create Date: 2026-10-17 14:00:00.000000
+
+게시글 목록 렌더링 시 게시글마다 실행하던 댓글 COUNT 쿼리를 없애기 위해
+posts.comment_count (삭제되지 않은 댓글 수, 대댓글 포함)를 추가하고 기존 데이터로 채웁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '17202116e096'
+down_revision = '58ed7947a742'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('posts', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE posts p
+        SET comment_count = c.actual
+        FROM (
+            SELECT post_id, count(*) AS actual
+            FROM comments
+            WHERE deleted_at IS NULL
+            GROUP BY post_id
+        ) c
+        WHERE c.post_id = p.post_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('posts', 'comment_count')
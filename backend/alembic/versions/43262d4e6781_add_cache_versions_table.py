@@ -0,0 +1,30 @@
+"""Add cache_versions table
+
+Revision ID: 43262d4e6781
+Revises: 17202116e096
+Create Date: 2026-10-17 15:00:00.000000
+
+프로세스 메모리 캐시(칭호 카탈로그 등)를 여러 워커에서 함께 무효화하기 위한 버전 테이블을 추가합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '43262d4e6781'
+down_revision = '17202116e096'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('cache_versions',
+    sa.Column('name', sa.String(length=50), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False, server_default='1'),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('cache_versions')
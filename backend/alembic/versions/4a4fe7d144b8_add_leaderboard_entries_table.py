@@ -0,0 +1,77 @@
+"""Add leaderboard entries table
+
+Revision ID: 4a4fe7d144b8
+Revises: 4f4f49dfef38
+Create Date: 2026-10-17 11:00:00.000000
+
+그룹별/주요 악기별 일/주/월/전체 기간 순위표를 일일 합계에서 백필합니다.
+(일 단위 순위표는 최근 35일만 생성)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4a4fe7d144b8'
+down_revision = '4f4f49dfef38'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('leaderboard_entries',
+    sa.Column('scope_type', sa.String(length=20), nullable=False),
+    sa.Column('scope_id', sa.Integer(), nullable=False),
+    sa.Column('period_type', sa.String(length=10), nullable=False),
+    sa.Column('period_start', sa.Date(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('total_seconds', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('scope_type', 'scope_id', 'period_type', 'period_start', 'user_id')
+    )
+    op.create_index(op.f('ix_leaderboard_entries_user_id'), 'leaderboard_entries', ['user_id'], unique=False)
+    op.create_index(
+        'ix_leaderboard_entries_ranking',
+        'leaderboard_entries',
+        ['scope_type', 'scope_id', 'period_type', 'period_start', sa.text('total_seconds DESC'), 'user_id'],
+        unique=False
+    )
+
+    # 기존 데이터 백필
+    op.execute("""
+        WITH scopes AS (
+            SELECT 'group' AS scope_type, group_id AS scope_id, user_id
+            FROM group_members
+            UNION ALL
+            SELECT 'instrument', upi.instrument_id, up.user_id
+            FROM user_profile_instruments upi
+            JOIN user_profiles up ON up.profile_id = upi.profile_id
+            WHERE upi.is_primary = true
+        ), periods AS (
+            SELECT s.scope_type, s.scope_id, s.user_id, d.practice_date, d.total_seconds,
+                   date_trunc('week', d.practice_date)::date AS week_start,
+                   date_trunc('month', d.practice_date)::date AS month_start
+            FROM scopes s
+            JOIN practice_daily_totals d ON d.user_id = s.user_id
+        )
+        INSERT INTO leaderboard_entries (scope_type, scope_id, period_type, period_start, user_id, total_seconds)
+        SELECT scope_type, scope_id, 'day', practice_date, user_id, SUM(total_seconds)
+        FROM periods WHERE practice_date >= CURRENT_DATE - 35
+        GROUP BY scope_type, scope_id, practice_date, user_id
+        UNION ALL
+        SELECT scope_type, scope_id, 'week', week_start, user_id, SUM(total_seconds)
+        FROM periods GROUP BY scope_type, scope_id, week_start, user_id
+        UNION ALL
+        SELECT scope_type, scope_id, 'month', month_start, user_id, SUM(total_seconds)
+        FROM periods GROUP BY scope_type, scope_id, month_start, user_id
+        UNION ALL
+        SELECT scope_type, scope_id, 'all', DATE '1970-01-01', user_id, SUM(total_seconds)
+        FROM periods GROUP BY scope_type, scope_id, user_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_leaderboard_entries_ranking', table_name='leaderboard_entries')
+    op.drop_index(op.f('ix_leaderboard_entries_user_id'), table_name='leaderboard_entries')
+    op.drop_table('leaderboard_entries')
@@ -0,0 +1,43 @@
+"""Add practice daily totals table
+
+Revision ID: 4f4f49dfef38
+Revises: eef1da3cca7e
+Create Date: 2026-10-17 10:00:00.000000
+
+완료된 세션을 (user_id, practice_date) 단위로 집계하여 백필합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4f4f49dfef38'
+down_revision = 'eef1da3cca7e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('practice_daily_totals',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('practice_date', sa.Date(), nullable=False),
+    sa.Column('total_seconds', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.Column('session_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'practice_date')
+    )
+    op.create_index(op.f('ix_practice_daily_totals_practice_date'), 'practice_daily_totals', ['practice_date'], unique=False)
+
+    # 기존 완료 세션 백필
+    op.execute("""
+        INSERT INTO practice_daily_totals (user_id, practice_date, total_seconds, session_count)
+        SELECT user_id, practice_date, COALESCE(SUM(actual_play_time), 0), COUNT(session_id)
+        FROM practice_sessions
+        WHERE status = 'completed'
+        GROUP BY user_id, practice_date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_practice_daily_totals_practice_date'), table_name='practice_daily_totals')
+    op.drop_table('practice_daily_totals')
@@ -0,0 +1,39 @@
+"""Add posts keyset pagination indexes
+
+Revision ID: 58ed7947a742
+Revises: 5d6430088a56
+Create Date: 2026-10-17 13:00:00.000000
+
+게시글 목록 커서 페이지네이션용 (created_at, post_id) 내림차순 인덱스와
+노출 게시글(삭제/숨김 제외) 전용 부분 인덱스를 추가합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '58ed7947a742'
+down_revision = '5d6430088a56'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_posts_created_at_post_id',
+        'posts',
+        [sa.text('created_at DESC'), sa.text('post_id DESC')],
+        unique=False
+    )
+    op.create_index(
+        'ix_posts_visible_created_at',
+        'posts',
+        [sa.text('created_at DESC'), sa.text('post_id DESC')],
+        unique=False,
+        postgresql_where=sa.text('deleted_at IS NULL AND (is_hidden = false OR is_hidden IS NULL)')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_visible_created_at', table_name='posts')
+    op.drop_index('ix_posts_created_at_post_id', table_name='posts')
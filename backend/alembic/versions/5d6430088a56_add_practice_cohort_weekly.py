@@ -0,0 +1,57 @@
+"""Add practice cohort key and weekly cohort aggregates
+
+Revision ID: 5d6430088a56
+Revises: 4a4fe7d144b8
+Create Date: 2026-10-17 12:00:00.000000
+
+user_profiles.cohort_key ("주요악기ID:특징ID,...")를 추가하고 기존 프로필을 백필합니다.
+코호트 주간 집계는 조회 시 또는 python -m app.services.practice_cohort refresh 로 채워집니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '5d6430088a56'
+down_revision = '4a4fe7d144b8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('user_profiles', sa.Column('cohort_key', sa.String(length=255), nullable=True))
+    op.create_index(op.f('ix_user_profiles_cohort_key'), 'user_profiles', ['cohort_key'], unique=False)
+
+    op.create_table('practice_cohort_weekly',
+    sa.Column('cohort_key', sa.String(length=255), nullable=False),
+    sa.Column('week_start', sa.Date(), nullable=False),
+    sa.Column('week_end', sa.Date(), nullable=False),
+    sa.Column('user_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('day_totals', postgresql.ARRAY(sa.BigInteger()), nullable=False),
+    sa.Column('day_user_counts', postgresql.ARRAY(sa.Integer()), nullable=False),
+    sa.Column('full_week_users', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('refreshed_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('cohort_key', 'week_start', 'week_end')
+    )
+
+    # 기존 프로필 cohort_key 백필 (주요 악기와 특징이 모두 있는 경우만)
+    op.execute("""
+        UPDATE user_profiles p
+        SET cohort_key = k.cohort_key
+        FROM (
+            SELECT upi.profile_id,
+                   upi.instrument_id::text || ':' || string_agg(upt.user_type_id::text, ',' ORDER BY upt.user_type_id) AS cohort_key
+            FROM user_profile_instruments upi
+            JOIN user_profile_user_types upt ON upt.profile_id = upi.profile_id
+            WHERE upi.is_primary = true
+            GROUP BY upi.profile_id, upi.instrument_id
+        ) k
+        WHERE p.profile_id = k.profile_id
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('practice_cohort_weekly')
+    op.drop_index(op.f('ix_user_profiles_cohort_key'), table_name='user_profiles')
+    op.drop_column('user_profiles', 'cohort_key')
@@ -0,0 +1,47 @@
+"""Add notification_events outbox table
+
+Revision ID: 876f39db0599
+Revises: dee5a5a502b9
+Create Date: 2026-10-17 19:00:00.000000
+
+알림 outbox 이벤트 테이블을 추가합니다.
+요청 트랜잭션에서는 이벤트만 기록하고, app.services.notification_outbox 디스패처가 notifications 행으로 펼칩니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '876f39db0599'
+down_revision = 'dee5a5a502b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('notification_events',
+    sa.Column('event_id', sa.BigInteger(), nullable=False),
+    sa.Column('event_type', sa.String(length=50), nullable=False),
+    sa.Column('actor_id', sa.Integer(), nullable=True),
+    sa.Column('post_id', sa.Integer(), nullable=True),
+    sa.Column('comment_id', sa.Integer(), nullable=True),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+    sa.Column('created_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('processed_at', sa.TIMESTAMP(), nullable=True),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.PrimaryKeyConstraint('event_id')
+    )
+    op.create_index(
+        'ix_notification_events_pending',
+        'notification_events',
+        ['event_id'],
+        unique=False,
+        postgresql_where=sa.text('processed_at IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notification_events_pending', table_name='notification_events', postgresql_where=sa.text('processed_at IS NULL'))
+    op.drop_table('notification_events')
@@ -0,0 +1,55 @@
+"""Add tag_stats table and posts manual_tags GIN index
+
+Revision ID: 970c4128e1e4
+Revises: a651ad61e928
+Create Date: 2026-10-17 17:00:00.000000
+
+태그 포함 검색(manual_tags @> ARRAY[tag])용 GIN 인덱스와 태그별 노출 게시글 수 통계 테이블을 추가하고,
+기존 게시글 태그로 통계를 채웁니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '970c4128e1e4'
+down_revision = 'a651ad61e928'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_posts_manual_tags', 'posts', ['manual_tags'], unique=False, postgresql_using='gin')
+
+    op.create_table('tag_stats',
+    sa.Column('tag', sa.String(length=100), nullable=False),
+    sa.Column('post_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('last_used_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('tag')
+    )
+    op.create_index(
+        'ix_tag_stats_tag_prefix', 'tag_stats', ['tag'], unique=False,
+        postgresql_ops={'tag': 'varchar_pattern_ops'}
+    )
+    op.create_index('ix_tag_stats_post_count', 'tag_stats', [sa.text('post_count DESC')], unique=False)
+    op.create_index('ix_tag_stats_last_used_at', 'tag_stats', [sa.text('last_used_at DESC')], unique=False)
+
+    # 기존 노출 게시글 태그로 통계 백필
+    op.execute("""
+        INSERT INTO tag_stats (tag, post_count, last_used_at)
+        SELECT btrim(t.tag), count(DISTINCT p.post_id), max(coalesce(p.updated_at, p.created_at, now()))
+        FROM posts p, unnest(p.manual_tags) AS t(tag)
+        WHERE p.deleted_at IS NULL
+          AND (p.is_hidden = false OR p.is_hidden IS NULL)
+          AND btrim(t.tag) <> ''
+          AND length(btrim(t.tag)) <= 100
+        GROUP BY btrim(t.tag)
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tag_stats_last_used_at', table_name='tag_stats')
+    op.drop_index('ix_tag_stats_post_count', table_name='tag_stats')
+    op.drop_index('ix_tag_stats_tag_prefix', table_name='tag_stats')
+    op.drop_table('tag_stats')
+    op.drop_index('ix_posts_manual_tags', table_name='posts')
@@ -0,0 +1,52 @@
+"""Add posts full-text and trigram search indexes
+
+Revision ID: a651ad61e928
+Revises: 43262d4e6781
+Create Date: 2026-10-17 16:00:00.000000
+
+게시글 검색을 위해 제목/본문 tsvector 생성 컬럼(posts.search_vector)과 GIN 인덱스,
+한국어 부분 문자열 검색용 pg_trgm 트라이그램 GIN 인덱스(title, content)를 추가합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'a651ad61e928'
+down_revision = '43262d4e6781'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # 생성 컬럼 추가 시 기존 행도 함께 계산됨
+    op.add_column('posts', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(content, '')), 'B')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index('ix_posts_search_vector', 'posts', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_posts_title_trgm', 'posts', ['title'], unique=False,
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_posts_content_trgm', 'posts', ['content'], unique=False,
+        postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_content_trgm', table_name='posts')
+    op.drop_index('ix_posts_title_trgm', table_name='posts')
+    op.drop_index('ix_posts_search_vector', table_name='posts')
+    op.drop_column('posts', 'search_vector')
+    # pg_trgm 확장은 다른 객체가 사용할 수 있으므로 제거하지 않음
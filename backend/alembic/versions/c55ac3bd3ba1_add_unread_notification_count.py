@@ -0,0 +1,44 @@
+"""Add users.unread_notification_count and notification feed index
+
+Revision ID: c55ac3bd3ba1
+Revises: e8c5dbd3fb7c
+Create Date: 2026-10-17 21:00:00.000000
+
+알림 배지용 읽지 않은 알림 수 컬럼(기존 데이터로 채움)과
+알림 목록 커서 페이지네이션용 (receiver_id, created_at, notification_id) 인덱스를 추가합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c55ac3bd3ba1'
+down_revision = 'e8c5dbd3fb7c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('unread_notification_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute("""
+        UPDATE users u
+        SET unread_notification_count = c.unread
+        FROM (
+            SELECT receiver_id, count(*) AS unread
+            FROM notifications
+            WHERE is_read = false
+            GROUP BY receiver_id
+        ) AS c
+        WHERE u.user_id = c.receiver_id
+    """)
+    op.create_index(
+        'ix_notifications_receiver_created',
+        'notifications',
+        ['receiver_id', sa.text('created_at DESC'), sa.text('notification_id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_notifications_receiver_created', table_name='notifications')
+    op.drop_column('users', 'unread_notification_count')
@@ -0,0 +1,31 @@
+"""Add comments top-level pagination index
+
+Revision ID: dee5a5a502b9
+Revises: 970c4128e1e4
+Create Date: 2026-10-17 18:00:00.000000
+
+게시글별 최상위 댓글을 (created_at, comment_id) 순으로 커서 페이지네이션하기 위한 부분 인덱스를 추가합니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'dee5a5a502b9'
+down_revision = '970c4128e1e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_comments_post_roots',
+        'comments',
+        ['post_id', 'created_at', 'comment_id'],
+        unique=False,
+        postgresql_where=sa.text('parent_comment_id IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_comments_post_roots', table_name='comments')
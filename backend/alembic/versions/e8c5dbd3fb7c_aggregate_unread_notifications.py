@@ -0,0 +1,85 @@
+"""Aggregate unread like/comment/reply notifications
+
+Revision ID: e8c5dbd3fb7c
+Revises: 876f39db0599
+Create Date: 2026-10-17 20:00:00.000000
+
+좋아요/댓글/답글 알림을 읽지 않은 (receiver_id, type, post_id) 단위 한 행으로 묶기 위한 컬럼과 부분 유니크 인덱스를 추가합니다.
+기존에 쌓인 읽지 않은 중복 알림은 가장 최근 행 하나로 합칩니다.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e8c5dbd3fb7c'
+down_revision = '876f39db0599'
+branch_labels = None
+depends_on = None
+
+UNREAD_GROUP_WHERE = "is_read = false AND type IN ('like', 'comment', 'reply')"
+
+
+def upgrade() -> None:
+    op.add_column('notifications', sa.Column('actor_count', sa.Integer(), server_default='1', nullable=False))
+    op.add_column('notifications', sa.Column('recent_sender_ids', postgresql.ARRAY(sa.Integer()), nullable=True))
+
+    # 읽지 않은 묶음 대상 알림을 그룹별 최신 행으로 합치기
+    op.execute(f"""
+        WITH ranked AS (
+            SELECT notification_id, receiver_id, type, post_id, sender_id,
+                   row_number() OVER (
+                       PARTITION BY receiver_id, type, post_id
+                       ORDER BY created_at DESC, notification_id DESC
+                   ) AS rn
+            FROM notifications
+            WHERE {UNREAD_GROUP_WHERE} AND post_id IS NOT NULL
+        ),
+        senders AS (
+            SELECT receiver_id, type, post_id, sender_id, min(rn) AS rn
+            FROM ranked
+            WHERE sender_id IS NOT NULL
+            GROUP BY receiver_id, type, post_id, sender_id
+        ),
+        summary AS (
+            SELECT receiver_id, type, post_id,
+                   count(*) AS actor_count,
+                   (array_agg(sender_id ORDER BY rn))[1:3] AS recent_sender_ids
+            FROM senders
+            GROUP BY receiver_id, type, post_id
+        )
+        UPDATE notifications AS n
+        SET actor_count = summary.actor_count,
+            recent_sender_ids = summary.recent_sender_ids
+        FROM ranked
+        JOIN summary USING (receiver_id, type, post_id)
+        WHERE ranked.rn = 1 AND n.notification_id = ranked.notification_id
+    """)
+    op.execute(f"""
+        DELETE FROM notifications AS n
+        USING (
+            SELECT notification_id,
+                   row_number() OVER (
+                       PARTITION BY receiver_id, type, post_id
+                       ORDER BY created_at DESC, notification_id DESC
+                   ) AS rn
+            FROM notifications
+            WHERE {UNREAD_GROUP_WHERE} AND post_id IS NOT NULL
+        ) AS ranked
+        WHERE ranked.rn > 1 AND n.notification_id = ranked.notification_id
+    """)
+
+    op.create_index(
+        'uq_notifications_unread_group',
+        'notifications',
+        ['receiver_id', 'type', 'post_id'],
+        unique=True,
+        postgresql_where=sa.text(UNREAD_GROUP_WHERE)
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_notifications_unread_group', table_name='notifications', postgresql_where=sa.text(UNREAD_GROUP_WHERE))
+    op.drop_column('notifications', 'recent_sender_ids')
+    op.drop_column('notifications', 'actor_count')
@@ -0,0 +1,36 @@
+"""Add practice stats rollup table
+
+Revision ID: eef1da3cca7e
+Revises: f89aee6c2e9f
+Create Date: 2026-10-17 09:00:00.000000
+
+기존 데이터 백필: python -m app.services.practice_stats rebuild
+(백필 전에도 롤업이 없는 사용자는 최초 통계 조회 시 자동 생성됨)
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'eef1da3cca7e'
+down_revision = 'f89aee6c2e9f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('practice_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('total_practice_time', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.Column('total_sessions', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('last_practice_date', sa.Date(), nullable=True),
+    sa.Column('current_streak', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('longest_streak', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('updated_at', sa.TIMESTAMP(), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.user_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('practice_stats')
@@ -2,28 +2,34 @@
 데이터베이스 연결 및 세션 관리 모듈
 SQLAlchemy를 사용한 PostgreSQL 데이터베이스 연결 설정
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core import db_pool
 
 # SQLAlchemy 엔진 생성
-# pool_pre_ping: 연결이 살아있는지 확인
-# pool_recycle: 연결 풀 재사용 시간 (초)
-# pool_size: 기본 연결 풀 크기 (메모리 제약 환경에 맞게 조정)
-# max_overflow: 추가 연결 허용 수
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    pool_size=5,  # 기본 연결 풀 크기 (메모리 제약 환경에 맞게 조정)
-    max_overflow=10,  # 추가 연결 허용 수
-    echo=settings.DEBUG,  # DEBUG 모드에서 SQL 쿼리 로깅
-)
+# 풀 크기/재사용 시간/pre-ping/pgbouncer 모드는 Settings(DB_POOL_*, DB_PGBOUNCER)에서 설정 (app.core.db_pool)
+# echo: DEBUG 모드에서 SQL 쿼리 로깅
+engine = create_engine(settings.DATABASE_URL, **db_pool.engine_options("sync"))
+db_pool.instrument(engine, "sync")
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 엔진 (asyncpg, 같은 DATABASE_URL 사용)
+# - async 엔드포인트에서 쿼리를 기다리는 동안 이벤트 루프가 다른 요청을 처리할 수 있도록 사용
+# - 동기 서비스 함수는 AsyncSession.run_sync(함수, ...)로 호출 (함수는 동기 Session을 받지만 I/O는 asyncpg로 처리됨)
+async_engine = create_async_engine(
+    db_pool.async_url(settings.DATABASE_URL),
+    **db_pool.engine_options("async", is_async=True)
+)
+db_pool.instrument(async_engine.sync_engine, "async")
+
+# 비동기 세션 팩토리 (커밋 후에도 응답 생성에 객체 속성을 쓸 수 있도록 expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 # Base 클래스: 모든 모델이 상속받을 기본 클래스
 Base = declarative_base()
 
@@ -40,6 +46,15 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션 의존성 함수
+    FastAPI의 Depends에서 사용 (async def 엔드포인트 전용)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def init_db():
     """
     데이터베이스 초기화 함수
@@ -52,6 +67,10 @@ def init_db():
     # 모델들은 이미 app.models.__init__.py에서 import되어 Base.metadata에 등록됨
     import app.models  # noqa: F401 - 모델 모듈을 import하여 Base.metadata에 등록
     
+    # 인덱스에 필요한 확장 (게시글 검색용 pg_trgm 트라이그램 인덱스)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    
     # 테이블 생성
     Base.metadata.create_all(bind=engine)
     print("✅ 데이터베이스 테이블이 생성되었습니다.")
@@ -0,0 +1,250 @@
+"""
+데이터베이스 연결 풀 설정 및 계측
+- 동기/비동기 엔진의 풀 파라미터를 Settings(DB_POOL_*)에서 만들고, 워커 프로세스별로 풀 상태를 수집
+- DB_PGBOUNCER=true: pgbouncer(transaction pooling) 앞에서 실행 -> 애플리케이션 풀 없이(NullPool) 요청마다 연결하고,
+  asyncpg는 prepared statement 캐시를 끄고 문장 이름을 매번 새로 만들어 다른 클라이언트와 충돌하지 않게 함
+- 체크아웃(풀에서 연결을 얻기까지) 시간을 히스토그램/최근 p50·p99로 기록하고, 풀이 가득 차 기다린 횟수와 시간,
+  타임아웃 수, 새 연결 수를 집계
+- 사용 중 연결이 용량의 DB_POOL_SATURATION_RATIO 이상이거나 체크아웃이 DB_POOL_SLOW_CHECKOUT_MS 이상 걸리면
+  포화 경보로 세고 경고 로그를 남김 (풀마다 ALARM_LOG_INTERVAL에 한 번)
+
+워커별 값이므로 풀 크기는 (워커 수 x (DB_POOL_SIZE + DB_MAX_OVERFLOW) x 엔진 2개)가
+PostgreSQL max_connections 안에 들어가도록 정함
+"""
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Deque, Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 체크아웃 시간 히스토그램 구간 상한 (ms), 마지막 구간은 +Inf
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+RECENT_SAMPLES = 1000  # p50/p99 계산에 쓰는 최근 체크아웃 수
+ALARM_LOG_INTERVAL = 60.0  # 초, 풀별 포화 경고 로그 최소 간격
+
+
+class PoolMonitor:
+    """풀 하나(엔진 하나)의 체크아웃 통계"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pool = None  # 최근 체크아웃한 풀 (dispose 후 다시 만들어진 풀 포함)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._histogram = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+        self._recent: Deque[float] = deque(maxlen=RECENT_SAMPLES)
+        self._last_alarm_log = 0.0
+        self._stats = {
+            "checkouts": 0,
+            "connects": 0,
+            "waits": 0,
+            "wait_seconds": 0.0,
+            "timeouts": 0,
+            "saturation_alarms": 0,
+        }
+
+    # ----- 풀 이벤트 -----
+
+    def on_connect(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._stats["connects"] += 1
+
+    def on_checkout(self, dbapi_connection, connection_record, connection_proxy) -> None:
+        with self._lock:
+            self._in_use += 1
+
+    def on_checkin(self, dbapi_connection, connection_record) -> None:
+        with self._lock:
+            self._in_use = max(self._in_use - 1, 0)
+
+    # ----- 체크아웃 시간 (_TimedCheckout) -----
+
+    def capacity(self) -> Optional[int]:
+        """최대 동시 연결 수 (NullPool이거나 max_overflow=-1이면 제한 없음)"""
+        if isinstance(self.pool, QueuePool) and self.pool._max_overflow >= 0:
+            return self.pool.size() + self.pool._max_overflow
+        return None
+
+    def is_full(self) -> bool:
+        capacity = self.capacity()
+        with self._lock:
+            return capacity is not None and self._in_use >= capacity
+
+    def record_checkout(self, seconds: float, waited: bool) -> None:
+        elapsed_ms = seconds * 1000
+        capacity = self.capacity()
+        with self._lock:
+            self._stats["checkouts"] += 1
+            self._histogram[_bucket_index(elapsed_ms)] += 1
+            self._recent.append(elapsed_ms)
+            if waited:
+                self._stats["waits"] += 1
+                self._stats["wait_seconds"] += seconds
+            saturated = (
+                capacity is not None and self._in_use >= capacity * settings.DB_POOL_SATURATION_RATIO
+            ) or elapsed_ms >= settings.DB_POOL_SLOW_CHECKOUT_MS
+            if saturated:
+                self._stats["saturation_alarms"] += 1
+            in_use = self._in_use
+        if saturated:
+            self._alarm(f"사용 중 {in_use}/{capacity if capacity is not None else '-'}, 체크아웃 {elapsed_ms:.1f}ms")
+
+    def record_timeout(self, seconds: float) -> None:
+        with self._lock:
+            self._stats["timeouts"] += 1
+            self._stats["waits"] += 1
+            self._stats["wait_seconds"] += seconds
+            self._stats["saturation_alarms"] += 1
+        self._alarm(f"{seconds:.1f}초 동안 연결을 얻지 못함 (TimeoutError)")
+
+    def _alarm(self, detail: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if now - self._last_alarm_log < ALARM_LOG_INTERVAL:
+                return
+            self._last_alarm_log = now
+        logger.warning(f"DB 연결 풀 포화 ({self.name}): {detail}")
+
+    # ----- 조회 -----
+
+    def get_metrics(self) -> dict:
+        pool = self.pool
+        capacity = self.capacity()
+        with self._lock:
+            recent = sorted(self._recent)
+            histogram = list(self._histogram)
+            stats = dict(self._stats)
+            in_use = self._in_use
+        labels = [str(bound) for bound in HISTOGRAM_BUCKETS_MS] + ["+Inf"]
+        return {
+            "pool_class": type(pool).__name__ if pool is not None else None,
+            "pool_size": pool.size() if isinstance(pool, QueuePool) else 0,
+            "capacity": capacity,
+            "checked_out": in_use,
+            "checked_in": pool.checkedin() if isinstance(pool, QueuePool) else 0,
+            "overflow": max(pool.overflow(), 0) if isinstance(pool, QueuePool) else 0,
+            **stats,
+            "checkout_ms": {
+                "p50": _percentile(recent, 50),
+                "p99": _percentile(recent, 99),
+                "max": recent[-1] if recent else 0.0,
+            },
+            "checkout_histogram_ms": dict(zip(labels, histogram)),
+        }
+
+
+def _bucket_index(elapsed_ms: float) -> int:
+    for index, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+        if elapsed_ms <= bound:
+            return index
+    return len(HISTOGRAM_BUCKETS_MS)
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))]
+
+
+_monitors: Dict[str, PoolMonitor] = {}
+
+
+def get_monitor(name: str) -> PoolMonitor:
+    monitor = _monitors.get(name)
+    if monitor is None:
+        monitor = _monitors.setdefault(name, PoolMonitor(name))
+    return monitor
+
+
+# ========== 체크아웃 시간을 재는 풀 클래스 ==========
+
+class _TimedCheckout:
+    """Pool.connect()(대기 + 새 연결 + pre-ping 포함)에 걸린 시간을 풀 이름(pool_logging_name)의 모니터에 기록"""
+
+    def connect(self):
+        monitor = get_monitor(self.logging_name)
+        monitor.pool = self
+        waited = monitor.is_full()
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            monitor.record_timeout(time.perf_counter() - started)
+            raise
+        monitor.record_checkout(time.perf_counter() - started, waited)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    pass
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    pass
+
+
+class TimedNullPool(_TimedCheckout, NullPool):
+    pass
+
+
+# ========== 엔진 설정 ==========
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def async_url(database_url: str) -> URL:
+    """DATABASE_URL(postgresql://)을 asyncpg URL로 변환 (pgbouncer 모드에서는 SQLAlchemy 문장 캐시도 끔)"""
+    url = make_url(database_url).set(drivername="postgresql+asyncpg")
+    if settings.DB_PGBOUNCER:
+        url = url.update_query_dict({"prepared_statement_cache_size": "0"})
+    return url
+
+
+def engine_options(name: str, is_async: bool = False) -> dict:
+    """create_engine/create_async_engine 인자 (풀 클래스, 크기, 재사용 시간, pre-ping 등)"""
+    options = {"echo": settings.DEBUG, "pool_logging_name": name}
+    if settings.DB_PGBOUNCER:
+        # 연결 재사용은 pgbouncer가 담당 (트랜잭션이 끝나면 서버 연결이 다른 클라이언트에 넘어감)
+        options["poolclass"] = TimedNullPool
+        if is_async:
+            options["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": _unique_statement_name,
+            }
+        return options
+    options.update(
+        poolclass=TimedAsyncAdaptedQueuePool if is_async else TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    return options
+
+
+def instrument(engine: Engine, name: str) -> PoolMonitor:
+    """엔진(비동기 엔진은 sync_engine)의 풀 이벤트를 모니터에 연결 (dispose 후 새 풀에도 유지됨)"""
+    monitor = get_monitor(name)
+    monitor.pool = engine.pool
+    event.listen(engine, "connect", monitor.on_connect)
+    event.listen(engine, "checkout", monitor.on_checkout)
+    event.listen(engine, "checkin", monitor.on_checkin)
+    return monitor
+
+
+def get_metrics() -> Dict[str, dict]:
+    """풀별 현재 상태와 누적 통계 (요청을 처리한 워커 기준)"""
+    return {
+        name: {"pgbouncer": settings.DB_PGBOUNCER, **monitor.get_metrics()}
+        for name, monitor in _monitors.items()
+    }
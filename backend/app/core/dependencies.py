@@ -9,6 +9,7 @@ from datetime import datetime
 from app.core.database import get_db
 from app.core.security import decode_access_token
 from app.models.user import User
+from app.services import auth_cache
 
 # OAuth2 스키마 설정
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -76,43 +77,38 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    if settings.DEBUG:
-        logger.info(f"Querying database for user_id: {user_id}")
-    
-    # 데이터베이스에서 사용자 조회
-    user = db.query(User).filter(
-        User.user_id == user_id,
-        User.deleted_at.is_(None),  # Soft Delete 필터링
-        User.is_active == True
-    ).first()
+    # 사용자 상태 조회 (app.services.auth_cache: TTL 동안 쿼리 없이 메모리 스냅샷 사용)
+    snapshot = auth_cache.get_snapshot(db, user_id)
     
-    if user is None:
+    if snapshot is None:
         logger.warning(f"User not found in database: user_id={user_id}")
-        # 추가 디버깅: 사용자가 존재하는지 확인
-        user_exists = db.query(User).filter(User.user_id == user_id).first()
-        if user_exists:
-            if settings.DEBUG:
-                logger.warning(f"User exists but: deleted_at={user_exists.deleted_at}, is_active={user_exists.is_active}")
-            if user_exists.deleted_at:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="탈퇴한 사용자입니다.",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-            elif not user_exists.is_active:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="비활성화된 사용자입니다.",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="사용자를 찾을 수 없습니다.",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    if snapshot.deleted_at:
+        if settings.DEBUG:
+            logger.warning(f"User exists but: deleted_at={snapshot.deleted_at}, is_active={snapshot.is_active}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="탈퇴한 사용자입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    if not snapshot.is_active:
+        if settings.DEBUG:
+            logger.warning(f"User exists but: deleted_at={snapshot.deleted_at}, is_active={snapshot.is_active}")
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="비활성화된 사용자입니다.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    # 세션에 연결된 User (변경이 필요한 엔드포인트도 그대로 수정 후 커밋 가능)
+    user = auth_cache.attach(db, snapshot)
     
     if settings.DEBUG:
-        logger.info(f"User authenticated successfully: user_id={user.user_id}, email={user.email}")
+        logger.info(f"User authenticated successfully: user_id={user.user_id}")
     return user
 
 
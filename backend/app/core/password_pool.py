@@ -0,0 +1,86 @@
+"""
+비밀번호 해싱/검증 전용 워커 풀
+- bcrypt(cost 12)는 한 번에 수백 ms CPU를 사용하므로 async 엔드포인트에서 직접 호출하면
+  그동안 같은 워커의 모든 요청이 멈춤 -> 전용 스레드 풀에서 실행하고 이벤트 루프는 기다리기만 함
+  (bcrypt 라이브러리는 해싱 중 GIL을 해제하므로 스레드로도 병렬 실행됨)
+- 실행 중 + 대기 중 작업 수를 PASSWORD_HASH_MAX_PENDING으로 제한하고, 초과하면 대기열에 쌓지 않고
+  바로 503(Retry-After)으로 거절 (로그인 폭주가 다른 요청의 지연으로 번지지 않도록)
+"""
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+from fastapi import HTTPException, status
+from app.core.config import settings
+from app.core import security
+
+T = TypeVar("T")
+
+_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+_pending = 0
+_stats = {"completed": 0, "failed": 0, "rejected": 0}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                thread_name_prefix="password-hash"
+            )
+        return _executor
+
+
+async def _run(func: Callable[..., T], *args) -> T:
+    """풀에서 실행 (포화 상태면 503)"""
+    global _pending
+    with _lock:
+        if _pending >= settings.PASSWORD_HASH_MAX_PENDING:
+            _stats["rejected"] += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요.",
+                headers={"Retry-After": "1"},
+            )
+        _pending += 1
+    completed = False
+    try:
+        result = await asyncio.get_running_loop().run_in_executor(_get_executor(), func, *args)
+        completed = True
+        return result
+    finally:
+        with _lock:
+            _pending -= 1
+            _stats["completed" if completed else "failed"] += 1
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """비밀번호 검증 (security.verify_password를 풀에서 실행)"""
+    return await _run(security.verify_password, plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    """비밀번호 해싱 (security.get_password_hash를 풀에서 실행)"""
+    return await _run(security.get_password_hash, password)
+
+
+def get_metrics() -> dict:
+    """현재 실행/대기 중 작업 수와 누적 처리/실패/거절 수"""
+    with _lock:
+        return {
+            "workers": settings.PASSWORD_HASH_WORKERS,
+            "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+            "pending": _pending,
+            **_stats,
+        }
+
+
+def shutdown() -> None:
+    """풀 종료 (앱 종료 시)"""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True)
@@ -6,13 +6,13 @@ import secrets
 import string
 from typing import Optional
 from sqlalchemy.orm import Session
-from app.models.achievement import Achievement
 from app.models.user import User
 
 
 def get_achievement_response(db: Session, achievement_id: Optional[int]):
     """
     Achievement ID로 Achievement 응답 객체를 조회하는 유틸리티 함수
+    - 프로세스 메모리의 칭호 카탈로그 캐시 사용 (app.services.achievement_catalog)
     
     Args:
         db: 데이터베이스 세션
@@ -21,18 +21,8 @@ def get_achievement_response(db: Session, achievement_id: Optional[int]):
     Returns:
         AchievementResponse 객체 또는 None
     """
-    if not achievement_id:
-        return None
-    
-    achievement = db.query(Achievement).filter(
-        Achievement.achievement_id == achievement_id
-    ).first()
-    
-    if achievement:
-        from app.schemas.achievements import AchievementResponse
-        return AchievementResponse.model_validate(achievement)
-    
-    return None
+    from app.services import achievement_catalog
+    return achievement_catalog.get_achievement(db, achievement_id)
 
 
 def generate_unique_code(db: Session, length: int = 12) -> str:
@@ -24,7 +24,7 @@ app.add_middleware(
 )
 
 # 라우터 등록
-from app.routers import auth, users, instruments, user_types, practice, board, groups, achievements, notifications, support, admin
+from app.routers import auth, users, instruments, user_types, practice, board, groups, achievements, notifications, support, admin, leaderboards
 app.include_router(auth.router)
 app.include_router(users.router)
 app.include_router(instruments.router)
@@ -36,6 +36,99 @@ app.include_router(achievements.router)
 app.include_router(notifications.router)
 app.include_router(support.router)
 app.include_router(admin.router)
+app.include_router(leaderboards.router)
+
+
+@app.on_event("startup")
+def start_notification_dispatcher():
+    """알림 outbox 디스패처 스레드 시작"""
+    if not settings.NOTIFICATION_DISPATCHER_ENABLED:
+        return
+    from app.core.database import SessionLocal
+    from app.services import notification_outbox
+
+    notification_outbox.start_dispatcher(
+        SessionLocal,
+        interval=settings.NOTIFICATION_DISPATCH_INTERVAL,
+        batch_size=settings.NOTIFICATION_DISPATCH_BATCH_SIZE
+    )
+
+
+@app.on_event("startup")
+async def start_notification_push():
+    """알림 실시간 푸시 LISTEN 스레드 시작 (워커별)"""
+    if not settings.NOTIFICATION_PUSH_ENABLED:
+        return
+    import asyncio
+    from sqlalchemy import make_url
+    from app.core.database import SessionLocal
+    from app.services import notification_push
+
+    # LISTEN은 세션 단위 상태이므로 pgbouncer(transaction pooling)를 거치지 않는 연결 사용
+    listen_url = make_url(settings.DATABASE_DIRECT_URL or settings.DATABASE_URL)
+    notification_push.hub.start(
+        asyncio.get_running_loop(),
+        listen_url.set(drivername="postgresql").render_as_string(hide_password=False),
+        SessionLocal,
+        queue_size=settings.NOTIFICATION_PUSH_QUEUE_SIZE
+    )
+
+
+@app.on_event("shutdown")
+def stop_notification_push():
+    """알림 실시간 푸시 LISTEN 스레드 종료"""
+    from app.services import notification_push
+
+    notification_push.hub.stop()
+
+
+@app.on_event("shutdown")
+def stop_notification_dispatcher():
+    """알림 outbox 디스패처 스레드 종료"""
+    from app.services import notification_outbox
+
+    notification_outbox.stop_dispatcher()
+
+
+@app.on_event("shutdown")
+def stop_password_pool():
+    """비밀번호 해싱 풀 종료"""
+    from app.core import password_pool
+
+    password_pool.shutdown()
+
+
+@app.on_event("startup")
+def start_view_count_flusher():
+    """게시글 조회수 반영 스레드 시작 (FLUSH_INTERVAL마다 일괄 반영)"""
+    if not settings.VIEW_COUNT_FLUSHER_ENABLED:
+        return
+    from app.core.database import SessionLocal
+    from app.services import view_counter
+
+    view_counter.start_flusher(SessionLocal)
+
+
+@app.on_event("shutdown")
+def flush_pending_view_counts():
+    """종료 시 반영 스레드를 멈추고 메모리에 쌓인 게시글 조회수 반영"""
+    from app.core.database import SessionLocal
+    from app.services import view_counter
+
+    view_counter.stop_flusher()
+    db = SessionLocal()
+    try:
+        view_counter.flush(db)
+    finally:
+        db.close()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    """비동기 엔진 연결 풀 정리"""
+    from app.core.database import async_engine
+
+    await async_engine.dispose()
 
 
 @app.get("/")
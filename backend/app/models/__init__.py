@@ -9,12 +9,14 @@ from app.models.user import User, UserProfile, SocialAccount
 from app.models.instrument import Instrument
 from app.models.user_type import UserType
 from app.models.user_profile import UserProfileInstrument, UserProfileUserType
-from app.models.practice import PracticeSession, RecordingFile
+from app.models.practice import PracticeSession, RecordingFile, PracticeStats, PracticeDailyTotal, PracticeCohortWeekly
 from app.models.group import Group, GroupMember, GroupInvitation
-from app.models.board import Post, Comment, PostLike, CommentLike, PostBookmark, PostReport
+from app.models.board import Post, Comment, PostLike, CommentLike, PostBookmark, PostReport, TagStat
 from app.models.achievement import Achievement, UserAchievement
-from app.models.notification import Notification
+from app.models.notification import Notification, NotificationEvent
 from app.models.support import CustomerSupport
+from app.models.leaderboard import LeaderboardEntry
+from app.models.cache_version import CacheVersion
 
 __all__ = [
     # Base
@@ -33,6 +35,9 @@ __all__ = [
     # Practice models
     "PracticeSession",
     "RecordingFile",
+    "PracticeStats",
+    "PracticeDailyTotal",
+    "PracticeCohortWeekly",
     # Group models
     "Group",
     "GroupMember",
@@ -43,13 +48,19 @@ __all__ = [
     "PostLike",
     "CommentLike",
     "PostBookmark",
+    "TagStat",
     # Achievement models
     "Achievement",
     "UserAchievement",
     # Notification model
     "Notification",
+    "NotificationEvent",
     # Support model
     "CustomerSupport",
     # PostReport model
     "PostReport",
+    # Leaderboard model
+    "LeaderboardEntry",
+    # Cache version model
+    "CacheVersion",
 ]
@@ -16,7 +16,7 @@ class Achievement(Base):
     achievement_id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
     description = Column(String, nullable=True)
-    condition_type = Column(String(50), nullable=True)  # 'practice_time', 'consecutive_days', 'instrument_count'
+    condition_type = Column(String(50), nullable=True)  # 'practice_time', 'consecutive_days', 'instrument_count', 'total_sessions', 'longest_streak', 'practice_days' (app.services.achievement_engine 참고)
     condition_value = Column(Integer, nullable=True)
     icon_url = Column(String(500), nullable=True)
     created_at = Column(TIMESTAMP, server_default=func.now())
@@ -4,9 +4,11 @@
 - Comment: 댓글 정보
 - PostLike: 게시글 좋아요
 - CommentLike: 댓글 좋아요
+- TagStat: 태그별 노출 게시글 수
 """
-from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey, ARRAY, UniqueConstraint, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP, ForeignKey, UniqueConstraint, Boolean, Index, Computed, text
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -20,9 +22,10 @@ class Post(Base):
     title = Column(String(300), nullable=False)
     content = Column(Text, nullable=False)
     category = Column(String(50), default="general", index=True)  # 'tip', 'question', 'free'
-    manual_tags = Column(ARRAY(String), nullable=True)  # 사용자가 직접 추가한 태그
+    manual_tags = Column(ARRAY(String), nullable=True)  # 사용자가 직접 추가한 태그 (PostgreSQL ARRAY: @> 포함 연산자 지원)
     view_count = Column(Integer, default=0)
     like_count = Column(Integer, default=0)
+    comment_count = Column(Integer, default=0, server_default="0", nullable=False)  # 삭제되지 않은 댓글 수 (대댓글 포함, 댓글 작성/삭제 시 갱신)
     report_count = Column(Integer, default=0)  # 신고 누적 횟수
     is_hidden = Column(Boolean, default=False, index=True)  # 신고 누적으로 인한 숨김 처리 여부
     deleted_at = Column(TIMESTAMP, nullable=True, index=True)  # Soft delete
@@ -32,6 +35,16 @@ class Post(Base):
     # updated_at: UTC로 저장 (Python 코드에서 제목/본문 수정 시에만 명시적으로 설정)
     # onupdate 제거: 좋아요 등 다른 필드 변경 시 자동 갱신 방지
     updated_at = Column(TIMESTAMP, nullable=True)  # 제목/본문 수정 시에만 값이 설정됨
+    # 검색용 tsvector (제목 가중치 A, 본문 가중치 B, DB가 제목/본문 변경 시 자동 갱신)
+    # WHERE/ORDER BY에서만 사용하므로 deferred: 게시글 조회 시 SELECT 목록에 포함하지 않음
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(content, '')), 'B')",
+            persisted=True
+        )
+    ))
 
     # 관계 설정
     user = relationship("User", back_populates="posts")
@@ -40,6 +53,23 @@ class Post(Base):
     bookmarks = relationship("PostBookmark", back_populates="post", cascade="all, delete-orphan")
     reports = relationship("PostReport", back_populates="post", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 목록 커서 페이지네이션용 (created_at, post_id) 내림차순 인덱스
+        Index("ix_posts_created_at_post_id", created_at.desc(), post_id.desc()),
+        # 노출 게시글 전용 부분 인덱스 (board._visible_posts_filter 조건과 동일)
+        Index(
+            "ix_posts_visible_created_at",
+            created_at.desc(), post_id.desc(),
+            postgresql_where=text("deleted_at IS NULL AND (is_hidden = false OR is_hidden IS NULL)")
+        ),
+        # 검색 인덱스 (app.services.post_search 참고, 트라이그램 인덱스는 pg_trgm 확장 필요)
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_posts_title_trgm", title, postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_posts_content_trgm", content, postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"}),
+        # 태그 포함 검색 (manual_tags @> ARRAY[tag])
+        Index("ix_posts_manual_tags", manual_tags, postgresql_using="gin"),
+    )
+
 
 class Comment(Base):
     """댓글 정보 테이블"""
@@ -66,6 +96,15 @@ class Comment(Base):
     parent_comment = relationship("Comment", remote_side=[comment_id], backref="replies")
     likes = relationship("CommentLike", back_populates="comment", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 최상위 댓글 커서 페이지네이션용 부분 인덱스 (app.services.comment_tree)
+        Index(
+            "ix_comments_post_roots",
+            post_id, created_at, comment_id,
+            postgresql_where=text("parent_comment_id IS NULL")
+        ),
+    )
+
 
 class PostLike(Base):
     """게시글 좋아요 테이블"""
@@ -144,3 +183,24 @@ class PostReport(Base):
         UniqueConstraint("post_id", "reporter_id", name="uq_post_report_post_reporter"),
     )
 
+
+
+class TagStat(Base):
+    """
+    태그 통계 테이블
+    - post_count: 태그가 붙은 노출 게시글 수 (삭제/숨김 제외, 게시글 작성/수정/삭제/숨김 시 갱신)
+    - last_used_at: 태그가 마지막으로 노출 게시글에 추가된 시간
+    """
+    __tablename__ = "tag_stats"
+
+    tag = Column(String(100), primary_key=True)
+    post_count = Column(Integer, default=0, nullable=False)
+    last_used_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # 자동완성 접두사 검색 (tag LIKE 'prefix%')
+        Index("ix_tag_stats_tag_prefix", tag, postgresql_ops={"tag": "varchar_pattern_ops"}),
+        # 인기/최근 태그 조회
+        Index("ix_tag_stats_post_count", post_count.desc()),
+        Index("ix_tag_stats_last_used_at", last_used_at.desc()),
+    )
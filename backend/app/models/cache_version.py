@@ -0,0 +1,20 @@
+"""
+캐시 버전 모델
+- CacheVersion: 프로세스 메모리 캐시의 무효화 버전 (여러 워커 간 캐시 일관성 유지용)
+"""
+from sqlalchemy import Column, String, BigInteger, TIMESTAMP
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class CacheVersion(Base):
+    """
+    캐시 버전 테이블
+    - name: 캐시 이름 (예: 'achievements')
+    - version: 원본 데이터가 바뀔 때마다 1씩 증가, 각 워커는 주기적으로 비교하여 다르면 캐시를 다시 적재
+    """
+    __tablename__ = "cache_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(BigInteger, default=1, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,32 @@
+"""
+리더보드 관련 모델
+- LeaderboardEntry: 범위(그룹/주요 악기)와 기간(일/주/월/전체)별 사용자 연습 시간 순위표
+"""
+from sqlalchemy import Column, Integer, String, Date, TIMESTAMP, ForeignKey, BigInteger, Index
+from sqlalchemy.sql import func
+from app.core.database import Base
+
+
+class LeaderboardEntry(Base):
+    """
+    리더보드 항목 테이블 (scope_type, scope_id, period_type, period_start, user_id)
+    - scope_type: 'group' (scope_id=group_id) 또는 'instrument' (scope_id=instrument_id, 주요 악기 기준)
+    - period_type: 'day', 'week', 'month', 'all' (period_start는 해당 기간의 시작일, 전체 기간은 1970-01-01)
+    - 세션 종료/삭제 시 증분 갱신되며, 순위는 (범위, 기간, total_seconds DESC) 인덱스로 조회
+    """
+    __tablename__ = "leaderboard_entries"
+
+    scope_type = Column(String(20), primary_key=True)
+    scope_id = Column(Integer, primary_key=True)
+    period_type = Column(String(10), primary_key=True)
+    period_start = Column(Date, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True, index=True)
+    total_seconds = Column(BigInteger, default=0, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index(
+            "ix_leaderboard_entries_ranking",
+            "scope_type", "scope_id", "period_type", "period_start", total_seconds.desc(), "user_id"
+        ),
+    )
@@ -1,9 +1,15 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, TIMESTAMP, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, String, Boolean, Text, TIMESTAMP, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 
 
+# 발신자별 행 대신 (receiver_id, type, post_id) 단위로 묶는 알림 종류 (uq_notifications_unread_group 조건과 동일해야 함)
+AGGREGATED_TYPES = ("like", "comment", "reply")
+MAX_RECENT_SENDERS = 3
+
+
 class Notification(Base):
     """알림 정보 테이블"""
     __tablename__ = "notifications"
@@ -25,11 +31,58 @@ class Notification(Base):
     comment_id = Column(Integer, ForeignKey("comments.comment_id", ondelete="CASCADE"), nullable=True, index=True)
     
     content = Column(Text, nullable=True)  # 알림 내용 요약 (예: 게시글 제목 등)
+    # 묶음 알림 (AGGREGATED_TYPES): 읽지 않은 (receiver_id, type, post_id) 알림이 있으면 새 행 대신 기존 행을 갱신
+    # - sender_id/comment_id/content: 가장 최근 발생 기준
+    # - actor_count: 묶인 발신자 수 ("X님 외 N명")
+    # - recent_sender_ids: 최근 발신자 ID (최신순, 최대 MAX_RECENT_SENDERS명)
+    actor_count = Column(Integer, default=1, server_default="1", nullable=False)
+    recent_sender_ids = Column(ARRAY(Integer), nullable=True)
     is_read = Column(Boolean, default=False, index=True)
-    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)
+    created_at = Column(TIMESTAMP, server_default=func.now(), index=True)  # 묶음 알림은 마지막으로 갱신된 시간
 
     # 관계 설정
     receiver = relationship("User", foreign_keys=[receiver_id], backref="notifications_received")
     sender = relationship("User", foreign_keys=[sender_id], backref="notifications_sent")
     post = relationship("Post")
     comment = relationship("Comment")
+
+    __table_args__ = (
+        # 알림 목록 커서 페이지네이션용 (receiver_id, created_at, notification_id) 인덱스
+        Index("ix_notifications_receiver_created", receiver_id, created_at.desc(), notification_id.desc()),
+        # 묶음 알림 대상 행 (읽지 않은 알림당 하나, ON CONFLICT 대상)
+        Index(
+            "uq_notifications_unread_group",
+            receiver_id, type, post_id,
+            unique=True,
+            postgresql_where=text("is_read = false AND type IN ('like', 'comment', 'reply')")
+        ),
+    )
+
+
+class NotificationEvent(Base):
+    """
+    알림 outbox 이벤트 테이블
+    - 요청 처리 트랜잭션 안에서 간단한 이벤트 한 행만 기록하고,
+      app.services.notification_outbox 디스패처가 일괄로 Notification 행으로 펼침
+    - processed_at이 NULL인 행이 처리 대기 중 (부분 인덱스로 조회)
+    """
+    __tablename__ = "notification_events"
+
+    event_id = Column(BigInteger, primary_key=True)
+    # Event types (app.services.notification_outbox 참고):
+    # 'post_liked': 게시글 좋아요 (payload.like_count: 좋아요 후 개수)
+    # 'comment_created': 댓글/답글 작성
+    # 'post_hidden': 신고 누적으로 숨김 처리
+    event_type = Column(String(50), nullable=False)
+    actor_id = Column(Integer, nullable=True)  # 이벤트를 일으킨 사용자 (시스템 이벤트는 NULL)
+    post_id = Column(Integer, nullable=True)
+    comment_id = Column(Integer, nullable=True)
+    payload = Column(JSONB, nullable=True)
+    created_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
+    processed_at = Column(TIMESTAMP, nullable=True)
+    attempts = Column(Integer, default=0, nullable=False)
+    last_error = Column(Text, nullable=True)
+
+    __table_args__ = (
+        Index("ix_notification_events_pending", "event_id", postgresql_where=text("processed_at IS NULL")),
+    )
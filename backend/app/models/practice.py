@@ -2,8 +2,12 @@
 연습 기록 관련 모델
 - PracticeSession: 연습 세션 정보
 - RecordingFile: 녹음 파일 정보
+- PracticeStats: 사용자별 연습 통계 집계 (롤업)
+- PracticeDailyTotal: 사용자별 일일 연습 합계
+- PracticeCohortWeekly: 같은 악기/특징 조합(코호트)의 주간 연습 집계
 """
 from sqlalchemy import Column, Integer, String, Date, TIMESTAMP, ForeignKey, BigInteger
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
@@ -45,3 +49,53 @@ class RecordingFile(Base):
     # 관계 설정
     session = relationship("PracticeSession", back_populates="recording_files")
 
+
+
+class PracticeStats(Base):
+    """
+    사용자별 연습 통계 롤업 테이블
+    - 세션 종료/삭제 시 같은 트랜잭션 안에서 갱신됨 (app.services.practice_stats)
+    - current_streak은 last_practice_date에서 끝나는 연속 일수 (조회 시 오늘 기준으로 보정)
+    """
+    __tablename__ = "practice_stats"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    total_practice_time = Column(BigInteger, default=0, nullable=False)  # 초(seconds) 단위
+    total_sessions = Column(Integer, default=0, nullable=False)
+    last_practice_date = Column(Date, nullable=True)
+    current_streak = Column(Integer, default=0, nullable=False)
+    longest_streak = Column(Integer, default=0, nullable=False)
+    updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
+
+
+class PracticeDailyTotal(Base):
+    """
+    사용자별 일일 연습 합계 테이블 (user_id, practice_date)
+    - 완료된 세션만 집계하며 세션 종료/삭제 시 같은 트랜잭션 안에서 갱신됨
+    - 달력/주간 통계/연속 일수 계산은 세션 대신 이 테이블을 읽음 (O(세션) -> O(일))
+    """
+    __tablename__ = "practice_daily_totals"
+
+    user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), primary_key=True)
+    practice_date = Column(Date, primary_key=True, index=True)
+    total_seconds = Column(BigInteger, default=0, nullable=False)
+    session_count = Column(Integer, default=0, nullable=False)
+
+
+class PracticeCohortWeekly(Base):
+    """
+    코호트별 주간 연습 집계 테이블 (cohort_key, week_start, week_end)
+    - 같은 코호트 사용자는 같은 주에 같은 결과를 받으므로 주 단위로 한 번 계산하여 재사용
+    - 일별 합계/인원을 그대로 저장하여 조회 시 본인 기록을 빼고 평균을 계산할 수 있음
+    - refreshed_at 기준으로 일정 시간이 지나면 다시 계산 (app.services.practice_cohort)
+    """
+    __tablename__ = "practice_cohort_weekly"
+
+    cohort_key = Column(String(255), primary_key=True)
+    week_start = Column(Date, primary_key=True)
+    week_end = Column(Date, primary_key=True)
+    user_count = Column(Integer, default=0, nullable=False)  # 코호트 사용자 수
+    day_totals = Column(ARRAY(BigInteger), nullable=False)  # 7일치 일별 연습 시간 합계 (초)
+    day_user_counts = Column(ARRAY(Integer), nullable=False)  # 7일치 일별 연습한 사용자 수
+    full_week_users = Column(Integer, default=0, nullable=False)  # 7일 모두 연습한 사용자 수
+    refreshed_at = Column(TIMESTAMP, server_default=func.now(), nullable=False)
@@ -25,6 +25,7 @@ class User(Base):
     membership_tier = Column(String(20), default="FREE", nullable=False)  # 'FREE', 'CUP', 'BOTTLE'
     deleted_at = Column(TIMESTAMP, nullable=True, index=True)  # Soft delete
     last_login_at = Column(TIMESTAMP, nullable=True, index=True)  # 최종 접속일
+    unread_notification_count = Column(Integer, default=0, server_default="0", nullable=False)  # 읽지 않은 알림 수 (app.services.notification_counters)
     selected_achievement_id = Column(Integer, ForeignKey("achievements.achievement_id", ondelete="SET NULL"), nullable=True, index=True)  # 선택한 대표 칭호
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
@@ -53,6 +54,7 @@ class UserProfile(Base):
     user_id = Column(Integer, ForeignKey("users.user_id", ondelete="CASCADE"), unique=True, nullable=False)
     bio = Column(Text, nullable=True)
     hashtags = Column(ARRAY(String), nullable=True)
+    cohort_key = Column(String(255), nullable=True, index=True)  # 주요 악기 + 특징 조합 ("악기ID:특징ID,...", app.services.practice_cohort)
     created_at = Column(TIMESTAMP, server_default=func.now())
     updated_at = Column(TIMESTAMP, server_default=func.now(), onupdate=func.now())
 
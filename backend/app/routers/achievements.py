@@ -4,15 +4,12 @@
 import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import and_
 from typing import List, Optional
-from datetime import date, timedelta
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.achievement import Achievement, UserAchievement
-from app.models.practice import PracticeSession
-from app.models.user_profile import UserProfileInstrument
 from app.schemas.achievements import (
     AchievementResponse,
     UserAchievementResponse,
@@ -22,6 +19,7 @@ from app.schemas.achievements import (
     AchievementUpdate
 )
 from app.schemas.users import MessageResponse
+from app.services import achievement_catalog, achievement_engine, auth_cache
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +53,9 @@ async def create_achievement(
             icon_url=achievement_data.icon_url
         )
         db.add(new_achievement)
+        achievement_catalog.bump_version(db)
         db.commit()
+        achievement_catalog.clear()
         db.refresh(new_achievement)
         
         return AchievementResponse.model_validate(new_achievement)
@@ -91,7 +91,9 @@ async def update_achievement(
         if achievement_data.icon_url is not None:
             achievement.icon_url = achievement_data.icon_url
             
+        achievement_catalog.bump_version(db)
         db.commit()
+        achievement_catalog.clear()
         db.refresh(achievement)
         return AchievementResponse.model_validate(achievement)
     except Exception as e:
@@ -115,7 +117,9 @@ async def delete_achievement(
         
     try:
         db.delete(achievement)
+        achievement_catalog.bump_version(db)
         db.commit()
+        achievement_catalog.clear()
         return MessageResponse(message="칭호가 삭제되었습니다.")
     except Exception as e:
         db.rollback()
@@ -123,6 +127,20 @@ async def delete_achievement(
         raise HTTPException(status_code=500, detail="칭호 삭제에 실패했습니다.")
 
 
+@router.get("/engine/metrics")
+async def get_achievement_engine_metrics(
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    칭호 평가 엔진 소요 시간 통계 조회 (관리자용)
+    - 세션 종료 시 칭호 체크에 드는 단계/평가 함수별 비용 (현재 워커 기준)
+    """
+    return {
+        "condition_types": achievement_engine.get_registered_condition_types(),
+        **achievement_engine.get_engine_metrics()
+    }
+
+
 @router.get("", response_model=AchievementListResponse)
 async def get_all_achievements(
     current_user: User = Depends(get_current_user),
@@ -176,151 +194,21 @@ async def get_my_achievements(
 def check_and_award_achievements(user_id: int, db: Session) -> List[Achievement]:
     """
     사용자의 칭호 획득 조건을 체크하고 자동으로 칭호를 부여하는 함수
+    - 평가 로직은 app.services.achievement_engine 의 평가 함수 레지스트리 사용
     
     Returns:
         새로 획득한 칭호 리스트
     """
-    newly_earned = []
-    
     try:
-        # 1. 연습 시간 관련 칭호 체크
-        total_practice_time = db.query(func.sum(PracticeSession.actual_play_time)).filter(
-            and_(
-                PracticeSession.user_id == user_id,
-                PracticeSession.status == "completed"
-            )
-        ).scalar() or 0
-        
-        # 연습 시간 칭호 체크
-        practice_time_achievements = db.query(Achievement).filter(
-            and_(
-                Achievement.condition_type == "practice_time",
-                Achievement.condition_value <= total_practice_time
-            )
-        ).all()
-        
-        for achievement in practice_time_achievements:
-            # 이미 획득한 칭호인지 확인
-            existing = db.query(UserAchievement).filter(
-                and_(
-                    UserAchievement.user_id == user_id,
-                    UserAchievement.achievement_id == achievement.achievement_id
-                )
-            ).first()
-            
-            if not existing:
-                # 새 칭호 부여
-                user_achievement = UserAchievement(
-                    user_id=user_id,
-                    achievement_id=achievement.achievement_id
-                )
-                db.add(user_achievement)
-                newly_earned.append(achievement)
-                logger.info(f"칭호 획득: user_id={user_id}, achievement_id={achievement.achievement_id}, title={achievement.title}")
-        
-        # 2. 연속 연습 일수 칭호 체크
-        consecutive_days = calculate_consecutive_days(user_id, db)
-        
-        consecutive_achievements = db.query(Achievement).filter(
-            and_(
-                Achievement.condition_type == "consecutive_days",
-                Achievement.condition_value <= consecutive_days
-            )
-        ).all()
-        
-        for achievement in consecutive_achievements:
-            existing = db.query(UserAchievement).filter(
-                and_(
-                    UserAchievement.user_id == user_id,
-                    UserAchievement.achievement_id == achievement.achievement_id
-                )
-            ).first()
-            
-            if not existing:
-                user_achievement = UserAchievement(
-                    user_id=user_id,
-                    achievement_id=achievement.achievement_id
-                )
-                db.add(user_achievement)
-                newly_earned.append(achievement)
-                logger.info(f"칭호 획득: user_id={user_id}, achievement_id={achievement.achievement_id}, title={achievement.title}")
-        
-        # 3. 악기 종류 칭호 체크
-        from app.models.user import UserProfile
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        instrument_count = 0
-        if profile:
-            instrument_count = db.query(UserProfileInstrument).filter(
-                UserProfileInstrument.profile_id == profile.profile_id
-            ).count()
-        
-        instrument_achievements = db.query(Achievement).filter(
-            and_(
-                Achievement.condition_type == "instrument_count",
-                Achievement.condition_value <= instrument_count
-            )
-        ).all()
-        
-        for achievement in instrument_achievements:
-            existing = db.query(UserAchievement).filter(
-                and_(
-                    UserAchievement.user_id == user_id,
-                    UserAchievement.achievement_id == achievement.achievement_id
-                )
-            ).first()
-            
-            if not existing:
-                user_achievement = UserAchievement(
-                    user_id=user_id,
-                    achievement_id=achievement.achievement_id
-                )
-                db.add(user_achievement)
-                newly_earned.append(achievement)
-                logger.info(f"칭호 획득: user_id={user_id}, achievement_id={achievement.achievement_id}, title={achievement.title}")
-        
-        if newly_earned:
-            db.commit()
-        
-        return newly_earned
-        
+        result = achievement_engine.evaluate_user_achievements(db, user_id)
+        logger.debug(f"칭호 체크 소요 시간: user_id={user_id}, timings={result.timings}")
+        return result.newly_earned
     except Exception as e:
         db.rollback()
         logger.error(f"칭호 체크 실패: user_id={user_id}, error={e}")
         return []
 
 
-def calculate_consecutive_days(user_id: int, db: Session) -> int:
-    """
-    연속 연습 일수 계산
-    """
-    try:
-        # 오늘부터 역순으로 연습한 날짜들을 가져옴
-        today = date.today()
-        consecutive_days = 0
-        current_date = today
-        
-        while True:
-            # 해당 날짜에 연습 기록이 있는지 확인
-            session = db.query(PracticeSession).filter(
-                and_(
-                    PracticeSession.user_id == user_id,
-                    PracticeSession.practice_date == current_date,
-                    PracticeSession.status == "completed"
-                )
-            ).first()
-            
-            if session:
-                consecutive_days += 1
-                current_date -= timedelta(days=1)
-            else:
-                break
-        
-        return consecutive_days
-    except Exception as e:
-        logger.error(f"연속 일수 계산 실패: user_id={user_id}, error={e}")
-        return 0
-
-
 @router.put("/my/select", response_model=MessageResponse)
 async def select_achievement(
     achievement_id: int,
@@ -337,6 +225,7 @@ async def select_achievement(
         if achievement_id is None:
             current_user.selected_achievement_id = None
             db.commit()
+            auth_cache.invalidate(current_user.user_id)
             logger.info(f"칭호 선택 해제: user_id={current_user.user_id}")
             return MessageResponse(message="칭호 선택이 해제되었습니다.")
         
@@ -368,6 +257,7 @@ async def select_achievement(
         # 선택한 칭호 설정
         current_user.selected_achievement_id = achievement_id
         db.commit()
+        auth_cache.invalidate(current_user.user_id)
         db.refresh(current_user)
         
         logger.info(f"칭호 선택: user_id={current_user.user_id}, achievement_id={achievement_id}")
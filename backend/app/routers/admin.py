@@ -1,8 +1,9 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, desc, or_
 
+from app.core import db_pool
 from app.core.database import get_db
 from app.models.user import User, UserProfile
 from app.models.user_profile import UserProfileInstrument, UserProfileUserType
@@ -13,6 +14,7 @@ from app.schemas.users import (
     UserProfileUserTypeResponse
 )
 from app.routers.auth import get_current_user
+from app.services import auth_cache, notification_outbox, notification_push
 from pydantic import BaseModel
 
 router = APIRouter(
@@ -76,6 +78,41 @@ class AdminUserListResponse(BaseModel):
 class UserStatusUpdateRequest(BaseModel):
     is_active: bool
 
+class OutboxMetricsResponse(BaseModel):
+    pending: int
+    lag_seconds: float
+    failed: int
+    dispatcher: Dict[str, Any]
+
+class PushMetricsResponse(BaseModel):
+    running: bool
+    connections: int
+    users: int
+    notifies: int
+    messages: int
+    resyncs: int
+    listen_errors: int
+
+class DatabasePoolMetrics(BaseModel):
+    pgbouncer: bool
+    pool_class: Optional[str]
+    pool_size: int
+    capacity: Optional[int]
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    connects: int
+    waits: int
+    wait_seconds: float
+    timeouts: int
+    saturation_alarms: int
+    checkout_ms: Dict[str, float]
+    checkout_histogram_ms: Dict[str, int]
+
+class DatabasePoolMetricsResponse(BaseModel):
+    pools: Dict[str, DatabasePoolMetrics]
+
 class AdminUpdateUserRequest(BaseModel):
     nickname: Optional[str] = None
     email: Optional[str] = None
@@ -218,6 +255,7 @@ def update_user_detail(
         user.membership_tier = request.membership_tier
 
     db.commit()
+    auth_cache.invalidate(user.user_id)
     db.refresh(user)
 
     # 응답 데이터 구성
@@ -276,6 +314,38 @@ def update_user_status(
 
     user.is_active = status_update.is_active
     db.commit()
+    auth_cache.invalidate(user.user_id)
     db.refresh(user)
     
     return user
+
+
+@router.get("/notifications/outbox", response_model=OutboxMetricsResponse)
+def get_notification_outbox_metrics(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    알림 outbox 처리 지연 지표 (처리 대기 이벤트 수, 가장 오래된 대기 이벤트의 대기 시간, 실패 이벤트 수)
+    """
+    return notification_outbox.get_outbox_metrics(db)
+
+
+@router.get("/notifications/push", response_model=PushMetricsResponse)
+def get_notification_push_metrics(
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    알림 실시간 푸시 지표 (요청을 처리한 워커 기준: 접속 수, 전달/resync 누적 수)
+    """
+    return notification_push.hub.get_metrics()
+
+
+@router.get("/database/pool", response_model=DatabasePoolMetricsResponse)
+def get_database_pool_metrics(
+    current_user: User = Depends(get_current_admin)
+):
+    """
+    DB 연결 풀 지표 (요청을 처리한 워커 기준, 엔진별: 사용 중/오버플로 연결 수, 대기/타임아웃/포화 경보 수, 체크아웃 시간 분포)
+    """
+    return DatabasePoolMetricsResponse(pools=db_pool.get_metrics())
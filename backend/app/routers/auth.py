@@ -8,7 +8,8 @@ from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from datetime import datetime
 from app.core.database import get_db
-from app.core.security import get_password_hash, verify_password, create_access_token
+from app.core.security import create_access_token
+from app.core import password_pool
 from app.core.dependencies import get_current_user
 from app.core.utils import generate_unique_code
 from app.models.user import User, UserProfile
@@ -66,8 +67,8 @@ async def register(
         # 고유 코드 생성
         unique_code = generate_unique_code(db)
         
-        # 비밀번호 해싱
-        password_hash = get_password_hash(request.password)
+        # 비밀번호 해싱 (전용 풀에서 실행, 이벤트 루프 차단 방지)
+        password_hash = await password_pool.hash_password(request.password)
         
         # 사용자 생성
         new_user = User(
@@ -100,6 +101,9 @@ async def register(
             user=UserResponse.model_validate(new_user)
         )
         
+    except HTTPException:
+        # 비밀번호 풀 포화(503) 등은 그대로 전달
+        raise
     except IntegrityError as e:
         db.rollback()
         raise HTTPException(
@@ -141,7 +145,7 @@ async def login(
             )
         
         # 비밀번호 확인
-        if not user.password_hash or not verify_password(request.password, user.password_hash):
+        if not user.password_hash or not await password_pool.verify_password(request.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="이메일 또는 비밀번호가 올바르지 않습니다.",
@@ -5,28 +5,36 @@
 import logging
 from datetime import datetime, timezone
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc, func, text
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, func, tuple_
+from app.core.database import get_async_db, get_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
-from app.models.board import Post, Comment, PostLike, CommentLike, PostBookmark, PostReport
-from app.models.notification import Notification
+from app.models.board import Post, Comment, PostBookmark, PostReport
 from app.models.achievement import Achievement
 from app.core.utils import get_achievement_response
+from app.services import board_counters, comment_tree, notification_outbox, pagination, post_search, reactions, tag_stats, view_counter, viewer_state
 from app.schemas.board import (
     PostCreate,
     PostUpdate,
     PostReportCreate,
     PostResponse,
     PostListResponse,
+    PostSearchResult,
+    PostSearchResponse,
+    TagStatResponse,
+    TagListResponse,
     CommentCreate,
     CommentUpdate,
     CommentResponse,
     CommentListResponse,
     LikeResponse,
     BookmarkResponse,
+    ReactionBatchRequest,
+    ReactionBatchResponse,
+    ReactionResult,
     MessageResponse,
     PostAuthorResponse,
     PostStatusUpdate
@@ -37,13 +45,19 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/board", tags=["게시판"])
 
 
-def _build_post_response(post: Post, db: Session, current_user_id: Optional[int] = None) -> PostResponse:
+def _build_post_response(
+    post: Post,
+    db: Session,
+    current_user_id: Optional[int] = None,
+    state: Optional[viewer_state.PostViewerState] = None
+) -> PostResponse:
     """
     Post 모델을 PostResponse로 변환
     
     Args:
         post: Post 모델 객체
         current_user_id: 현재 사용자 ID (좋아요 여부 확인용)
+        state: 목록 조회 시 페이지 단위로 미리 조회한 조회자 상태 (없으면 이 게시글만 조회)
     
     Returns:
         PostResponse: 게시글 응답 객체
@@ -58,19 +72,12 @@ def _build_post_response(post: Post, db: Session, current_user_id: Optional[int]
         selected_achievement=selected_achievement_data
     )
     
-    is_liked = False
-    is_bookmarked = False
-    is_reported = False
-    if current_user_id:
-        like = next((l for l in post.likes if l.user_id == current_user_id), None)
-        is_liked = like is not None
-        
-        bookmark = next((b for b in post.bookmarks if b.user_id == current_user_id), None)
-        is_bookmarked = bookmark is not None
-
-        # 신고 여부 확인 (PostReport 모델의 reporter_id 필드 사용)
-        report = next((r for r in post.reports if r.reporter_id == current_user_id), None)
-        is_reported = report is not None
+    # 좋아요/북마크/신고 여부 (현재 사용자 행만 조회)
+    if state is None:
+        state = viewer_state.get_post_viewer_state(db, current_user_id, [post.post_id])
+    is_liked = post.post_id in state.liked_post_ids
+    is_bookmarked = post.post_id in state.bookmarked_post_ids
+    is_reported = post.post_id in state.reported_post_ids
     
     # UTC timezone 정보 추가 (naive datetime이면 UTC로 명시)
     created_at_aware = post.created_at
@@ -81,12 +88,6 @@ def _build_post_response(post: Post, db: Session, current_user_id: Optional[int]
     if updated_at_aware and updated_at_aware.tzinfo is None:
         updated_at_aware = updated_at_aware.replace(tzinfo=timezone.utc)
     
-    # 댓글 수 (대댓글 포함, 삭제된 댓글 제외)
-    comment_count = db.query(Comment).filter(
-        Comment.post_id == post.post_id,
-        Comment.deleted_at.is_(None)
-    ).count()
-    
     return PostResponse(
         post_id=post.post_id,
         user_id=post.user_id,
@@ -97,7 +98,7 @@ def _build_post_response(post: Post, db: Session, current_user_id: Optional[int]
         tags=post.manual_tags,  # manual_tags를 tags로 반환
         view_count=post.view_count,
         like_count=post.like_count,
-        comment_count=comment_count,
+        comment_count=post.comment_count or 0,  # 비정규화된 댓글 수 (대댓글 포함, 삭제된 댓글 제외)
         is_liked=is_liked,
         is_bookmarked=is_bookmarked,
         is_reported=is_reported,
@@ -109,7 +110,23 @@ def _build_post_response(post: Post, db: Session, current_user_id: Optional[int]
     )
 
 
-def _build_comment_response(comment: Comment, db: Session, current_user_id: Optional[int] = None) -> CommentResponse:
+def _collect_comment_ids(comments: List[Comment]) -> List[int]:
+    """댓글과 하위 답글 ID 목록 (이미 로드된 replies 기준)"""
+    comment_ids = []
+    stack = list(comments)
+    while stack:
+        comment = stack.pop()
+        comment_ids.append(comment.comment_id)
+        stack.extend(comment.replies or [])
+    return comment_ids
+
+
+def _build_comment_response(
+    comment: Comment,
+    db: Session,
+    current_user_id: Optional[int] = None,
+    liked_comment_ids: Optional[set] = None
+) -> CommentResponse:
     """
     Comment 모델을 CommentResponse로 변환 (답글 포함)
     
@@ -117,6 +134,7 @@ def _build_comment_response(comment: Comment, db: Session, current_user_id: Opti
         comment: Comment 모델 객체
         db: 데이터베이스 세션
         current_user_id: 현재 사용자 ID (좋아요 여부 확인용)
+        liked_comment_ids: 미리 조회한 좋아요한 댓글 ID 집합 (없으면 이 댓글과 답글만 조회)
     
     Returns:
         CommentResponse: 댓글 응답 객체
@@ -132,16 +150,15 @@ def _build_comment_response(comment: Comment, db: Session, current_user_id: Opti
     )
     
     # 좋아요 여부 확인
-    is_liked = False
-    if current_user_id:
-        like = next((l for l in comment.likes if l.user_id == current_user_id), None)
-        is_liked = like is not None
+    if liked_comment_ids is None:
+        liked_comment_ids = viewer_state.get_liked_comment_ids(db, current_user_id, _collect_comment_ids([comment]))
+    is_liked = comment.comment_id in liked_comment_ids
     
     # 답글 목록 (재귀적으로 변환)
     replies = []
     if hasattr(comment, 'replies') and comment.replies:
         replies = [
-            _build_comment_response(reply, db, current_user_id)
+            _build_comment_response(reply, db, current_user_id, liked_comment_ids)
             for reply in sorted(comment.replies, key=lambda x: x.created_at)
         ]
     
@@ -174,90 +191,167 @@ def _build_comment_response(comment: Comment, db: Session, current_user_id: Opti
     )
 
 
+def _add_reaction_notifications(db: Session, result: reactions.ToggleResult, current_user_id: int) -> None:
+    """
+    게시글 좋아요 알림 이벤트 추가 (좋아요가 새로 추가된 경우에만, 커밋하지 않음)
+    - 알림 행 생성(좋아요 30개 도달 시 우수 게시글 알림 포함)은 notification_outbox 디스패처가 처리
+    """
+    if result.kind != reactions.POST_LIKE or not (result.changed and result.is_active):
+        return
+    if result.owner_id == current_user_id:
+        return
+
+    notification_outbox.enqueue(
+        db,
+        notification_outbox.EVENT_POST_LIKED,
+        actor_id=current_user_id,
+        post_id=result.target_id,
+        payload={"like_count": result.count}
+    )
+
+
+def _visible_posts_filter():
+    """목록에 노출되는 게시글 조건 (ix_posts_visible_created_at 부분 인덱스 조건과 동일해야 함)"""
+    return and_(
+        Post.deleted_at.is_(None),
+        or_(Post.is_hidden == False, Post.is_hidden.is_(None))
+    )
+
+
+def _apply_post_filters(query, category: Optional[str], tag: Optional[str], author_id: Optional[int]):
+    """게시글 목록/검색 공통 필터 (카테고리, 태그, 작성자)"""
+    # 카테고리 필터
+    if category:
+        query = query.filter(Post.category == category)
+    
+    # 태그 필터 (manual_tags 배열에 포함된 태그 검색)
+    if tag:
+        # 공백 제거 후 배열 포함 연산자(manual_tags @> ARRAY[tag])로 정확한 태그 매칭
+        # ix_posts_manual_tags GIN 인덱스 사용 (NULL 배열은 자동으로 제외됨)
+        tag_trimmed = tag.strip()
+        if tag_trimmed:
+            query = query.filter(Post.manual_tags.contains([tag_trimmed]))
+    
+    # 작성자 필터
+    if author_id:
+        query = query.filter(Post.user_id == author_id)
+    
+    return query
+
+
+def _paginate_posts(
+    query,
+    db: Session,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    with_total: bool
+):
+    """
+    게시글 목록 페이지네이션 (최신순)
+    - 커서가 없으면 기존 페이지 번호 방식 (OFFSET + 정확한 COUNT)
+    - 커서 방식: (created_at, post_id) < 커서 조건으로 조회, COUNT 없음 (with_total이면 EXPLAIN 추정치)
+    
+    Returns:
+        (게시글 목록, total, next_cursor, has_more)
+    """
+    # 작성자 정보 미리 로드하여 N+1 쿼리 방지 (개수 계산에는 포함하지 않음)
+    ordered = query.options(
+        joinedload(Post.user).joinedload(User.selected_achievement)
+    ).order_by(desc(Post.created_at), desc(Post.post_id))
+    
+    if cursor is None:
+        total = query.count()
+        posts = ordered.offset((page - 1) * page_size).limit(page_size + 1).all()
+        posts, next_cursor, has_more = pagination.next_cursor_for(posts, page_size, "created_at", "post_id")
+        return posts, total, next_cursor, has_more
+    
+    if cursor:
+        try:
+            cursor_created_at, cursor_post_id = pagination.decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 커서입니다."
+            )
+        ordered = ordered.filter(
+            tuple_(Post.created_at, Post.post_id) < tuple_(cursor_created_at, cursor_post_id)
+        )
+    
+    total = pagination.estimate_count(db, query) if with_total else 0
+    posts = ordered.limit(page_size + 1).all()
+    posts, next_cursor, has_more = pagination.next_cursor_for(posts, page_size, "created_at", "post_id")
+    return posts, total, next_cursor, has_more
+
+
 # ========== 게시글 엔드포인트 ==========
 
 @router.get("/posts", response_model=PostListResponse)
 async def get_posts(
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (커서 방식에서는 무시)"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="커서 방식(무한 스크롤): 첫 페이지는 빈 문자열, 이후 next_cursor 값"),
+    with_total: bool = Query(False, description="커서 방식에서 전체 개수 추정치 포함 여부"),
     category: Optional[str] = Query(None, description="카테고리 필터 (tip, question, free, general)"),
     tag: Optional[str] = Query(None, description="태그 필터"),
     search: Optional[str] = Query(None, description="검색어 (제목, 내용)"),
     author_id: Optional[int] = Query(None, description="작성자 ID 필터"),
     bookmarked_only: bool = Query(False, description="이미 내가 북마크한 글만 보기"),
     current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     게시글 목록 조회
     - Soft Delete된 게시글은 제외
-    - 페이지네이션 지원
+    - 페이지네이션 지원 (페이지 번호 방식 또는 커서 방식)
     - 카테고리, 태그, 검색어 필터링 지원
     """
-    # 기본 쿼리: Soft Delete 제외, 숨김 처리된 게시글 제외
-    query = db.query(Post).filter(
-        and_(
-            Post.deleted_at.is_(None),
-            or_(Post.is_hidden == False, Post.is_hidden.is_(None))
+    # 북마크 필터는 로그인 필요
+    if bookmarked_only and not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="북마크 필터를 사용하려면 로그인이 필요합니다."
         )
-    )
     
-    # 카테고리 필터
-    if category:
-        query = query.filter(Post.category == category)
-    
-    # 태그 필터 (manual_tags 배열에 포함된 태그 검색)
-    if tag:
-        # 공백 제거 후 PostgreSQL의 ANY() 연산자를 사용하여 정확한 태그 매칭
-        tag_trimmed = tag.strip()
-        if tag_trimmed:
-            # PostgreSQL의 ANY() 연산자를 사용하여 배열에 값이 포함되어 있는지 확인
-            # NULL 체크 추가하여 NULL 배열에 대한 오류 방지
-            # text()를 사용하여 직접 SQL 작성 (파라미터 바인딩으로 SQL injection 방지)
-            query = query.filter(
-                and_(
-                    Post.manual_tags.isnot(None),
-                    text(":tag = ANY(posts.manual_tags)").bindparams(tag=tag_trimmed)
-                )
-            )
-    
-    # 검색어 필터 (제목 또는 내용)
-    if search:
-        search_pattern = f"%{search}%"
-        query = query.filter(
-            or_(
-                Post.title.ilike(search_pattern),
-                Post.content.ilike(search_pattern)
-            )
-        )
+    current_user_id = current_user.user_id if current_user else None
+    return await db.run_sync(
+        _list_posts, page, page_size, cursor, with_total,
+        category, tag, search, author_id, bookmarked_only, current_user_id
+    )
+
+
+def _list_posts(
+    db: Session,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    with_total: bool,
+    category: Optional[str],
+    tag: Optional[str],
+    search: Optional[str],
+    author_id: Optional[int],
+    bookmarked_only: bool,
+    current_user_id: Optional[int]
+) -> PostListResponse:
+    """게시글 목록 조회 본체 (get_posts에서 AsyncSession.run_sync로 실행)"""
+    # 기본 쿼리: Soft Delete 제외, 숨김 처리된 게시글 제외
+    query = db.query(Post).filter(_visible_posts_filter())
     
-    # 작성자 필터
-    if author_id:
-        query = query.filter(Post.user_id == author_id)
+    # 카테고리/태그/검색어/작성자 필터
+    query = _apply_post_filters(query, category, tag, author_id)
+    if search and search.strip():
+        query = query.filter(post_search.match_condition(search))
         
     # 북마크 필터
     if bookmarked_only:
-        if not current_user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="북마크 필터를 사용하려면 로그인이 필요합니다."
-            )
-        query = query.filter(Post.bookmarks.any(PostBookmark.user_id == current_user.user_id))
-    
-    # 전체 개수
-    total = query.count()
+        query = query.filter(Post.bookmarks.any(PostBookmark.user_id == current_user_id))
     
-    # 정렬 및 페이지네이션 (관계 데이터 미리 로드하여 N+1 쿼리 방지)
-    posts = query.options(
-        joinedload(Post.user).joinedload(User.selected_achievement),
-        joinedload(Post.likes),
-        joinedload(Post.bookmarks),
-        joinedload(Post.reports)
-    ).order_by(desc(Post.created_at)).offset((page - 1) * page_size).limit(page_size).all()
+    # 정렬 및 페이지네이션
+    posts, total, next_cursor, has_more = _paginate_posts(query, db, page, page_size, cursor, with_total)
     
     # 응답 변환
-    current_user_id = current_user.user_id if current_user else None
-    post_responses = [_build_post_response(post, db, current_user_id) for post in posts]
+    state = viewer_state.get_post_viewer_state(db, current_user_id, [post.post_id for post in posts])
+    post_responses = [_build_post_response(post, db, current_user_id, state) for post in posts]
     
     total_pages = (total + page_size - 1) // page_size
     
@@ -266,7 +360,69 @@ async def get_posts(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        total_is_estimate=cursor is not None
+    )
+
+
+@router.get("/posts/search", response_model=PostSearchResponse)
+async def search_posts(
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (따옴표 구문, -제외 지원)"),
+    page: int = Query(1, ge=1, description="페이지 번호"),
+    page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    category: Optional[str] = Query(None, description="카테고리 필터 (tip, question, free, general)"),
+    tag: Optional[str] = Query(None, description="태그 필터"),
+    author_id: Optional[int] = Query(None, description="작성자 ID 필터"),
+    current_user: Optional[User] = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    게시글 검색 (관련도순)
+    - 제목/본문 어절 일치(tsvector) 또는 부분 문자열 일치(pg_trgm), 모두 GIN 인덱스 사용
+    - 카테고리/태그/작성자 필터는 같은 쿼리 안에서 적용
+    - 결과마다 관련도 점수와 하이라이트 스니펫(<mark>, HTML 이스케이프됨) 포함
+    """
+    q = q.strip()
+    if not q:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="검색어를 입력해주세요."
+        )
+    
+    query = _apply_post_filters(
+        db.query(Post).filter(_visible_posts_filter()),
+        category, tag, author_id
+    ).filter(post_search.match_condition(q))
+    
+    total = query.count()
+    rank = post_search.rank_expression(q).label("rank")
+    rows = query.add_columns(rank).options(
+        joinedload(Post.user).joinedload(User.selected_achievement)
+    ).order_by(
+        desc(rank), desc(Post.created_at), desc(Post.post_id)
+    ).offset((page - 1) * page_size).limit(page_size).all()
+    
+    current_user_id = current_user.user_id if current_user else None
+    state = viewer_state.get_post_viewer_state(db, current_user_id, [post.post_id for post, _ in rows])
+    terms = post_search.search_terms(q)
+    results = [
+        PostSearchResult(
+            **_build_post_response(post, db, current_user_id, state).model_dump(),
+            rank=float(post_rank or 0),
+            snippet=post_search.build_snippet(post.content, terms)
+        )
+        for post, post_rank in rows
+    ]
+    
+    return PostSearchResponse(
+        posts=results,
+        total=total,
+        page=page,
+        page_size=page_size,
+        total_pages=(total + page_size - 1) // page_size,
+        query=q
     )
 
 
@@ -286,7 +442,7 @@ async def create_post(
         title=post_data.title,
         content=post_data.content,
         category=post_data.category or "general",
-        manual_tags=post_data.manual_tags if post_data.manual_tags else None,
+        manual_tags=tag_stats.clean_tags(post_data.manual_tags),
         view_count=0,
         like_count=0,
         created_at=datetime.now(timezone.utc),  # UTC timezone을 명시한 aware datetime
@@ -294,13 +450,13 @@ async def create_post(
     )
     
     db.add(new_post)
+    tag_stats.apply_tag_change(db, set(), tag_stats.visible_tags(new_post))
     db.commit()
     db.refresh(new_post)
     
     # 관계 데이터 미리 로드하여 N+1 쿼리 방지 (refresh 후 다시 조회)
     post_with_relations = db.query(Post).options(
-        joinedload(Post.user).joinedload(User.selected_achievement),
-        joinedload(Post.likes)
+        joinedload(Post.user).joinedload(User.selected_achievement)
     ).filter(Post.post_id == new_post.post_id).first()
     
     logger.info(f"게시글 작성 완료: post_id={new_post.post_id}, user_id={current_user.user_id}")
@@ -311,20 +467,25 @@ async def create_post(
 @router.get("/posts/{post_id}", response_model=PostResponse)
 async def get_post(
     post_id: int,
+    request: Request,
     current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     게시글 상세 조회
-    - 조회수 증가
+    - 조회수 증가 (메모리에 모아 일괄 반영, 같은 조회자의 재조회는 일정 시간 동안 세지 않음)
     - Soft Delete된 게시글은 404 반환
     """
+    current_user_id = current_user.user_id if current_user else None
+    client_host = request.client.host if request.client else None
+    return await db.run_sync(_get_post_detail, post_id, current_user_id, client_host)
+
+
+def _get_post_detail(db: Session, post_id: int, current_user_id: Optional[int], client_host: Optional[str]) -> PostResponse:
+    """게시글 상세 조회 본체 (get_post에서 AsyncSession.run_sync로 실행)"""
     # 관계 데이터 미리 로드하여 N+1 쿼리 방지
     post = db.query(Post).options(
-        joinedload(Post.user).joinedload(User.selected_achievement),
-        joinedload(Post.likes),
-        joinedload(Post.bookmarks),
-        joinedload(Post.reports)
+        joinedload(Post.user).joinedload(User.selected_achievement)
     ).filter(
         and_(
             Post.post_id == post_id,
@@ -339,13 +500,12 @@ async def get_post(
             detail="게시글을 찾을 수 없습니다."
         )
     
-    # 조회수 증가
-    post.view_count += 1
-    db.commit()
-    db.refresh(post)
+    # 조회수 증가 (app.services.view_counter, DB에는 주기적으로 일괄 반영)
+    view_counter.record_view(post_id, view_counter.viewer_key(current_user_id, client_host))
     
-    current_user_id = current_user.user_id if current_user else None
-    return _build_post_response(post, db, current_user_id)
+    response = _build_post_response(post, db, current_user_id)
+    response.view_count = (post.view_count or 0) + view_counter.pending_views(post_id)
+    return response
 
 
 @router.put("/posts/{post_id}", response_model=PostResponse)
@@ -362,10 +522,7 @@ async def update_post(
     """
     # 관계 데이터 미리 로드하여 N+1 쿼리 방지
     post = db.query(Post).options(
-        joinedload(Post.user).joinedload(User.selected_achievement),
-        joinedload(Post.likes),
-        joinedload(Post.bookmarks),
-        joinedload(Post.reports)
+        joinedload(Post.user).joinedload(User.selected_achievement)
     ).filter(
         and_(
             Post.post_id == post_id,
@@ -386,6 +543,8 @@ async def update_post(
             detail="게시글을 수정할 권한이 없습니다."
         )
     
+    tags_before = tag_stats.visible_tags(post)
+    
     # 제목 또는 본문이 실제로 변경되었는지 확인
     title_changed = False
     content_changed = False
@@ -402,7 +561,8 @@ async def update_post(
     if post_data.category is not None:
         post.category = post_data.category
     if post_data.manual_tags is not None:
-        post.manual_tags = post_data.manual_tags if post_data.manual_tags else None
+        post.manual_tags = tag_stats.clean_tags(post_data.manual_tags)
+        tag_stats.apply_tag_change(db, tags_before, tag_stats.visible_tags(post))
     
     # 제목 또는 본문이 실제로 변경된 경우에만 updated_at 갱신
     if title_changed or content_changed:
@@ -448,7 +608,9 @@ async def delete_post(
         )
     
     # Soft Delete
+    tags_before = tag_stats.visible_tags(post)
     post.deleted_at = datetime.now(timezone.utc)
+    tag_stats.apply_tag_change(db, tags_before, set())
     db.commit()
     
     logger.info(f"게시글 삭제 완료: post_id={post_id}, user_id={current_user.user_id}")
@@ -465,78 +627,22 @@ async def toggle_post_like(
     """
     게시글 좋아요 토글
     - 이미 좋아요를 누른 경우 취소, 안 누른 경우 추가
+    - 좋아요 추가/취소와 like_count 갱신은 SQL 한 번으로 원자적으로 처리 (app.services.reactions)
     - 좋아요는 updated_at을 변경하지 않음 (제목/본문 수정 시에만 updated_at 변경)
     """
-    post = db.query(Post).filter(
-        and_(
-            Post.post_id == post_id,
-            Post.deleted_at.is_(None)
-        )
-    ).first()
-    
-    if not post:
+    result = reactions.toggle(db, reactions.POST_LIKE, post_id, current_user.user_id)
+    if not result.found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다."
         )
     
-    # 기존 좋아요 확인
-    existing_like = db.query(PostLike).filter(
-        and_(
-            PostLike.post_id == post_id,
-            PostLike.user_id == current_user.user_id
-        )
-    ).first()
-    
-    if existing_like:
-        # 좋아요 취소
-        db.delete(existing_like)
-        post.like_count = max(0, post.like_count - 1)
-        is_liked = False
-    else:
-        # 좋아요 추가
-        new_like = PostLike(
-            post_id=post_id,
-            user_id=current_user.user_id
-        )
-        db.add(new_like)
-        post.like_count += 1
-        is_liked = True
-    
-    # onupdate가 제거되었으므로 updated_at은 자동으로 변경되지 않음
+    _add_reaction_notifications(db, result, current_user.user_id)
     db.commit()
-    db.refresh(post)
-
-    # 알림 생성 (좋아요 추가 시에만)
-    if is_liked and post.user_id != current_user.user_id:
-        # 게시글 제목 요약 (최대 50자)
-        post_title = (post.title[:50] + '...') if len(post.title) > 50 else post.title
-        
-        # 좋아요 알림
-        new_notification = Notification(
-            receiver_id=post.user_id,
-            sender_id=current_user.user_id,
-            type="like",
-            post_id=post.post_id,
-            content=post_title
-        )
-        db.add(new_notification)
-
-        # 우수 게시글 알림 (좋아요 30개 도달 시)
-        if post.like_count == 30:
-            excellent_notification = Notification(
-                receiver_id=post.user_id,
-                type="excellent_post",
-                post_id=post.post_id,
-                content=post_title
-            )
-            db.add(excellent_notification)
-        
-        db.commit()
     
     return LikeResponse(
-        is_liked=is_liked,
-        like_count=post.like_count
+        is_liked=result.is_active,
+        like_count=result.count
     )
 
 
@@ -548,44 +654,45 @@ async def toggle_post_bookmark(
 ):
     """
     게시글 북마크 토글
+    - 북마크 추가/취소는 SQL 한 번으로 처리 (app.services.reactions)
     """
-    post = db.query(Post).filter(
-        and_(
-            Post.post_id == post_id,
-            Post.deleted_at.is_(None)
-        )
-    ).first()
-    
-    if not post:
+    result = reactions.toggle(db, reactions.POST_BOOKMARK, post_id, current_user.user_id)
+    if not result.found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다."
         )
     
-    # 기존 북마크 확인
-    existing_bookmark = db.query(PostBookmark).filter(
-        and_(
-            PostBookmark.post_id == post_id,
-            PostBookmark.user_id == current_user.user_id
-        )
-    ).first()
-    
-    if existing_bookmark:
-        # 북마크 취소
-        db.delete(existing_bookmark)
-        is_bookmarked = False
-    else:
-        # 북마크 추가
-        new_bookmark = PostBookmark(
-            post_id=post_id,
-            user_id=current_user.user_id
-        )
-        db.add(new_bookmark)
-        is_bookmarked = True
+    db.commit()
     
+    return BookmarkResponse(is_bookmarked=result.is_active)
+
+
+@router.post("/reactions/batch", response_model=ReactionBatchResponse)
+async def toggle_reactions_batch(
+    batch: ReactionBatchRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    좋아요/북마크 여러 건 토글
+    - 요청 순서대로 적용하고 한 번에 커밋 (같은 대상을 두 번 보내면 두 번 토글됨)
+    - 대상이 없거나 삭제된 항목은 found=false로 반환하고 나머지는 그대로 적용
+    """
+    results = []
+    for action in batch.actions:
+        result = reactions.toggle(db, action.kind, action.target_id, current_user.user_id)
+        _add_reaction_notifications(db, result, current_user.user_id)
+        results.append(ReactionResult(
+            kind=result.kind,
+            target_id=result.target_id,
+            found=result.found,
+            is_active=result.is_active,
+            count=result.count
+        ))
     db.commit()
     
-    return BookmarkResponse(is_bookmarked=is_bookmarked)
+    return ReactionBatchResponse(results=results)
 
 
 @router.post("/posts/{post_id}/report", response_model=MessageResponse)
@@ -649,36 +756,71 @@ async def report_post(
     
     # 5건 이상 시 자동 숨김 처리
     if post.report_count >= 5 and not post.is_hidden:
+        tags_before = tag_stats.visible_tags(post)
         post.is_hidden = True
+        tag_stats.apply_tag_change(db, tags_before, set())
         
-        # 작성자에게 알림 발송
-        post_title = (post.title[:50] + '...') if len(post.title) > 50 else post.title
-        notification = Notification(
-            receiver_id=post.user_id,
-            type="report_hidden",
-            post_id=post.post_id,
-            content=post_title
-        )
-        db.add(notification)
+        # 작성자에게 알림 발송 (notification_outbox 디스패처가 처리)
+        notification_outbox.enqueue(db, notification_outbox.EVENT_POST_HIDDEN, post_id=post.post_id)
         
     db.commit()
     
     return MessageResponse(message="신고가 정상적으로 접수되었습니다.")
 
 
+# ========== 태그 엔드포인트 ==========
+
+@router.get("/tags/autocomplete", response_model=TagListResponse)
+async def autocomplete_tags(
+    prefix: str = Query(..., min_length=1, max_length=100, description="태그 접두사"),
+    limit: int = Query(10, ge=1, le=50, description="최대 개수"),
+    db: Session = Depends(get_db)
+):
+    """
+    태그 자동완성
+    - 접두사로 시작하는 태그를 노출 게시글 수 많은 순으로 반환 (tag_stats 인덱스 조회)
+    """
+    tags = tag_stats.autocomplete(db, prefix, limit)
+    return TagListResponse(tags=[TagStatResponse.model_validate(tag) for tag in tags])
+
+
+@router.get("/tags/trending", response_model=TagListResponse)
+async def get_trending_tags(
+    days: int = Query(tag_stats.TRENDING_DAYS, ge=1, le=90, description="최근 사용 기간 (일)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 개수"),
+    db: Session = Depends(get_db)
+):
+    """
+    인기 태그
+    - 최근 days일 안에 사용된 태그를 노출 게시글 수 많은 순으로 반환
+    """
+    tags = tag_stats.trending(db, days, limit)
+    return TagListResponse(tags=[TagStatResponse.model_validate(tag) for tag in tags])
+
+
 # ========== 댓글 엔드포인트 ==========
 
 @router.get("/posts/{post_id}/comments", response_model=CommentListResponse)
 async def get_comments(
     post_id: int,
+    cursor: Optional[str] = Query(None, description="커서 방식: 첫 페이지는 빈 문자열, 이후 next_cursor 값 (없으면 전체 댓글)"),
+    page_size: int = Query(50, ge=1, le=200, description="커서 방식의 최상위 댓글 페이지 크기"),
     current_user: Optional[User] = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     게시글의 댓글 목록 조회
-    - 부모 댓글만 반환 (답글은 replies에 포함)
+    - 부모 댓글만 반환 (답글은 깊이와 상관없이 replies에 포함)
+    - 댓글 트리는 재귀 CTE 한 번으로 조회 (app.services.comment_tree)
+    - cursor를 주면 최상위 댓글을 작성순으로 page_size개씩 (각각의 답글 전체 포함)
     - Soft Delete된 게시글의 댓글은 조회 불가
     """
+    current_user_id = current_user.user_id if current_user else None
+    return await db.run_sync(_list_comments, post_id, cursor, page_size, current_user_id)
+
+
+def _list_comments(db: Session, post_id: int, cursor: Optional[str], page_size: int, current_user_id: Optional[int]) -> CommentListResponse:
+    """댓글 목록 조회 본체 (get_comments에서 AsyncSession.run_sync로 실행)"""
     # 게시글 존재 및 Soft Delete 확인
     post = db.query(Post).filter(
         and_(
@@ -693,27 +835,35 @@ async def get_comments(
             detail="게시글을 찾을 수 없습니다."
         )
     
-    # 부모 댓글만 조회 (parent_comment_id가 NULL인 댓글)
     # 삭제된 댓글도 포함하여 "삭제된 댓글입니다" 메시지를 표시하기 위해 필터링하지 않음
-    # 관계 데이터 미리 로드하여 N+1 쿼리 방지
-    comments = db.query(Comment).options(
-        joinedload(Comment.user).joinedload(User.selected_achievement),
-        joinedload(Comment.likes),
-        joinedload(Comment.replies).joinedload(Comment.user).joinedload(User.selected_achievement),
-        joinedload(Comment.replies).joinedload(Comment.likes)
-    ).filter(
-        and_(
-            Comment.post_id == post_id,
-            Comment.parent_comment_id.is_(None)
-        )
-    ).order_by(Comment.created_at).all()
+    next_cursor = None
+    has_more = False
+    if cursor is None:
+        comments = comment_tree.load_comment_tree(db, post_id)
+    else:
+        after = None
+        if cursor:
+            try:
+                after = pagination.decode_cursor(cursor)
+            except ValueError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="잘못된 커서입니다."
+                )
+        root_ids, next_cursor, has_more = comment_tree.get_root_page(db, post_id, after, page_size)
+        comments = comment_tree.load_comment_tree(db, post_id, root_ids)
     
-    current_user_id = current_user.user_id if current_user else None
-    comment_responses = [_build_comment_response(comment, db, current_user_id) for comment in comments]
+    liked_comment_ids = viewer_state.get_liked_comment_ids(db, current_user_id, _collect_comment_ids(comments))
+    comment_responses = [
+        _build_comment_response(comment, db, current_user_id, liked_comment_ids)
+        for comment in comments
+    ]
     
     return CommentListResponse(
         comments=comment_responses,
-        total=len(comment_responses)
+        total=len(comment_responses),
+        next_cursor=next_cursor,
+        has_more=has_more
     )
 
 
@@ -781,51 +931,23 @@ async def create_comment(
     )
     
     db.add(new_comment)
+    db.flush()
+    board_counters.increment_comment_count(db, post_id)
+
+    # 알림 이벤트 (게시글 작성자/원댓글 작성자 알림은 notification_outbox 디스패처가 생성)
+    notification_outbox.enqueue(
+        db,
+        notification_outbox.EVENT_COMMENT_CREATED,
+        actor_id=current_user.user_id,
+        post_id=post_id,
+        comment_id=new_comment.comment_id
+    )
     db.commit()
     db.refresh(new_comment)
-
-    # 알림 생성
-    # 1. 게시글 작성자에게 알림 (본인이 작성한 경우에는 제외)
-    # 2. 답글인 경우 원댓글 작성자에게 알림 (본인이 작성한 경우에는 제외)
-    
-    post_title = (post.title[:50] + '...') if len(post.title) > 50 else post.title
-    
-    notifications_to_add = []
-    
-    # 게시글 작성자 알림
-    if post.user_id != current_user.user_id:
-        notifications_to_add.append(Notification(
-            receiver_id=post.user_id,
-            sender_id=current_user.user_id,
-            type="comment",
-            post_id=post.post_id,
-            comment_id=new_comment.comment_id,
-            content=post_title
-        ))
-    
-    # 답글인 경우 원댓글 작성자 알림
-    if comment_data.parent_comment_id:
-        parent_comment = db.query(Comment).filter(Comment.comment_id == comment_data.parent_comment_id).first()
-        if parent_comment and parent_comment.user_id != current_user.user_id:
-            # 게시글 작성자와 원댓글 작성자가 다른 경우에만 중복 알림 방지를 위해 체크하거나, 
-            # 사용자 경험에 따라 둘 다 보낼 수도 있음. 여기서는 둘 다 보내는 것으로 함.
-            notifications_to_add.append(Notification(
-                receiver_id=parent_comment.user_id,
-                sender_id=current_user.user_id,
-                type="reply",
-                post_id=post.post_id,
-                comment_id=new_comment.comment_id,
-                content=new_comment.content[:50] # 답글은 부모 댓글 내용을 보여주거나 본인의 내용을 일부 보여줌
-            ))
-
-    if notifications_to_add:
-        db.add_all(notifications_to_add)
-        db.commit()
     
     # 관계 데이터 미리 로드하여 N+1 쿼리 방지 (refresh 후 다시 조회)
     comment_with_relations = db.query(Comment).options(
-        joinedload(Comment.user).joinedload(User.selected_achievement),
-        joinedload(Comment.likes)
+        joinedload(Comment.user).joinedload(User.selected_achievement)
     ).filter(Comment.comment_id == new_comment.comment_id).first()
     
     logger.info(f"댓글 작성 완료: comment_id={new_comment.comment_id}, post_id={post_id}, user_id={current_user.user_id}")
@@ -847,8 +969,7 @@ async def update_comment(
     """
     # 관계 데이터 미리 로드하여 N+1 쿼리 방지
     comment = db.query(Comment).options(
-        joinedload(Comment.user).joinedload(User.selected_achievement),
-        joinedload(Comment.likes)
+        joinedload(Comment.user).joinedload(User.selected_achievement)
     ).filter(
         and_(
             Comment.comment_id == comment_id,
@@ -921,7 +1042,15 @@ async def delete_comment(
     
     # Soft Delete
     # 하위 댓글(답글)은 삭제하지 않고 유지하여 이력을 보존
-    comment.deleted_at = datetime.now(timezone.utc)
+    # 동시 삭제 요청에도 댓글 수가 한 번만 감소하도록 deleted_at IS NULL 조건부 UPDATE 사용
+    deleted = db.query(Comment).filter(
+        and_(
+            Comment.comment_id == comment_id,
+            Comment.deleted_at.is_(None)
+        )
+    ).update({Comment.deleted_at: datetime.now(timezone.utc)}, synchronize_session=False)
+    if deleted:
+        board_counters.decrement_comment_count(db, comment.post_id)
     db.commit()
     
     logger.info(f"댓글 삭제 완료: comment_id={comment_id}, user_id={current_user.user_id}")
@@ -939,51 +1068,21 @@ async def toggle_comment_like(
     댓글 좋아요 토글
     - 이미 좋아요를 누른 경우 취소, 안 누른 경우 추가
     - 삭제된 댓글은 좋아요 불가
+    - 좋아요 추가/취소와 like_count 갱신은 SQL 한 번으로 원자적으로 처리 (app.services.reactions)
     - 좋아요는 updated_at을 변경하지 않음 (본문 수정 시에만 updated_at 변경)
     """
-    comment = db.query(Comment).filter(
-        and_(
-            Comment.comment_id == comment_id,
-            Comment.deleted_at.is_(None)  # 삭제된 댓글은 좋아요 불가
-        )
-    ).first()
-    
-    if not comment:
+    result = reactions.toggle(db, reactions.COMMENT_LIKE, comment_id, current_user.user_id)
+    if not result.found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="댓글을 찾을 수 없습니다."
         )
     
-    # 기존 좋아요 확인
-    existing_like = db.query(CommentLike).filter(
-        and_(
-            CommentLike.comment_id == comment_id,
-            CommentLike.user_id == current_user.user_id
-        )
-    ).first()
-    
-    if existing_like:
-        # 좋아요 취소
-        db.delete(existing_like)
-        comment.like_count = max(0, comment.like_count - 1)
-        is_liked = False
-    else:
-        # 좋아요 추가
-        new_like = CommentLike(
-            comment_id=comment_id,
-            user_id=current_user.user_id
-        )
-        db.add(new_like)
-        comment.like_count += 1
-        is_liked = True
-    
-    # onupdate가 제거되었으므로 updated_at은 자동으로 변경되지 않음
     db.commit()
-    db.refresh(comment)
     
     return LikeResponse(
-        is_liked=is_liked,
-        like_count=comment.like_count
+        is_liked=result.is_active,
+        like_count=result.count
     )
 
 
@@ -1000,8 +1099,10 @@ def get_current_admin(current_user: User = Depends(get_current_user)) -> User:
 
 @router.get("/admin/posts", response_model=PostListResponse)
 async def get_admin_posts(
-    page: int = Query(1, ge=1, description="페이지 번호"),
+    page: int = Query(1, ge=1, description="페이지 번호 (커서 방식에서는 무시)"),
     page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="커서 방식(무한 스크롤): 첫 페이지는 빈 문자열, 이후 next_cursor 값"),
+    with_total: bool = Query(False, description="커서 방식에서 전체 개수 추정치 포함 여부"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     search: Optional[str] = Query(None, description="검색어"),
     status_filter: Optional[str] = Query(None, description="상태 필터 (active, hidden, deleted)"),
@@ -1027,26 +1128,18 @@ async def get_admin_posts(
         query = query.filter(Post.category == category)
     
     # 검색어 필터
-    if search:
-        search_pattern = f"%{search}%"
+    if search and search.strip():
         query = query.filter(
             or_(
-                Post.title.ilike(search_pattern),
-                Post.content.ilike(search_pattern),
-                Post.user.has(User.nickname.ilike(search_pattern))
+                post_search.match_condition(search),
+                Post.user.has(User.nickname.ilike(f"%{search.strip()}%"))
             )
         )
     
-    total = query.count()
-    
-    posts = query.options(
-        joinedload(Post.user).joinedload(User.selected_achievement),
-        joinedload(Post.likes),
-        joinedload(Post.bookmarks),
-        joinedload(Post.reports)
-    ).order_by(desc(Post.created_at)).offset((page - 1) * page_size).limit(page_size).all()
+    posts, total, next_cursor, has_more = _paginate_posts(query, db, page, page_size, cursor, with_total)
     
-    post_responses = [_build_post_response(post, db, current_user.user_id) for post in posts]
+    state = viewer_state.get_post_viewer_state(db, current_user.user_id, [post.post_id for post in posts])
+    post_responses = [_build_post_response(post, db, current_user.user_id, state) for post in posts]
     
     total_pages = (total + page_size - 1) // page_size
     
@@ -1055,7 +1148,10 @@ async def get_admin_posts(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=total_pages
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+        has_more=has_more,
+        total_is_estimate=cursor is not None
     )
 
 
@@ -1073,6 +1169,8 @@ async def update_post_status_admin(
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
     
+    tags_before = tag_stats.visible_tags(post)
+    
     if status_update.is_hidden is not None:
         post.is_hidden = status_update.is_hidden
         
@@ -1081,7 +1179,8 @@ async def update_post_status_admin(
             post.deleted_at = datetime.now(timezone.utc)
         else:
             post.deleted_at = None
-            
+    
+    tag_stats.apply_tag_change(db, tags_before, tag_stats.visible_tags(post))
     db.commit()
     db.refresh(post)
     
@@ -1100,8 +1199,10 @@ async def delete_post_admin(
     post = db.query(Post).filter(Post.post_id == post_id).first()
     if not post:
         raise HTTPException(status_code=404, detail="게시글을 찾을 수 없습니다.")
-        
+    
+    tags_before = tag_stats.visible_tags(post)
     post.deleted_at = datetime.now(timezone.utc)
+    tag_stats.apply_tag_change(db, tags_before, set())
     db.commit()
     
     return MessageResponse(message="게시글이 삭제되었습니다.")
@@ -2,19 +2,21 @@
 그룹 API 라우터
 그룹 생성, 조회, 가입, 탈퇴, 멤버 관리 기능 제공
 """
+import calendar
 import logging
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc, func, case
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, or_, desc, func, case, select
+from app.core.database import get_async_db, get_db
 from app.core.dependencies import get_current_user
 from app.core.utils import get_achievement_response
 from app.models.user import User
 from app.models.group import Group, GroupMember, GroupInvitation
-from app.models.achievement import Achievement
-from app.models.practice import PracticeSession
+from app.models.practice import PracticeStats, PracticeDailyTotal
+from app.services import practice_daily, practice_stats, streaks, leaderboard
 from datetime import date, timedelta
 from app.schemas.groups import (
     GroupCreate,
@@ -248,6 +250,8 @@ async def create_group(
             role="owner"
         )
         db.add(owner_member)
+        db.flush()
+        leaderboard.add_group_member(db, new_group.group_id, current_user.user_id)
         db.commit()
         db.refresh(new_group)
         
@@ -397,6 +401,8 @@ async def accept_group_invitation(
             role='member'
         )
         db.add(new_member)
+        db.flush()
+        leaderboard.add_group_member(db, group.group_id, current_user.user_id)
         
         # 초대 상태 업데이트
         invitation.status = 'accepted'
@@ -596,6 +602,8 @@ async def join_group(
             role="member"
         )
         db.add(new_member)
+        db.flush()
+        leaderboard.add_group_member(db, group_id, current_user.user_id)
         db.commit()
         
         logger.info(f"그룹 가입 완료: group_id={group_id}, user_id={current_user.user_id}")
@@ -656,6 +664,7 @@ async def leave_group(
         
         # 그룹 탈퇴
         db.delete(member)
+        leaderboard.remove_group_member(db, group_id, current_user.user_id)
         db.commit()
         
         logger.info(f"그룹 탈퇴 완료: group_id={group_id}, user_id={current_user.user_id}")
@@ -858,6 +867,7 @@ async def delete_group(
         
         # 그룹 삭제 (CASCADE로 멤버도 함께 삭제됨)
         db.delete(group)
+        leaderboard.remove_group(db, group_id)
         db.commit()
         
         logger.info(f"그룹 삭제 완료: group_id={group_id}")
@@ -906,25 +916,9 @@ def _build_group_invitation_response(invitation: GroupInvitation, db: Session) -
         is_public=invitation.group.is_public
     )
     
-    # 초대자 선택한 칭호 조회
-    inviter_selected_achievement = None
-    if invitation.inviter.selected_achievement_id:
-        inviter_achievement = db.query(Achievement).filter(
-            Achievement.achievement_id == invitation.inviter.selected_achievement_id
-        ).first()
-        if inviter_achievement:
-            from app.schemas.achievements import AchievementResponse
-            inviter_selected_achievement = AchievementResponse.model_validate(inviter_achievement)
-    
-    # 초대받은 사용자 선택한 칭호 조회
-    invitee_selected_achievement = None
-    if invitation.invitee.selected_achievement_id:
-        invitee_achievement = db.query(Achievement).filter(
-            Achievement.achievement_id == invitation.invitee.selected_achievement_id
-        ).first()
-        if invitee_achievement:
-            from app.schemas.achievements import AchievementResponse
-            invitee_selected_achievement = AchievementResponse.model_validate(invitee_achievement)
+    # 초대자/초대받은 사용자 선택한 칭호 (칭호 카탈로그 캐시)
+    inviter_selected_achievement = get_achievement_response(db, invitation.inviter.selected_achievement_id)
+    invitee_selected_achievement = get_achievement_response(db, invitation.invitee.selected_achievement_id)
     
     # 초대자 정보
     inviter = GroupInvitationInviterResponse(
@@ -1086,100 +1080,133 @@ async def create_group_invitation(
 
 # ========== 그룹 통계 API ==========
 
-def _calculate_member_statistics(user_id: int, db: Session) -> GroupMemberStatisticsResponse:
+def _calculate_members_statistics(user_ids: List[int], db: Session) -> Dict[int, GroupMemberStatisticsResponse]:
     """
-    멤버별 연습 통계 계산
+    여러 멤버의 연습 통계를 일괄 계산 (멤버 수와 관계없이 최대 3개 쿼리)
+    - 사용자 정보와 통계 롤업(practice_stats)을 한 번에 조회
+    - 롤업이 아직 없는 사용자만 일일 합계 GROUP BY와 연속 일수 쿼리로 계산
     
     Args:
-        user_id: 사용자 ID
+        user_ids: 사용자 ID 목록
         db: 데이터베이스 세션
     
     Returns:
-        GroupMemberStatisticsResponse: 멤버 통계 정보
+        {user_id: GroupMemberStatisticsResponse} (존재하지 않는 사용자는 제외)
     """
-    from app.models.user import User
-    
-    # 사용자 정보 조회
-    user = db.query(User).filter(User.user_id == user_id).first()
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="사용자를 찾을 수 없습니다."
-        )
-    
-    # 총 연습 시간 및 횟수
-    stats = db.query(
-        func.sum(PracticeSession.actual_play_time).label("total_time"),
-        func.count(PracticeSession.session_id).label("total_sessions"),
-        func.max(PracticeSession.practice_date).label("last_date")
-    ).filter(
-        and_(
-            PracticeSession.user_id == user_id,
-            PracticeSession.status == "completed"
-        )
-    ).first()
+    if not user_ids:
+        return {}
     
-    total_practice_time = int(stats.total_time or 0)
-    total_sessions = int(stats.total_sessions or 0)
-    last_practice_date = stats.last_date
+    rows = db.query(User, PracticeStats).outerjoin(
+        PracticeStats, PracticeStats.user_id == User.user_id
+    ).filter(User.user_id.in_(user_ids)).all()
     
-    # 평균 세션 시간 계산
-    average_session_time = None
-    if total_sessions > 0:
-        average_session_time = total_practice_time / total_sessions
+    # 롤업이 없는 사용자: 일일 합계에서 계산
+    missing_ids = [user.user_id for user, stats in rows if stats is None]
+    fallback_totals = {}
+    fallback_streaks = {}
+    if missing_ids:
+        fallback_totals = {
+            row.user_id: row for row in db.query(
+                PracticeDailyTotal.user_id,
+                func.sum(PracticeDailyTotal.total_seconds).label("total_time"),
+                func.sum(PracticeDailyTotal.session_count).label("total_sessions")
+            ).filter(
+                PracticeDailyTotal.user_id.in_(missing_ids)
+            ).group_by(PracticeDailyTotal.user_id)
+        }
+        fallback_streaks = streaks.get_streaks(db, missing_ids)
     
-    # 연속 연습 일수 계산
-    consecutive_days = 0
-    if last_practice_date:
-        today = date.today()
-        start_check_date = today - timedelta(days=365)
-        
-        practice_dates = db.query(
-            func.distinct(PracticeSession.practice_date).label("practice_date")
-        ).filter(
-            and_(
-                PracticeSession.user_id == user_id,
-                PracticeSession.practice_date >= start_check_date,
-                PracticeSession.practice_date <= today,
-                PracticeSession.status == "completed"
+    today = date.today()
+    result = {}
+    for user, stats in rows:
+        if stats is not None:
+            total_practice_time = int(stats.total_practice_time or 0)
+            total_sessions = int(stats.total_sessions or 0)
+            last_practice_date = stats.last_practice_date
+            consecutive_days = practice_stats.effective_current_streak(stats, today)
+        else:
+            totals = fallback_totals.get(user.user_id)
+            streak = fallback_streaks.get(user.user_id, streaks.StreakInfo())
+            total_practice_time = int(totals.total_time or 0) if totals else 0
+            total_sessions = int(totals.total_sessions or 0) if totals else 0
+            last_practice_date = streak.last_practice_date
+            consecutive_days = streak.consecutive_days(today)
+        
+        # 평균 세션 시간 계산
+        average_session_time = None
+        if total_sessions > 0:
+            average_session_time = total_practice_time / total_sessions
+        
+        result[user.user_id] = GroupMemberStatisticsResponse(
+            user_id=user.user_id,
+            nickname=user.nickname,
+            profile_image_url=user.profile_image_url,
+            total_practice_time=total_practice_time,
+            total_sessions=total_sessions,
+            consecutive_days=consecutive_days,
+            last_practice_date=last_practice_date,
+            average_session_time=average_session_time
+        )
+    return result
+
+
+def _resolve_statistics_period(
+    period: str,
+    start_date: Optional[date],
+    end_date: Optional[date]
+) -> Tuple[Optional[date], Optional[date]]:
+    """
+    통계 기간을 (시작일, 종료일)로 변환 (전체 기간이면 (None, None))
+    """
+    today = date.today()
+    if period == "all":
+        return None, None
+    if period == "week":
+        # 이번 주(월~일)
+        monday = today - timedelta(days=today.weekday())
+        return monday, monday + timedelta(days=6)
+    if period == "month":
+        # 이번 달(1일~말일)
+        first_day = today.replace(day=1)
+        last_day = today.replace(day=calendar.monthrange(today.year, today.month)[1])
+        return first_day, last_day
+    if period == "custom":
+        if not start_date or not end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="기간 지정 시 start_date와 end_date가 필요합니다."
             )
-        ).order_by(desc(PracticeSession.practice_date)).all()
-        
-        practice_date_set = {row.practice_date for row in practice_dates}
-        check_date = today
-        while check_date >= start_check_date:
-            if check_date in practice_date_set:
-                consecutive_days += 1
-                check_date = check_date - timedelta(days=1)
-            else:
-                break
-    
-    return GroupMemberStatisticsResponse(
-        user_id=user.user_id,
-        nickname=user.nickname,
-        profile_image_url=user.profile_image_url,
-        total_practice_time=total_practice_time,
-        total_sessions=total_sessions,
-        consecutive_days=consecutive_days,
-        last_practice_date=last_practice_date,
-        average_session_time=average_session_time
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="start_date는 end_date보다 이후일 수 없습니다."
+            )
+        return start_date, end_date
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="period는 'all', 'week', 'month', 'custom' 중 하나여야 합니다."
     )
 
 
 @router.get("/{group_id}/statistics", response_model=GroupStatisticsResponse)
 async def get_group_statistics(
     group_id: int,
-    period: str = Query("all", description="통계 기간: 'all' (전체 기간) 또는 'week' (이번 주)"),
+    period: str = Query("all", description="통계 기간: 'all' (전체 기간), 'week' (이번 주), 'month' (이번 달), 'custom' (start_date~end_date)"),
+    start_date: Optional[date] = Query(None, description="period='custom'일 때 시작일"),
+    end_date: Optional[date] = Query(None, description="period='custom'일 때 종료일"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     그룹 전체 통계 조회
-    - 그룹 내 전체 연습 통계 및 멤버별 통계 제공
+    - 그룹 합계와 멤버별 순위는 (user_id) GROUP BY 한 번, 주간 그래프는 (날짜) GROUP BY 한 번으로 계산
+    - 기간이 길어져도 쿼리 수는 변하지 않음
     """
     try:
+        period_start, period_end = _resolve_statistics_period(period, start_date, end_date)
+        
         # 그룹 조회
-        group = db.query(Group).filter(Group.group_id == group_id).first()
+        group = await db.get(Group, group_id)
         
         if not group:
             raise HTTPException(
@@ -1188,12 +1215,12 @@ async def get_group_statistics(
             )
         
         # 권한 확인: 공개 그룹이거나 멤버여야 함
-        is_member = db.query(GroupMember).filter(
+        is_member = await db.scalar(select(GroupMember.member_id).where(
             and_(
                 GroupMember.group_id == group_id,
                 GroupMember.user_id == current_user.user_id
             )
-        ).first() is not None
+        ).limit(1)) is not None
         
         if not group.is_public and not is_member:
             raise HTTPException(
@@ -1202,11 +1229,11 @@ async def get_group_statistics(
             )
         
         # 그룹 멤버 목록 조회
-        members = db.query(GroupMember).filter(
+        member_ids = list(await db.scalars(select(GroupMember.user_id).where(
             GroupMember.group_id == group_id
-        ).all()
+        )))
         
-        if not members:
+        if not member_ids:
             return GroupStatisticsResponse(
                 group_id=group_id,
                 total_members=0,
@@ -1215,110 +1242,63 @@ async def get_group_statistics(
                 average_practice_time_per_member=0.0,
                 average_sessions_per_member=0.0,
                 most_active_member=None,
-                weekly_practice_data=[0] * 7
+                weekly_practice_data=[0] * 7,
+                period=period,
+                start_date=period_start,
+                end_date=period_end
             )
         
-        member_ids = [m.user_id for m in members]
-        
-        # 기간 필터 설정
-        monday = None
-        sunday = None
-        if period == "week":
-            # 이번 주(월~일) 범위 설정
-            today = date.today()
-            day_of_week = today.weekday()  # 0(월) ~ 6(일)
-            monday_offset = day_of_week  # 월요일로부터의 오프셋
-            monday = today - timedelta(days=monday_offset)
-            sunday = monday + timedelta(days=6)
-        
-        # 그룹 전체 통계 계산
-        base_filter = and_(
-            PracticeSession.user_id.in_(member_ids),
-            PracticeSession.status == "completed"
-        )
-        if period == "week" and monday and sunday:
-            base_filter = and_(
-                base_filter,
-                PracticeSession.practice_date >= monday,
-                PracticeSession.practice_date <= sunday
+        # 멤버별 기간 합계 (일일 합계 테이블에서 한 번에 집계)
+        member_filter = PracticeDailyTotal.user_id.in_(member_ids)
+        if period_start and period_end:
+            member_filter = and_(
+                member_filter,
+                PracticeDailyTotal.practice_date >= period_start,
+                PracticeDailyTotal.practice_date <= period_end
             )
         
-        group_stats = db.query(
-            func.sum(PracticeSession.actual_play_time).label("total_time"),
-            func.count(PracticeSession.session_id).label("total_sessions")
-        ).filter(base_filter).first()
+        member_totals = (await db.execute(select(
+            PracticeDailyTotal.user_id,
+            func.sum(PracticeDailyTotal.total_seconds).label("total_time"),
+            func.sum(PracticeDailyTotal.session_count).label("total_sessions")
+        ).where(member_filter).group_by(PracticeDailyTotal.user_id))).all()
         
-        total_practice_time = int(group_stats.total_time or 0)
-        total_sessions = int(group_stats.total_sessions or 0)
-        total_members = len(members)
+        total_practice_time = sum(int(row.total_time or 0) for row in member_totals)
+        total_sessions = sum(int(row.total_sessions or 0) for row in member_totals)
+        total_members = len(member_ids)
         
         average_practice_time_per_member = total_practice_time / total_members if total_members > 0 else 0.0
         average_sessions_per_member = total_sessions / total_members if total_members > 0 else 0.0
         
-        # 가장 활발한 멤버 찾기 (기간 필터 적용)
+        # 가장 활발한 멤버 (기간 내 연습 시간 기준)
         most_active_member = None
-        max_practice_time = 0
-        for member in members:
-            # 멤버 통계 계산 시 기간 필터 적용
-            member_base_filter = and_(
-                PracticeSession.user_id == member.user_id,
-                PracticeSession.status == "completed"
-            )
-            if period == "week" and monday and sunday:
-                member_base_filter = and_(
-                    member_base_filter,
-                    PracticeSession.practice_date >= monday,
-                    PracticeSession.practice_date <= sunday
+        top = max(member_totals, key=lambda row: int(row.total_time or 0), default=None)
+        if top is not None and int(top.total_time or 0) > 0:
+            user = await db.get(User, top.user_id)
+            if user:
+                top_total_time = int(top.total_time or 0)
+                top_total_sessions = int(top.total_sessions or 0)
+                most_active_member = GroupMemberStatisticsResponse(
+                    user_id=user.user_id,
+                    nickname=user.nickname,
+                    profile_image_url=user.profile_image_url,
+                    total_practice_time=top_total_time,
+                    total_sessions=top_total_sessions,
+                    consecutive_days=0,  # 기간 통계에서는 연속 일수 계산 생략
+                    last_practice_date=None,
+                    average_session_time=top_total_time / top_total_sessions if top_total_sessions > 0 else None
                 )
-            
-            member_stats_result = db.query(
-                func.sum(PracticeSession.actual_play_time).label("total_time"),
-                func.count(PracticeSession.session_id).label("total_sessions")
-            ).filter(member_base_filter).first()
-            
-            member_total_time = int(member_stats_result.total_time or 0)
-            member_total_sessions = int(member_stats_result.total_sessions or 0)
-            
-            if member_total_time > max_practice_time:
-                max_practice_time = member_total_time
-                # 멤버 정보 가져오기
-                user = db.query(User).filter(User.user_id == member.user_id).first()
-                if user:
-                    # 평균 세션 시간 계산
-                    average_session_time = None
-                    if member_total_sessions > 0:
-                        average_session_time = member_total_time / member_total_sessions
-                    
-                    most_active_member = GroupMemberStatisticsResponse(
-                        user_id=member.user_id,
-                        nickname=user.nickname,
-                        profile_image_url=user.profile_image_url,
-                        total_practice_time=member_total_time,
-                        total_sessions=member_total_sessions,
-                        consecutive_days=0,  # 주간 통계에서는 연속 일수 계산 생략
-                        last_practice_date=None,
-                        average_session_time=average_session_time
-                    )
         
-        # 이번 주(월~일) 일별 총 연습 시간 계산
+        # 이번 주(월~일) 일별 총 연습 시간 계산 (일일 합계 테이블에서 한 번에 조회)
         today = date.today()
-        day_of_week = today.weekday()  # 0(월) ~ 6(일)
-        monday_offset = day_of_week  # 월요일로부터의 오프셋
-        
-        monday = today - timedelta(days=monday_offset)
-        weekly_practice_data = []
-        for i in range(7):  # 월요일부터 일요일까지
-            check_date = monday + timedelta(days=i)
-            day_stats = db.query(
-                func.sum(PracticeSession.actual_play_time).label("total_time")
-            ).filter(
-                and_(
-                    PracticeSession.user_id.in_(member_ids),
-                    PracticeSession.practice_date == check_date,
-                    PracticeSession.status == "completed"
-                )
-            ).first()
-            weekly_practice_data.append(int(day_stats.total_time or 0))
+        monday = today - timedelta(days=today.weekday())
+        daily_totals = await db.run_sync(
+            practice_daily.get_totals_by_date, member_ids, monday, monday + timedelta(days=6)
+        )
+        weekly_practice_data = [
+            daily_totals.get(monday + timedelta(days=i), 0)
+            for i in range(7)  # 월요일부터 일요일까지
+        ]
         
         return GroupStatisticsResponse(
             group_id=group_id,
@@ -1328,7 +1308,10 @@ async def get_group_statistics(
             average_practice_time_per_member=average_practice_time_per_member,
             average_sessions_per_member=average_sessions_per_member,
             most_active_member=most_active_member,
-            weekly_practice_data=weekly_practice_data
+            weekly_practice_data=weekly_practice_data,
+            period=period,
+            start_date=period_start,
+            end_date=period_end
         )
     
     except HTTPException:
@@ -1345,7 +1328,7 @@ async def get_group_statistics(
 async def get_group_member_statistics(
     group_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     그룹 멤버별 통계 조회
@@ -1353,7 +1336,7 @@ async def get_group_member_statistics(
     """
     try:
         # 그룹 조회
-        group = db.query(Group).filter(Group.group_id == group_id).first()
+        group = await db.get(Group, group_id)
         
         if not group:
             raise HTTPException(
@@ -1362,12 +1345,12 @@ async def get_group_member_statistics(
             )
         
         # 권한 확인: 공개 그룹이거나 멤버여야 함
-        is_member = db.query(GroupMember).filter(
+        is_member = await db.scalar(select(GroupMember.member_id).where(
             and_(
                 GroupMember.group_id == group_id,
                 GroupMember.user_id == current_user.user_id
             )
-        ).first() is not None
+        ).limit(1)) is not None
         
         if not group.is_public and not is_member:
             raise HTTPException(
@@ -1376,9 +1359,7 @@ async def get_group_member_statistics(
             )
         
         # 그룹 멤버 목록 조회
-        members = db.query(GroupMember).options(
-            joinedload(GroupMember.user)
-        ).filter(
+        members = (await db.scalars(select(GroupMember).where(
             GroupMember.group_id == group_id
         ).order_by(
             case(
@@ -1387,17 +1368,18 @@ async def get_group_member_statistics(
                 else_=3
             ),
             GroupMember.joined_at
-        ).all()
+        ))).all()
         
-        # 각 멤버의 통계 계산
-        member_statistics = []
-        for member in members:
-            try:
-                stats = _calculate_member_statistics(member.user_id, db)
-                member_statistics.append(stats)
-            except Exception as e:
-                logger.warning(f"멤버 {member.user_id} 통계 계산 중 오류: {str(e)}")
-                continue
+        # 전체 멤버의 통계를 일괄 계산 (동기 집계 함수를 비동기 세션 연결에서 실행)
+        member_user_ids = [m.user_id for m in members]
+        statistics_by_user = await db.run_sync(
+            lambda session: _calculate_members_statistics(member_user_ids, session)
+        )
+        member_statistics = [
+            statistics_by_user[member.user_id]
+            for member in members
+            if member.user_id in statistics_by_user
+        ]
         
         # 총 연습 시간 기준으로 정렬 (내림차순)
         member_statistics.sort(key=lambda x: x.total_practice_time, reverse=True)
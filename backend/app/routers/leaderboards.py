@@ -0,0 +1,153 @@
+"""
+리더보드 API 라우터
+그룹별, 주요 악기별 연습 시간 순위 조회 기능 제공
+"""
+import logging
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from app.core.database import get_db
+from app.core.dependencies import get_current_user
+from app.models.user import User
+from app.models.group import Group, GroupMember
+from app.models.instrument import Instrument
+from app.schemas.leaderboards import LeaderboardEntryResponse, LeaderboardResponse
+from app.services import leaderboard
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/leaderboards", tags=["리더보드"])
+
+
+def _build_leaderboard_response(
+    db: Session,
+    scope_type: str,
+    scope_id: int,
+    period: str,
+    day: Optional[date],
+    cursor: Optional[str],
+    page_size: int,
+    current_user: User
+) -> LeaderboardResponse:
+    """
+    순위표 한 페이지와 내 순위를 조회하여 응답 생성
+    - 내가 현재 페이지에 있으면 그 항목을 그대로 사용 (순위 계산 쿼리 생략)
+    """
+    if period not in leaderboard.PERIOD_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="period는 'day', 'week', 'month', 'all' 중 하나여야 합니다."
+        )
+    
+    day = day or date.today()
+    try:
+        rows, next_cursor = leaderboard.get_leaderboard(
+            db, scope_type, scope_id, period, day,
+            cursor=cursor,
+            limit=page_size
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다."
+        )
+    my_row = next((row for row in rows if row.user_id == current_user.user_id), None)
+    if my_row is None:
+        my_row = leaderboard.get_user_rank(db, scope_type, scope_id, period, current_user.user_id, day)
+    
+    return LeaderboardResponse(
+        scope_type=scope_type,
+        scope_id=scope_id,
+        period=period,
+        period_start=leaderboard.period_start_for(period, day),
+        entries=[LeaderboardEntryResponse.model_validate(row) for row in rows],
+        my_entry=LeaderboardEntryResponse.model_validate(my_row) if my_row else None,
+        page_size=page_size,
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    )
+
+
+@router.get("/groups/{group_id}", response_model=LeaderboardResponse)
+async def get_group_leaderboard(
+    group_id: int,
+    period: str = Query("week", description="기간: 'day', 'week', 'month', 'all'"),
+    day: Optional[date] = Query(None, alias="date", description="기준 날짜 (해당 날짜가 속한 기간, 기본값 오늘)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 첫 페이지는 생략)"),
+    page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    그룹 리더보드 조회
+    - 공개 그룹이거나 내가 가입한 그룹만 조회 가능
+    """
+    group = db.query(Group).filter(Group.group_id == group_id).first()
+    if not group:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="그룹을 찾을 수 없습니다."
+        )
+    
+    if not group.is_public:
+        is_member = db.query(GroupMember).filter(
+            and_(
+                GroupMember.group_id == group_id,
+                GroupMember.user_id == current_user.user_id
+            )
+        ).first() is not None
+        if not is_member:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="이 그룹에 대한 접근 권한이 없습니다."
+            )
+    
+    try:
+        return _build_leaderboard_response(
+            db, leaderboard.SCOPE_GROUP, group_id, period, day, cursor, page_size, current_user
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"그룹 리더보드 조회 실패: group_id={group_id}, error={e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="리더보드 조회에 실패했습니다."
+        )
+
+
+@router.get("/instruments/{instrument_id}", response_model=LeaderboardResponse)
+async def get_instrument_leaderboard(
+    instrument_id: int,
+    period: str = Query("week", description="기간: 'day', 'week', 'month', 'all'"),
+    day: Optional[date] = Query(None, alias="date", description="기준 날짜 (해당 날짜가 속한 기간, 기본값 오늘)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (이전 응답의 next_cursor, 첫 페이지는 생략)"),
+    page_size: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    악기별 리더보드 조회
+    - 해당 악기를 주요 악기로 지정한 사용자 기준
+    """
+    instrument = db.query(Instrument).filter(Instrument.instrument_id == instrument_id).first()
+    if not instrument:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="악기를 찾을 수 없습니다."
+        )
+    
+    try:
+        return _build_leaderboard_response(
+            db, leaderboard.SCOPE_INSTRUMENT, instrument_id, period, day, cursor, page_size, current_user
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"악기 리더보드 조회 실패: instrument_id={instrument_id}, error={e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="리더보드 조회에 실패했습니다."
+        )
@@ -1,66 +1,101 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import desc, select, tuple_, update
+from app.core.database import get_async_db, get_db
 from app.core.dependencies import get_current_user
 from app.models.user import User
 from app.models.notification import Notification
-from app.schemas.notification import NotificationListResponse, NotificationResponse, NotificationRead
+from app.schemas.notification import NotificationListResponse, NotificationResponse, NotificationRead, UnreadCountResponse
 from app.schemas.board import MessageResponse
+from app.services import notification_counters, notification_feed, notification_push, pagination
 
 router = APIRouter(prefix="/api/notifications", tags=["알림"])
 
 
 @router.get("", response_model=NotificationListResponse)
 async def get_notifications(
+    cursor: Optional[str] = Query(None, description="커서: 첫 페이지는 생략(또는 빈 문자열), 이후 next_cursor 값"),
+    page_size: int = Query(50, ge=1, le=100, description="페이지 크기"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    현재 사용자의 알림 목록 조회
+    현재 사용자의 알림 목록 조회 (최신순, 커서 페이지네이션)
+    - (receiver_id, created_at, notification_id) 인덱스로 OFFSET 없이 다음 페이지 조회
+    - unread_count는 users.unread_notification_count 값 (COUNT 쿼리 없음)
+    - 묶음 알림은 갱신될 때 created_at이 바뀌어 목록 맨 앞으로 이동함
     """
-    notifications = db.query(Notification).filter(
+    query = select(Notification).where(
         Notification.receiver_id == current_user.user_id
-    ).order_by(desc(Notification.created_at)).limit(50).all()
-    
-    unread_count = db.query(func.count(Notification.notification_id)).filter(
-        Notification.receiver_id == current_user.user_id,
-        Notification.is_read == False
-    ).scalar()
+    )
+    if cursor:
+        try:
+            cursor_created_at, cursor_notification_id = pagination.decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="잘못된 커서입니다."
+            )
+        query = query.where(
+            tuple_(Notification.created_at, Notification.notification_id) < tuple_(cursor_created_at, cursor_notification_id)
+        )
+    notifications = (await db.scalars(query.order_by(
+        desc(Notification.created_at), desc(Notification.notification_id)
+    ).limit(page_size + 1))).all()
+    notifications, next_cursor, has_more = pagination.next_cursor_for(
+        notifications, page_size, "created_at", "notification_id"
+    )
     
     return NotificationListResponse(
-        notifications=[
-            NotificationResponse(
-                notification_id=n.notification_id,
-                receiver_id=n.receiver_id,
-                sender_id=n.sender_id,
-                sender_nickname=n.sender.nickname if n.sender else None,
-                type=n.type,
-                post_id=n.post_id,
-                comment_id=n.comment_id,
-                content=n.content,
-                is_read=n.is_read,
-                created_at=n.created_at
-            ) for n in notifications
-        ],
-        unread_count=unread_count or 0
+        notifications=await db.run_sync(notification_feed.build_notification_responses, notifications),
+        unread_count=await _get_unread_count(db, current_user.user_id),
+        next_cursor=next_cursor,
+        has_more=has_more
+    )
+
+
+async def _get_unread_count(db: AsyncSession, user_id: int) -> int:
+    """users.unread_notification_count 조회"""
+    unread_count = await db.scalar(
+        select(User.unread_notification_count).where(User.user_id == user_id)
     )
+    return unread_count or 0
+
+
+@router.get("/unread-count", response_model=UnreadCountResponse)
+async def get_unread_count(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    읽지 않은 알림 수 조회 (알림 배지용, 카운터 컬럼 한 번 조회)
+    """
+    return UnreadCountResponse(unread_count=await _get_unread_count(db, current_user.user_id))
+
+
+def _after_read(db: Session, user_id: int, count: int) -> None:
+    """읽음 처리한 수만큼 카운터 감소 후 변경된 읽지 않은 알림 수 발행"""
+    notification_counters.decrement_unread_count(db, user_id, count)
+    if count:
+        notification_push.publish_unread_counts(db, [user_id])
 
 
 @router.patch("/{notification_id}/read", response_model=NotificationResponse)
 async def mark_notification_as_read(
     notification_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     특정 알림 읽음 처리
     """
-    notification = db.query(Notification).filter(
+    notification = await db.scalar(select(Notification).where(
         Notification.notification_id == notification_id,
         Notification.receiver_id == current_user.user_id
-    ).first()
+    ))
     
     if not notification:
         raise HTTPException(
@@ -68,37 +103,85 @@ async def mark_notification_as_read(
             detail="알림을 찾을 수 없습니다."
         )
     
-    notification.is_read = True
-    db.commit()
-    db.refresh(notification)
-    
-    return NotificationResponse(
-        notification_id=notification.notification_id,
-        receiver_id=notification.receiver_id,
-        sender_id=notification.sender_id,
-        sender_nickname=notification.sender.nickname if notification.sender else None,
-        type=notification.type,
-        post_id=notification.post_id,
-        comment_id=notification.comment_id,
-        content=notification.content,
-        is_read=notification.is_read,
-        created_at=notification.created_at
+    # 읽지 않은 알림인 경우에만 읽음 처리 및 카운터 감소 (동시 요청으로 두 번 감소하지 않도록 조건부 UPDATE)
+    result = await db.execute(
+        update(Notification).where(
+            Notification.notification_id == notification_id,
+            Notification.is_read == False
+        ).values(is_read=True).execution_options(synchronize_session=False)
     )
+    if result.rowcount:
+        await db.run_sync(_after_read, current_user.user_id, 1)
+    await db.commit()
+    await db.refresh(notification)
+    
+    return (await db.run_sync(notification_feed.build_notification_responses, [notification]))[0]
 
 
 @router.post("/read-all", response_model=MessageResponse)
 async def mark_all_notifications_as_read(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     모든 알림 읽음 처리
     """
-    db.query(Notification).filter(
-        Notification.receiver_id == current_user.user_id,
-        Notification.is_read == False
-    ).update({"is_read": True})
+    result = await db.execute(
+        update(Notification).where(
+            Notification.receiver_id == current_user.user_id,
+            Notification.is_read == False
+        ).values(is_read=True).execution_options(synchronize_session=False)
+    )
+    # 0으로 덮어쓰지 않고 실제로 읽음 처리한 수만큼 감소 (그 사이 디스패처가 추가한 알림 수 유지)
+    await db.run_sync(_after_read, current_user.user_id, result.rowcount)
     
-    db.commit()
+    await db.commit()
     
     return MessageResponse(message="모든 알림이 읽음 처리되었습니다.")
+
+
+@router.websocket("/ws")
+async def notifications_stream(
+    websocket: WebSocket,
+    token: str = Query(..., description="액세스 토큰 (브라우저 WebSocket은 헤더를 보낼 수 없으므로 쿼리로 전달)"),
+    db: Session = Depends(get_db)
+):
+    """
+    알림 실시간 푸시 (app.services.notification_push)
+    - 접속 직후 현재 읽지 않은 알림 수를 보내고, 이후 새 알림/읽지 않은 알림 수 변경을 전달
+    - 접속 중에는 GET /api/notifications 폴링이 필요 없음 (resync 메시지를 받은 경우에만 다시 조회)
+    - 푸시가 비활성화된 워커에서는 1013 코드로 종료 (클라이언트는 폴링으로 대체)
+    """
+    try:
+        current_user = await get_current_user(token=token, db=db)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    user_id = current_user.user_id
+    unread_count = current_user.unread_notification_count or 0
+    # 연결이 유지되는 동안 DB 연결을 점유하지 않도록 세션 정리
+    db.close()
+
+    await websocket.accept()
+    if not notification_push.hub.running:
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    connection = notification_push.hub.register(user_id)
+
+    async def _send_messages():
+        while True:
+            message = await connection.queue.get()
+            await websocket.send_json(message)
+
+    sender = asyncio.create_task(_send_messages())
+    try:
+        await websocket.send_json({"type": "unread_count", "unread_count": unread_count})
+        while True:
+            # 클라이언트 메시지(ping 등)는 무시, 연결 종료 감지용
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        sender.cancel()
+        notification_push.hub.unregister(connection)
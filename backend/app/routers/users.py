@@ -11,13 +11,14 @@ from datetime import datetime
 from typing import List, Optional
 from app.core.database import get_db
 from app.core.dependencies import get_current_user
-from app.core.security import get_password_hash, verify_password
+from app.core import password_pool
 from app.core.utils import get_achievement_response
 from app.models.user import User, UserProfile
 from app.models.user_profile import UserProfileInstrument, UserProfileUserType
 from app.models.instrument import Instrument
 from app.models.user_type import UserType
 from app.models.achievement import Achievement, UserAchievement
+from app.services import auth_cache, leaderboard, practice_cohort
 from app.schemas.users import (
     UserDetailResponse,
     UserProfileResponse,
@@ -172,6 +173,7 @@ async def update_my_profile(
         profile.updated_at = datetime.utcnow()
         
         db.commit()
+        auth_cache.invalidate(current_user.user_id)
         db.refresh(current_user)
         db.refresh(profile)
         
@@ -278,6 +280,11 @@ async def update_my_instruments(
             )
             db.add(profile_instrument)
         
+        # 주요 악기 리더보드 및 비교 코호트 갱신
+        db.flush()
+        leaderboard.refresh_user_instrument(db, current_user.user_id)
+        practice_cohort.refresh_cohort_key(db, profile)
+        
         profile.updated_at = datetime.utcnow()
         db.commit()
         
@@ -339,6 +346,10 @@ async def update_my_user_types(
             )
             db.add(profile_user_type)
         
+        # 비교 코호트 갱신
+        db.flush()
+        practice_cohort.refresh_cohort_key(db, profile)
+        
         profile.updated_at = datetime.utcnow()
         db.commit()
         
@@ -377,14 +388,14 @@ async def change_password(
             )
         
         # 현재 비밀번호 확인
-        if not verify_password(request.current_password, current_user.password_hash):
+        if not await password_pool.verify_password(request.current_password, current_user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="현재 비밀번호가 올바르지 않습니다."
             )
         
         # 새 비밀번호로 변경
-        current_user.password_hash = get_password_hash(request.new_password)
+        current_user.password_hash = await password_pool.hash_password(request.new_password)
         current_user.updated_at = datetime.utcnow()
         
         db.commit()
@@ -426,7 +437,7 @@ async def change_email(
             )
         
         # 현재 비밀번호 확인
-        if not verify_password(request.current_password, current_user.password_hash):
+        if not await password_pool.verify_password(request.current_password, current_user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="현재 비밀번호가 올바르지 않습니다."
@@ -496,7 +507,12 @@ async def delete_my_account(
         current_user.is_active = False
         current_user.updated_at = datetime.utcnow()
         
+        # 리더보드에서 제외 (복구 시 python -m app.services.leaderboard rebuild 로 재생성)
+        leaderboard.remove_user(db, current_user.user_id)
+        
         db.commit()
+        # 다른 요청이 캐시된 스냅샷으로 인증되지 않도록 즉시 무효화
+        auth_cache.invalidate(current_user.user_id)
         
         return MessageResponse(message="회원 탈퇴가 완료되었습니다.")
         
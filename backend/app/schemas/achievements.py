@@ -11,7 +11,7 @@ class AchievementResponse(BaseModel):
     achievement_id: int
     title: str
     description: Optional[str]
-    condition_type: Optional[str]  # 'practice_time', 'consecutive_days', 'instrument_count'
+    condition_type: Optional[str]  # 'practice_time', 'consecutive_days', 'instrument_count', 'total_sessions', 'longest_streak', 'practice_days'
     condition_value: Optional[int]
     icon_url: Optional[str]
     created_at: datetime
@@ -4,7 +4,7 @@
 """
 from __future__ import annotations
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import datetime
 
 
@@ -112,6 +112,9 @@ class PostListResponse(BaseModel):
     page: int
     page_size: int
     total_pages: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool = Field(False, description="다음 페이지 존재 여부")
+    total_is_estimate: bool = Field(False, description="커서 방식에서 total이 추정치(또는 미계산 0)인지 여부")
 
     class Config:
         json_schema_extra = {
@@ -120,11 +123,45 @@ class PostListResponse(BaseModel):
                 "total": 0,
                 "page": 1,
                 "page_size": 20,
-                "total_pages": 0
+                "total_pages": 0,
+                "next_cursor": None,
+                "has_more": False,
+                "total_is_estimate": False
             }
         }
 
 
+
+class PostSearchResult(PostResponse):
+    """게시글 검색 결과 항목 스키마"""
+    rank: float = Field(0.0, description="관련도 점수 (높을수록 관련도 높음)")
+    snippet: Optional[str] = Field(None, description="본문 하이라이트 스니펫 (HTML 이스케이프 후 일치 부분을 <mark>로 감쌈)")
+
+
+class PostSearchResponse(BaseModel):
+    """게시글 검색 응답 스키마 (관련도순)"""
+    posts: List[PostSearchResult]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+    query: str
+
+
+class TagStatResponse(BaseModel):
+    """태그 통계 응답 스키마"""
+    tag: str
+    post_count: int = Field(..., description="태그가 붙은 노출 게시글 수")
+    last_used_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class TagListResponse(BaseModel):
+    """태그 목록 응답 스키마 (자동완성/인기 태그)"""
+    tags: List[TagStatResponse]
+
 # ========== 댓글 스키마 ==========
 
 class CommentCreate(BaseModel):
@@ -181,13 +218,17 @@ CommentResponse.model_rebuild()
 class CommentListResponse(BaseModel):
     """댓글 목록 응답 스키마"""
     comments: List[CommentResponse]
-    total: int
+    total: int  # 이번 응답의 최상위 댓글 수
+    next_cursor: Optional[str] = Field(None, description="다음 최상위 댓글 페이지 커서 (커서 방식이 아니거나 마지막 페이지면 null)")
+    has_more: bool = Field(False, description="다음 최상위 댓글 페이지 존재 여부")
 
     class Config:
         json_schema_extra = {
             "example": {
                 "comments": [],
-                "total": 0
+                "total": 0,
+                "next_cursor": None,
+                "has_more": False
             }
         }
 
@@ -220,6 +261,31 @@ class BookmarkResponse(BaseModel):
         }
 
 
+
+class ReactionAction(BaseModel):
+    """좋아요/북마크 토글 항목"""
+    kind: Literal["post_like", "post_bookmark", "comment_like"] = Field(..., description="토글 종류")
+    target_id: int = Field(..., description="게시글 ID 또는 댓글 ID")
+
+
+class ReactionBatchRequest(BaseModel):
+    """좋아요/북마크 일괄 토글 요청 스키마"""
+    actions: List[ReactionAction] = Field(..., min_length=1, max_length=50, description="요청 순서대로 적용")
+
+
+class ReactionResult(BaseModel):
+    """좋아요/북마크 토글 결과"""
+    kind: str
+    target_id: int
+    found: bool = Field(..., description="대상이 없거나 삭제되었으면 false")
+    is_active: bool = Field(False, description="토글 후 상태 (좋아요/북마크 여부)")
+    count: Optional[int] = Field(None, description="토글 후 좋아요 개수 (북마크는 null)")
+
+
+class ReactionBatchResponse(BaseModel):
+    """좋아요/북마크 일괄 토글 응답 스키마"""
+    results: List[ReactionResult]
+
 # ========== 메시지 응답 스키마 ==========
 
 class MessageResponse(BaseModel):
@@ -251,6 +251,9 @@ class GroupStatisticsResponse(BaseModel):
     average_sessions_per_member: float = Field(..., description="멤버당 평균 연습 횟수")
     most_active_member: Optional[GroupMemberStatisticsResponse] = Field(None, description="가장 활발한 멤버")
     weekly_practice_data: List[int] = Field(..., description="최근 7일간 일별 총 연습 시간 (초)")
+    period: str = Field("all", description="통계 기간 ('all', 'week', 'month', 'custom')")
+    start_date: Optional[date] = Field(None, description="통계 시작일 (전체 기간이면 null)")
+    end_date: Optional[date] = Field(None, description="통계 종료일 (전체 기간이면 null)")
 
     class Config:
         json_schema_extra = {
@@ -262,7 +265,10 @@ class GroupStatisticsResponse(BaseModel):
                 "average_practice_time_per_member": 36000.0,
                 "average_sessions_per_member": 10.0,
                 "most_active_member": None,
-                "weekly_practice_data": [3600, 7200, 5400, 9000, 10800, 7200, 5400]
+                "weekly_practice_data": [3600, 7200, 5400, 9000, 10800, 7200, 5400],
+                "period": "all",
+                "start_date": None,
+                "end_date": None
             }
         }
 
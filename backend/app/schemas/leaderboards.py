@@ -0,0 +1,48 @@
+"""
+리더보드 관련 스키마
+"""
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import date
+
+
+class LeaderboardEntryResponse(BaseModel):
+    """순위표 항목 응답"""
+    rank: int = Field(..., description="순위 (동점은 같은 순위)")
+    user_id: int
+    nickname: str
+    profile_image_url: Optional[str] = None
+    total_seconds: int = Field(..., description="기간 내 총 연습 시간 (초)")
+
+    class Config:
+        from_attributes = True
+
+
+class LeaderboardResponse(BaseModel):
+    """순위표 응답"""
+    scope_type: str = Field(..., description="'group' 또는 'instrument'")
+    scope_id: int
+    period: str = Field(..., description="'day', 'week', 'month', 'all'")
+    period_start: date = Field(..., description="기간 시작일")
+    entries: List[LeaderboardEntryResponse]
+    my_entry: Optional[LeaderboardEntryResponse] = Field(None, description="내 순위 (기록이 없으면 null)")
+    page_size: int
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "scope_type": "group",
+                "scope_id": 1,
+                "period": "week",
+                "period_start": "2024-01-15",
+                "entries": [
+                    {"rank": 1, "user_id": 3, "nickname": "피아니스트", "profile_image_url": None, "total_seconds": 18000}
+                ],
+                "my_entry": None,
+                "page_size": 20,
+                "next_cursor": None,
+                "has_more": False
+            }
+        }
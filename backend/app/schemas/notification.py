@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 
 
@@ -15,6 +15,8 @@ class NotificationResponse(NotificationBase):
     receiver_id: int
     sender_id: Optional[int] = None
     sender_nickname: Optional[str] = None
+    actor_count: int = 1  # 묶음 알림의 발신자 수 (sender_nickname 외 actor_count - 1명)
+    recent_sender_nicknames: List[str] = []  # 묶음 알림의 최근 발신자 닉네임 (최신순)
     is_read: bool
     created_at: datetime
 
@@ -29,3 +31,9 @@ class NotificationRead(BaseModel):
 class NotificationListResponse(BaseModel):
     notifications: list[NotificationResponse]
     unread_count: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+    has_more: bool = False
+
+
+class UnreadCountResponse(BaseModel):
+    unread_count: int
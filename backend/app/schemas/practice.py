@@ -62,6 +62,7 @@ class PracticeStatisticsResponse(BaseModel):
     total_practice_time: int = Field(..., description="총 연습 시간 (초)")
     total_sessions: int = Field(..., description="총 연습 횟수")
     consecutive_days: int = Field(..., description="연속 연습 일수")
+    longest_streak: int = Field(0, description="최장 연속 연습 일수")
     last_practice_date: Optional[date] = Field(None, description="마지막 연습 날짜")
     average_session_time: Optional[float] = Field(None, description="평균 세션 시간 (초)")
 
@@ -71,6 +72,7 @@ class PracticeStatisticsResponse(BaseModel):
                 "total_practice_time": 36000,
                 "total_sessions": 10,
                 "consecutive_days": 5,
+                "longest_streak": 12,
                 "last_practice_date": "2024-01-15",
                 "average_session_time": 3600.0
             }
@@ -109,3 +111,48 @@ class WeeklyAveragePracticeResponse(BaseModel):
                 "total_users": 10
             }
         }
+
+
+class PracticeDailyTotalResponse(BaseModel):
+    """일일 연습 합계"""
+    practice_date: date
+    total_seconds: int = Field(..., description="해당 날짜 총 연습 시간 (초)")
+    session_count: int = Field(..., description="해당 날짜 연습 횟수")
+
+    class Config:
+        from_attributes = True
+
+
+class PracticeCalendarUserResponse(BaseModel):
+    """사용자별 월간 달력 데이터"""
+    user_id: int
+    total_seconds: int = Field(..., description="해당 월 총 연습 시간 (초)")
+    days: list[PracticeDailyTotalResponse] = Field(..., description="연습한 날짜별 합계 (날짜 오름차순)")
+
+
+class PracticeCalendarResponse(BaseModel):
+    """월간 연습 달력 응답"""
+    year: int
+    month: int
+    start_date: date
+    end_date: date
+    users: list[PracticeCalendarUserResponse]
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "year": 2024,
+                "month": 1,
+                "start_date": "2024-01-01",
+                "end_date": "2024-01-31",
+                "users": [
+                    {
+                        "user_id": 1,
+                        "total_seconds": 5400,
+                        "days": [
+                            {"practice_date": "2024-01-15", "total_seconds": 5400, "session_count": 2}
+                        ]
+                    }
+                ]
+            }
+        }
@@ -0,0 +1,68 @@
+"""
+칭호 카탈로그 캐시
+- 칭호 목록은 작고 거의 바뀌지 않으므로 워커 프로세스 메모리에 achievement_id -> AchievementResponse로 보관
+- 작성자/그룹장/멤버 응답 생성 시 칭호마다 SELECT 하던 것을 메모리 조회로 대체
+- 칭호 생성/수정/삭제 시 cache_versions의 'achievements' 버전을 같은 트랜잭션에서 증가시키고,
+  각 워커는 VERSION_CHECK_INTERVAL 마다 버전을 비교하여 다르면 카탈로그 전체를 다시 적재
+  (다른 워커에는 최대 VERSION_CHECK_INTERVAL 만큼 늦게 반영됨)
+"""
+import threading
+import time
+from typing import Dict, Optional
+from sqlalchemy.orm import Session
+from app.models.achievement import Achievement
+from app.schemas.achievements import AchievementResponse
+from app.services import cache_versions
+
+CACHE_NAME = "achievements"
+VERSION_CHECK_INTERVAL = 5.0  # 초
+
+_lock = threading.Lock()
+_entries: Optional[Dict[int, AchievementResponse]] = None
+_version: Optional[int] = None
+_checked_at = 0.0
+
+
+def get_catalog(db: Session) -> Dict[int, AchievementResponse]:
+    """
+    칭호 카탈로그 조회
+    - 마지막 버전 확인 후 VERSION_CHECK_INTERVAL 이내면 쿼리 없이 반환
+    - 버전이 바뀌었으면 전체 다시 적재 (쿼리 2회)
+    """
+    global _entries, _version, _checked_at
+    now = time.monotonic()
+    with _lock:
+        entries, version, checked_at = _entries, _version, _checked_at
+    if entries is not None and now - checked_at < VERSION_CHECK_INTERVAL:
+        return entries
+
+    current_version = cache_versions.get_version(db, CACHE_NAME)
+    if entries is None or current_version != version:
+        # 버전을 먼저 읽고 적재하므로, 적재 중 변경이 있어도 다음 확인 때 다시 적재됨
+        entries = {
+            achievement.achievement_id: AchievementResponse.model_validate(achievement)
+            for achievement in db.query(Achievement).all()
+        }
+
+    with _lock:
+        _entries, _version, _checked_at = entries, current_version, now
+    return entries
+
+
+def get_achievement(db: Session, achievement_id: Optional[int]) -> Optional[AchievementResponse]:
+    """칭호 ID로 캐시된 칭호 응답 조회 (없으면 None)"""
+    if not achievement_id:
+        return None
+    return get_catalog(db).get(achievement_id)
+
+
+def bump_version(db: Session) -> None:
+    """칭호 변경 트랜잭션 안에서 호출하여 전체 워커의 카탈로그를 무효화 (커밋하지 않음)"""
+    cache_versions.bump_version(db, CACHE_NAME)
+
+
+def clear() -> None:
+    """현재 워커의 카탈로그 캐시 비우기 (변경 커밋 직후 호출하면 이 워커에는 즉시 반영)"""
+    global _entries, _version, _checked_at
+    with _lock:
+        _entries, _version, _checked_at = None, None, 0.0
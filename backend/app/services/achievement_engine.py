@@ -0,0 +1,262 @@
+"""
+칭호 평가 엔진
+- condition_type 별 평가 함수를 레지스트리에 등록하여 사용 (플러그인 방식)
+- 사용자 지표는 한 번의 쿼리로 계산하고, 획득한 칭호 목록도 한 번만 조회
+- 새 칭호는 INSERT ... ON CONFLICT DO NOTHING 한 번으로 일괄 부여
+- 단계/평가 함수별 소요 시간을 누적하여 칭호 체크 비용을 확인할 수 있음
+"""
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Callable, Dict, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.user import User, UserProfile
+from app.models.user_profile import UserProfileInstrument
+from app.models.practice import PracticeStats, PracticeDailyTotal
+from app.models.achievement import Achievement, UserAchievement
+from app.services import practice_stats
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UserMetrics:
+    """칭호 평가에 사용하는 사용자 지표"""
+    user_id: int
+    total_practice_time: int = 0
+    total_sessions: int = 0
+    consecutive_days: int = 0
+    longest_streak: int = 0
+    practice_days: int = 0
+    instrument_count: int = 0
+
+
+# condition_type -> 지표 값 계산 함수
+Evaluator = Callable[[UserMetrics], int]
+_EVALUATORS: Dict[str, Evaluator] = {}
+
+
+def register_evaluator(condition_type: str):
+    """
+    칭호 조건 평가 함수 등록 데코레이터
+    - 평가 함수는 UserMetrics를 받아 condition_value와 비교할 값을 반환
+    """
+    def decorator(func_: Evaluator) -> Evaluator:
+        _EVALUATORS[condition_type] = func_
+        return func_
+    return decorator
+
+
+def get_registered_condition_types() -> List[str]:
+    return list(_EVALUATORS.keys())
+
+
+@register_evaluator("practice_time")
+def _evaluate_practice_time(metrics: UserMetrics) -> int:
+    """총 연습 시간 (초)"""
+    return metrics.total_practice_time
+
+
+@register_evaluator("consecutive_days")
+def _evaluate_consecutive_days(metrics: UserMetrics) -> int:
+    """오늘까지 연속 연습 일수"""
+    return metrics.consecutive_days
+
+
+@register_evaluator("instrument_count")
+def _evaluate_instrument_count(metrics: UserMetrics) -> int:
+    """프로필에 등록한 악기 수"""
+    return metrics.instrument_count
+
+
+@register_evaluator("total_sessions")
+def _evaluate_total_sessions(metrics: UserMetrics) -> int:
+    """총 연습 횟수"""
+    return metrics.total_sessions
+
+
+@register_evaluator("longest_streak")
+def _evaluate_longest_streak(metrics: UserMetrics) -> int:
+    """최장 연속 연습 일수"""
+    return metrics.longest_streak
+
+
+@register_evaluator("practice_days")
+def _evaluate_practice_days(metrics: UserMetrics) -> int:
+    """연습한 날의 수"""
+    return metrics.practice_days
+
+
+# ========== 소요 시간 통계 ==========
+
+@dataclass
+class _TimingStat:
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def add(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+_timing_lock = threading.Lock()
+_timings: Dict[str, _TimingStat] = {}
+_awarded_total = 0
+
+
+def _record_timings(timings: Dict[str, float], awarded: int) -> None:
+    global _awarded_total
+    with _timing_lock:
+        for name, elapsed_ms in timings.items():
+            _timings.setdefault(name, _TimingStat()).add(elapsed_ms)
+        _awarded_total += awarded
+
+
+def get_engine_metrics() -> dict:
+    """
+    칭호 평가 소요 시간 통계 (워커 프로세스 단위)
+    - phases: 지표 조회(load_metrics), 칭호 목록/획득 목록 조회, 일괄 부여(insert), 전체(total)
+    - evaluators: condition_type 별 평가 시간
+    """
+    with _timing_lock:
+        phases = {k: v.to_dict() for k, v in _timings.items() if not k.startswith("evaluator:")}
+        evaluators = {
+            k.split(":", 1)[1]: v.to_dict() for k, v in _timings.items() if k.startswith("evaluator:")
+        }
+        return {
+            "phases": phases,
+            "evaluators": evaluators,
+            "awarded_total": _awarded_total,
+        }
+
+
+def reset_engine_metrics() -> None:
+    global _awarded_total
+    with _timing_lock:
+        _timings.clear()
+        _awarded_total = 0
+
+
+# ========== 평가 ==========
+
+@dataclass
+class AwardResult:
+    """칭호 평가 결과"""
+    newly_earned: List[Achievement] = field(default_factory=list)
+    timings: Dict[str, float] = field(default_factory=dict)  # 단계/평가 함수별 소요 시간 (ms)
+
+
+def load_user_metrics(db: Session, user_id: int, today: Optional[date] = None) -> UserMetrics:
+    """
+    칭호 평가용 사용자 지표를 한 번의 쿼리로 조회
+    - 연습 지표는 practice_stats 롤업, 악기 수와 연습 일수는 스칼라 서브쿼리
+    """
+    instrument_count = select(func.count()).select_from(UserProfileInstrument).join(
+        UserProfile, UserProfile.profile_id == UserProfileInstrument.profile_id
+    ).where(UserProfile.user_id == user_id).scalar_subquery()
+
+    practice_days = select(func.count()).select_from(PracticeDailyTotal).where(
+        PracticeDailyTotal.user_id == user_id
+    ).scalar_subquery()
+
+    row = db.query(
+        PracticeStats,
+        instrument_count.label("instrument_count"),
+        practice_days.label("practice_days")
+    ).select_from(User).outerjoin(
+        PracticeStats, PracticeStats.user_id == User.user_id
+    ).filter(User.user_id == user_id).first()
+
+    if row is None:
+        return UserMetrics(user_id=user_id)
+
+    stats = row.PracticeStats
+    if stats is None:
+        # 롤업이 아직 없는 사용자 (생성 후 저장)
+        stats = practice_stats.get_practice_stats(db, user_id)
+
+    return UserMetrics(
+        user_id=user_id,
+        total_practice_time=int(stats.total_practice_time or 0),
+        total_sessions=int(stats.total_sessions or 0),
+        consecutive_days=practice_stats.effective_current_streak(stats, today),
+        longest_streak=int(stats.longest_streak or 0),
+        practice_days=int(row.practice_days or 0),
+        instrument_count=int(row.instrument_count or 0),
+    )
+
+
+def evaluate_user_achievements(db: Session, user_id: int) -> AwardResult:
+    """
+    사용자의 칭호 획득 조건을 평가하고 새 칭호를 일괄 부여 (커밋 포함)
+    """
+    result = AwardResult()
+    timings = result.timings
+    started = time.perf_counter()
+
+    def _lap(name: str, since: float) -> float:
+        now = time.perf_counter()
+        timings[name] = (now - since) * 1000
+        return now
+
+    checkpoint = started
+    metrics = load_user_metrics(db, user_id)
+    checkpoint = _lap("load_metrics", checkpoint)
+
+    achievements = db.query(Achievement).filter(
+        Achievement.condition_type.in_(get_registered_condition_types()),
+        Achievement.condition_value.isnot(None)
+    ).all()
+    earned_ids = {
+        row.achievement_id for row in db.query(UserAchievement.achievement_id).filter(
+            UserAchievement.user_id == user_id
+        )
+    }
+    checkpoint = _lap("load_catalog", checkpoint)
+
+    achievements_by_type: Dict[str, List[Achievement]] = {}
+    for achievement in achievements:
+        if achievement.achievement_id not in earned_ids:
+            achievements_by_type.setdefault(achievement.condition_type, []).append(achievement)
+
+    candidates: List[Achievement] = []
+    for condition_type, evaluator in _EVALUATORS.items():
+        evaluator_started = time.perf_counter()
+        pending = achievements_by_type.get(condition_type)
+        if pending:
+            value = evaluator(metrics)
+            candidates.extend(a for a in pending if a.condition_value <= value)
+        timings[f"evaluator:{condition_type}"] = (time.perf_counter() - evaluator_started) * 1000
+    checkpoint = time.perf_counter()
+
+    if candidates:
+        stmt = pg_insert(UserAchievement).values([
+            {"user_id": user_id, "achievement_id": a.achievement_id} for a in candidates
+        ]).on_conflict_do_nothing(
+            constraint="uq_user_achievement_user_achievement"
+        ).returning(UserAchievement.achievement_id)
+        inserted_ids = set(db.execute(stmt).scalars().all())
+        db.commit()
+
+        result.newly_earned = [a for a in candidates if a.achievement_id in inserted_ids]
+        for achievement in result.newly_earned:
+            logger.info(f"칭호 획득: user_id={user_id}, achievement_id={achievement.achievement_id}, title={achievement.title}")
+        checkpoint = _lap("insert", checkpoint)
+
+    timings["total"] = (time.perf_counter() - started) * 1000
+    _record_timings(timings, len(result.newly_earned))
+    return result
@@ -0,0 +1,101 @@
+"""
+인증 사용자 캐시
+- 인증에 필요한 필드(is_active, deleted_at, is_admin, selected_achievement_id)만 담은
+  변경 불가 스냅샷을 워커 프로세스 메모리에 user_id -> 스냅샷으로 AUTH_USER_CACHE_TTL 동안 보관
+- get_current_user는 캐시가 유효하면 users 조회 없이 스냅샷으로 세션에 연결된 User를 만들어 반환
+  (스냅샷에 없는 필드는 처음 접근할 때 한 번에 로드되므로, user_id만 쓰는 요청은 인증 쿼리 0회)
+- 상태/권한/프로필을 바꾸는 엔드포인트는 커밋 후 invalidate() 호출
+  (다른 워커에는 최대 TTL 만큼 늦게 반영됨)
+"""
+import threading
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.core.config import settings
+from app.models.user import User
+
+MAX_ENTRIES = 10000  # 초과 시 만료된 항목 정리, 그래도 많으면 전체 비움
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """인증용 사용자 스냅샷"""
+    user_id: int
+    is_active: Optional[bool]
+    deleted_at: Optional[datetime]
+    is_admin: bool
+    selected_achievement_id: Optional[int]
+
+
+_lock = threading.Lock()
+_entries: Dict[int, Tuple[UserSnapshot, float]] = {}
+_generation = 0  # invalidate/clear 마다 증가, 조회 중 무효화된 스냅샷을 저장하지 않기 위해 사용
+
+
+def get_snapshot(db: Session, user_id: int) -> Optional[UserSnapshot]:
+    """
+    사용자 스냅샷 조회 (탈퇴/비활성 사용자 포함, 없는 사용자면 None)
+    - 캐시가 유효하면 쿼리 없이 반환, 아니면 필요한 컬럼만 한 번 조회
+    """
+    ttl = settings.AUTH_USER_CACHE_TTL
+    now = time.monotonic()
+    with _lock:
+        entry = _entries.get(user_id)
+        generation = _generation
+    if entry is not None and entry[1] > now:
+        return entry[0]
+
+    row = db.query(
+        User.user_id,
+        User.is_active,
+        User.deleted_at,
+        User.is_admin,
+        User.selected_achievement_id
+    ).filter(User.user_id == user_id).first()
+    if row is None:
+        return None
+    snapshot = UserSnapshot(**row._asdict())
+
+    if ttl > 0:
+        with _lock:
+            if generation == _generation:
+                if len(_entries) >= MAX_ENTRIES:
+                    _evict(now)
+                _entries[user_id] = (snapshot, now + ttl)
+    return snapshot
+
+
+def _evict(now: float) -> None:
+    """만료된 항목 정리 (_lock 안에서 호출)"""
+    for user_id in [user_id for user_id, (_, expires_at) in _entries.items() if expires_at <= now]:
+        del _entries[user_id]
+    if len(_entries) >= MAX_ENTRIES:
+        _entries.clear()
+
+
+def attach(db: Session, snapshot: UserSnapshot) -> User:
+    """
+    스냅샷으로 세션에 연결된 User 반환 (쿼리 없음)
+    - 스냅샷에 없는 필드(nickname 등)는 접근 시 로드되고, 변경하면 일반 객체처럼 UPDATE 됨
+    """
+    user = User(**asdict(snapshot))
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def invalidate(user_id: int) -> None:
+    """사용자 스냅샷 무효화 (사용자 행을 변경한 트랜잭션 커밋 후 호출)"""
+    global _generation
+    with _lock:
+        _entries.pop(user_id, None)
+        _generation += 1
+
+
+def clear() -> None:
+    """전체 캐시 비우기 (테스트용)"""
+    global _generation
+    with _lock:
+        _entries.clear()
+        _generation += 1
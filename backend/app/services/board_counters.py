@@ -0,0 +1,88 @@
+"""
+게시판 비정규화 카운터 서비스
+- posts.comment_count: 삭제되지 않은 댓글 수 (대댓글 포함)
+- 댓글 작성/삭제 시 UPDATE ... SET comment_count = comment_count ± 1 로 원자적으로 갱신
+  (읽고 쓰는 사이에 다른 요청이 끼어들어도 값이 유실되지 않음)
+- 어긋난 값은 재계산 작업으로 일괄 보정 (주기 실행용 명령)
+
+    python -m app.services.board_counters reconcile
+"""
+import logging
+import sys
+from typing import Optional, Sequence
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from app.models.board import Post, Comment
+
+logger = logging.getLogger(__name__)
+
+
+def increment_comment_count(db: Session, post_id: int) -> None:
+    """게시글 댓글 수 1 증가 (커밋하지 않음)"""
+    db.query(Post).filter(Post.post_id == post_id).update(
+        {Post.comment_count: func.coalesce(Post.comment_count, 0) + 1},
+        synchronize_session=False
+    )
+
+
+def decrement_comment_count(db: Session, post_id: int) -> None:
+    """게시글 댓글 수 1 감소, 0 미만으로 내려가지 않음 (커밋하지 않음)"""
+    db.query(Post).filter(Post.post_id == post_id).update(
+        {Post.comment_count: func.greatest(func.coalesce(Post.comment_count, 0) - 1, 0)},
+        synchronize_session=False
+    )
+
+
+def reconcile_comment_counts(db: Session, post_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    실제 댓글 수와 다른 posts.comment_count를 한 번의 UPDATE ... FROM 으로 보정
+    - post_ids가 없으면 전체 게시글 대상
+    - 값이 이미 같은 행은 갱신하지 않음 (불필요한 행 버전 생성 방지)
+
+    Returns:
+        보정된 게시글 수
+    """
+    counts = select(
+        Post.post_id.label("post_id"),
+        func.count(Comment.comment_id).label("actual")
+    ).select_from(Post).outerjoin(
+        Comment,
+        and_(
+            Comment.post_id == Post.post_id,
+            Comment.deleted_at.is_(None)
+        )
+    )
+    if post_ids is not None:
+        if not post_ids:
+            return 0
+        counts = counts.where(Post.post_id.in_(list(post_ids)))
+    counts = counts.group_by(Post.post_id).subquery()
+
+    result = db.execute(
+        Post.__table__.update().where(
+            and_(
+                Post.post_id == counts.c.post_id,
+                Post.comment_count.is_distinct_from(counts.c.actual)
+            )
+        ).values(comment_count=counts.c.actual)
+    )
+    db.commit()
+    if result.rowcount:
+        logger.warning(f"댓글 수 보정: posts={result.rowcount}")
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 전체 게시글 댓글 수 보정
+    from app.core.database import SessionLocal
+
+    if len(sys.argv) < 2 or sys.argv[1] != "reconcile":
+        print("사용법: python -m app.services.board_counters reconcile")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        count = reconcile_comment_counts(db)
+        print(f"✅ 댓글 수가 보정되었습니다. (게시글 {count}개)")
+    finally:
+        db.close()
@@ -0,0 +1,25 @@
+"""
+캐시 버전 서비스
+- 프로세스 메모리 캐시를 여러 워커(uvicorn 프로세스)에서 일관되게 무효화하기 위한 버전 카운터
+- 원본 데이터를 바꾸는 트랜잭션 안에서 bump_version()을 호출하면 변경과 버전 증가가 함께 커밋됨
+- 각 워커는 주기적으로 get_version()을 비교하여 버전이 다르면 캐시를 다시 적재
+"""
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.cache_version import CacheVersion
+
+
+def get_version(db: Session, name: str) -> int:
+    """캐시 버전 조회 (행이 없으면 0)"""
+    version = db.query(CacheVersion.version).filter(CacheVersion.name == name).scalar()
+    return int(version or 0)
+
+
+def bump_version(db: Session, name: str) -> None:
+    """캐시 버전 1 증가 (행이 없으면 생성, 커밋하지 않음)"""
+    stmt = pg_insert(CacheVersion).values(name=name, version=1)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CacheVersion.name],
+        set_={"version": CacheVersion.version + 1}
+    )
+    db.execute(stmt)
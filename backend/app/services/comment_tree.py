@@ -0,0 +1,104 @@
+"""
+댓글 트리 로더
+- 게시글의 댓글 트리(또는 최상위 댓글 한 페이지와 그 하위 답글 전체)를 재귀 CTE 한 번으로 조회
+- 조회한 행을 (created_at, comment_id) 순서로 한 번 훑어 부모-자식 관계를 메모리에서 O(n)으로 구성하고,
+  각 댓글의 replies 관계에 채워 넣어 응답 변환 중 추가(lazy) 쿼리가 생기지 않도록 함
+- 최상위 댓글은 (created_at, comment_id) 오름차순 커서 페이지네이션 지원 (app.services.pagination)
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
+from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy import and_, select, tuple_
+from app.models.board import Comment
+from app.models.user import User
+from app.services import pagination
+
+
+def get_root_page(
+    db: Session,
+    post_id: int,
+    after: Optional[Tuple[datetime, int]],
+    page_size: int
+) -> Tuple[List[int], Optional[str], bool]:
+    """
+    최상위 댓글 한 페이지 (작성순)
+    - ix_comments_post_roots 부분 인덱스 사용
+
+    Args:
+        after: 이전 페이지 마지막 댓글의 (created_at, comment_id), 첫 페이지는 None
+
+    Returns:
+        (최상위 댓글 ID 목록, 다음 커서, 다음 페이지 존재 여부)
+    """
+    query = db.query(Comment.comment_id, Comment.created_at).filter(
+        and_(
+            Comment.post_id == post_id,
+            Comment.parent_comment_id.is_(None)
+        )
+    )
+    if after is not None:
+        query = query.filter(tuple_(Comment.created_at, Comment.comment_id) > tuple_(*after))
+    rows = query.order_by(Comment.created_at, Comment.comment_id).limit(page_size + 1).all()
+    rows, next_cursor, has_more = pagination.next_cursor_for(rows, page_size, "created_at", "comment_id")
+    return [row.comment_id for row in rows], next_cursor, has_more
+
+
+def load_comment_tree(db: Session, post_id: int, root_ids: Optional[Sequence[int]] = None) -> List[Comment]:
+    """
+    댓글 트리 조회 (재귀 CTE 한 번, 작성자/칭호 함께 로드)
+
+    Args:
+        root_ids: 포함할 최상위 댓글 ID (None이면 게시글의 전체 댓글)
+
+    Returns:
+        최상위 댓글 목록 (작성순), 각 댓글의 replies에 하위 답글이 작성순으로 채워짐
+    """
+    if root_ids is not None and not root_ids:
+        return []
+
+    seed = select(Comment.comment_id).where(
+        and_(
+            Comment.post_id == post_id,
+            Comment.parent_comment_id.is_(None)
+        )
+    )
+    if root_ids is not None:
+        seed = seed.where(Comment.comment_id.in_(list(root_ids)))
+    tree = seed.cte("comment_tree", recursive=True)
+    child = aliased(Comment)
+    tree = tree.union_all(
+        select(child.comment_id).where(
+            and_(
+                child.parent_comment_id == tree.c.comment_id,
+                child.post_id == post_id
+            )
+        )
+    )
+
+    comments = db.query(Comment).join(
+        tree, Comment.comment_id == tree.c.comment_id
+    ).options(
+        joinedload(Comment.user).joinedload(User.selected_achievement)
+    ).order_by(Comment.created_at, Comment.comment_id).all()
+
+    return assemble_tree(comments)
+
+
+def assemble_tree(comments: List[Comment]) -> List[Comment]:
+    """
+    작성순으로 정렬된 댓글 목록을 트리로 구성 (O(n))
+    - 부모가 목록에 없는 답글은 버림 (다른 페이지의 트리)
+    """
+    children: Dict[int, List[Comment]] = {comment.comment_id: [] for comment in comments}
+    roots: List[Comment] = []
+    for comment in comments:
+        if comment.parent_comment_id is None:
+            roots.append(comment)
+        elif comment.parent_comment_id in children:
+            children[comment.parent_comment_id].append(comment)
+
+    for comment in comments:
+        # 이미 조회한 자식으로 관계를 채워 lazy load 방지
+        set_committed_value(comment, "replies", children[comment.comment_id])
+    return roots
@@ -0,0 +1,434 @@
+"""
+리더보드 서비스
+- 그룹별, 주요 악기별 연습 시간 순위를 일/주/월/전체 기간 단위로 leaderboard_entries 에 유지
+- 세션 종료/삭제 시 사용자가 속한 범위 x 기간 항목을 INSERT ... ON CONFLICT 한 번으로 증분 갱신
+- 그룹 가입/탈퇴, 주요 악기 변경 시 해당 범위 항목만 일일 합계에서 다시 채움
+- 순위표 페이지는 (범위, 기간, total_seconds DESC, user_id) 인덱스를 커서(keyset)로 이어서 읽음 (OFFSET/COUNT 없음)
+  - 커서에 마지막 행의 순위와 위치를 담아 다음 페이지 순위를 이어서 계산
+- 내 순위는 같은 인덱스에서 나보다 연습 시간이 많은 항목 수를 세어 계산 (index-only 범위 스캔, 전체 정렬 없음)
+  - PostgreSQL B-tree에는 순위(order statistic) 조회가 없어 O(log n)이 아니라 O(순위)이며,
+    범위(그룹/악기) 하나의 항목 수가 수만 건 수준이면 충분히 빠름 (더 커지면 점수 구간별 인원 집계 테이블 필요)
+
+    python -m app.services.leaderboard rebuild
+    python -m app.services.leaderboard prune
+"""
+import base64
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import Date, and_, cast, func, literal, literal_column, or_, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.user import User, UserProfile
+from app.models.user_profile import UserProfileInstrument
+from app.models.group import GroupMember
+from app.models.practice import PracticeSession, PracticeDailyTotal
+from app.models.leaderboard import LeaderboardEntry
+
+logger = logging.getLogger(__name__)
+
+SCOPE_GROUP = "group"
+SCOPE_INSTRUMENT = "instrument"
+PERIOD_TYPES = ("day", "week", "month", "all")
+ALL_TIME_START = date(1970, 1, 1)
+DAY_RETENTION_DAYS = 35  # 일 단위 순위표 보관 기간 (prune 시 삭제)
+
+
+@dataclass(frozen=True)
+class LeaderboardRow:
+    """순위표 한 줄"""
+    rank: int
+    user_id: int
+    nickname: str
+    profile_image_url: Optional[str]
+    total_seconds: int
+
+
+def period_start_for(period_type: str, day: date) -> date:
+    """day가 속한 기간의 시작일"""
+    if period_type == "day":
+        return day
+    if period_type == "week":
+        return day - timedelta(days=day.weekday())  # 월요일
+    if period_type == "month":
+        return day.replace(day=1)
+    if period_type == "all":
+        return ALL_TIME_START
+    raise ValueError(f"지원하지 않는 기간입니다: {period_type}")
+
+
+def _period_start_expr(period_type: str):
+    """일일 합계 날짜를 기간 시작일로 바꾸는 SQL 식"""
+    if period_type == "day":
+        return PracticeDailyTotal.practice_date
+    if period_type == "all":
+        return literal(ALL_TIME_START, Date)
+    return cast(func.date_trunc(literal_column(f"'{period_type}'"), PracticeDailyTotal.practice_date), Date)
+
+
+def _group_scopes():
+    """(scope_type, scope_id, user_id) - 그룹 멤버"""
+    return select(
+        literal(SCOPE_GROUP).label("scope_type"),
+        GroupMember.group_id.label("scope_id"),
+        GroupMember.user_id.label("user_id")
+    )
+
+
+def _instrument_scopes():
+    """(scope_type, scope_id, user_id) - 주요 악기"""
+    return select(
+        literal(SCOPE_INSTRUMENT).label("scope_type"),
+        UserProfileInstrument.instrument_id.label("scope_id"),
+        UserProfile.user_id.label("user_id")
+    ).join(
+        UserProfile, UserProfile.profile_id == UserProfileInstrument.profile_id
+    ).where(UserProfileInstrument.is_primary.is_(True))
+
+
+def _populate(db: Session, scopes) -> int:
+    """
+    (scope_type, scope_id, user_id) 목록에 대한 순위표 항목을 일일 합계에서 채움 (커밋하지 않음)
+    - 기간 종류마다 INSERT ... SELECT 한 번, 이미 있는 항목은 덮어씀
+    """
+    scopes = scopes.subquery("scopes")
+    day_since = date.today() - timedelta(days=DAY_RETENTION_DAYS)
+    inserted = 0
+    for period_type in PERIOD_TYPES:
+        period_start = _period_start_expr(period_type)
+        source = select(
+            scopes.c.scope_type,
+            scopes.c.scope_id,
+            literal(period_type),
+            period_start,
+            scopes.c.user_id,
+            func.sum(PracticeDailyTotal.total_seconds)
+        ).join_from(
+            scopes, PracticeDailyTotal, PracticeDailyTotal.user_id == scopes.c.user_id
+        )
+        if period_type == "day":
+            source = source.where(PracticeDailyTotal.practice_date >= day_since)
+
+        group_by = [scopes.c.scope_type, scopes.c.scope_id, scopes.c.user_id]
+        if period_type != "all":
+            group_by.append(period_start)
+        source = source.group_by(*group_by)
+
+        stmt = pg_insert(LeaderboardEntry).from_select(
+            ["scope_type", "scope_id", "period_type", "period_start", "user_id", "total_seconds"],
+            source
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                LeaderboardEntry.scope_type, LeaderboardEntry.scope_id, LeaderboardEntry.period_type,
+                LeaderboardEntry.period_start, LeaderboardEntry.user_id
+            ],
+            set_={"total_seconds": stmt.excluded.total_seconds, "updated_at": func.now()}
+        )
+        inserted += db.execute(stmt).rowcount
+    return inserted
+
+
+# ========== 증분 갱신 ==========
+
+def _user_scopes(db: Session, user_id: int) -> List[Tuple[str, int]]:
+    """사용자가 속한 (scope_type, scope_id) 목록을 한 번의 쿼리로 조회"""
+    scopes = union_all(
+        _group_scopes().where(GroupMember.user_id == user_id),
+        _instrument_scopes().where(UserProfile.user_id == user_id)
+    )
+    return [(row.scope_type, row.scope_id) for row in db.execute(scopes)]
+
+
+def _apply_delta(db: Session, user_id: int, practice_date: date, delta: int) -> None:
+    """사용자가 속한 모든 범위 x 기간 항목에 연습 시간 증감 반영 (커밋하지 않음)"""
+    if not delta:
+        return
+    scopes = _user_scopes(db, user_id)
+    if not scopes:
+        return
+
+    rows = [
+        {
+            "scope_type": scope_type,
+            "scope_id": scope_id,
+            "period_type": period_type,
+            "period_start": period_start_for(period_type, practice_date),
+            "user_id": user_id,
+            "total_seconds": max(delta, 0),
+        }
+        for scope_type, scope_id in scopes
+        for period_type in PERIOD_TYPES
+    ]
+    stmt = pg_insert(LeaderboardEntry).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            LeaderboardEntry.scope_type, LeaderboardEntry.scope_id, LeaderboardEntry.period_type,
+            LeaderboardEntry.period_start, LeaderboardEntry.user_id
+        ],
+        set_={
+            "total_seconds": func.greatest(LeaderboardEntry.total_seconds + delta, 0),
+            "updated_at": func.now(),
+        }
+    )
+    db.execute(stmt)
+
+
+def apply_session_completed(db: Session, session: PracticeSession) -> None:
+    """세션 종료 시 순위표 증분 갱신 (호출한 쪽의 트랜잭션 안에서 실행)"""
+    _apply_delta(db, session.user_id, session.practice_date, session.actual_play_time or 0)
+
+
+def apply_session_deleted(db: Session, session: PracticeSession) -> None:
+    """완료된 세션 삭제 시 순위표 증분 갱신 (호출한 쪽의 트랜잭션 안에서 실행)"""
+    if session.status != "completed":
+        return
+    _apply_delta(db, session.user_id, session.practice_date, -(session.actual_play_time or 0))
+
+
+def add_group_member(db: Session, group_id: int, user_id: int) -> None:
+    """그룹 가입 시 멤버의 기존 연습 기록으로 그룹 순위표 항목 생성 (GroupMember flush 이후 호출)"""
+    _populate(db, _group_scopes().where(
+        and_(GroupMember.group_id == group_id, GroupMember.user_id == user_id)
+    ))
+
+
+def remove_group_member(db: Session, group_id: int, user_id: int) -> None:
+    """그룹 탈퇴 시 그룹 순위표에서 제거"""
+    db.query(LeaderboardEntry).filter(
+        and_(
+            LeaderboardEntry.scope_type == SCOPE_GROUP,
+            LeaderboardEntry.scope_id == group_id,
+            LeaderboardEntry.user_id == user_id
+        )
+    ).delete(synchronize_session=False)
+
+
+def remove_group(db: Session, group_id: int) -> None:
+    """그룹 삭제 시 그룹 순위표 전체 제거"""
+    db.query(LeaderboardEntry).filter(
+        and_(
+            LeaderboardEntry.scope_type == SCOPE_GROUP,
+            LeaderboardEntry.scope_id == group_id
+        )
+    ).delete(synchronize_session=False)
+
+
+def refresh_user_instrument(db: Session, user_id: int) -> None:
+    """주요 악기 변경 시 악기 순위표 항목을 새 주요 악기로 다시 생성 (악기 관계 flush 이후 호출)"""
+    db.query(LeaderboardEntry).filter(
+        and_(
+            LeaderboardEntry.scope_type == SCOPE_INSTRUMENT,
+            LeaderboardEntry.user_id == user_id
+        )
+    ).delete(synchronize_session=False)
+    _populate(db, _instrument_scopes().where(UserProfile.user_id == user_id))
+
+
+def remove_user(db: Session, user_id: int) -> None:
+    """탈퇴한 사용자를 모든 순위표에서 제거"""
+    db.query(LeaderboardEntry).filter(
+        LeaderboardEntry.user_id == user_id
+    ).delete(synchronize_session=False)
+
+
+# ========== 조회 ==========
+
+def _board_filter(scope_type: str, scope_id: int, period_type: str, period_start: date):
+    return and_(
+        LeaderboardEntry.scope_type == scope_type,
+        LeaderboardEntry.scope_id == scope_id,
+        LeaderboardEntry.period_type == period_type,
+        LeaderboardEntry.period_start == period_start,
+        LeaderboardEntry.total_seconds > 0
+    )
+
+
+def _count_above(db: Session, board_filter, total_seconds: int) -> int:
+    """연습 시간이 더 많은 항목 수 (인덱스 범위 조회, 순위에 비례하는 비용)"""
+    return db.query(func.count()).select_from(LeaderboardEntry).filter(
+        and_(board_filter, LeaderboardEntry.total_seconds > total_seconds)
+    ).scalar() or 0
+
+
+def encode_cursor(row: LeaderboardRow, position: int) -> str:
+    """마지막 행의 (total_seconds, user_id, 순위, 위치)를 커서 문자열로 인코딩"""
+    raw = f"{row.total_seconds}|{row.user_id}|{row.rank}|{position}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, int, int, int]:
+    """
+    커서 문자열을 (total_seconds, user_id, 순위, 위치)로 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        total_seconds, user_id, rank, position = (
+            int(value) for value in base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|")
+        )
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+    if rank < 1 or position < rank:
+        raise ValueError(f"잘못된 커서입니다: {cursor}")
+    return total_seconds, user_id, rank, position
+
+
+def get_leaderboard(
+    db: Session,
+    scope_type: str,
+    scope_id: int,
+    period_type: str,
+    day: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20
+) -> Tuple[List[LeaderboardRow], Optional[str]]:
+    """
+    순위표 한 페이지 조회 (동점은 같은 순위, 다음 순위는 건너뜀)
+    - 커서 다음 행부터 (total_seconds DESC, user_id) 순서로 limit개를 인덱스에서 바로 읽음
+    - 순위는 커서의 마지막 순위/위치에서 이어서 계산하므로 페이지가 깊어져도 추가 쿼리 없음
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+
+    Returns:
+        (순위 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    period_start = period_start_for(period_type, day or date.today())
+    board_filter = _board_filter(scope_type, scope_id, period_type, period_start)
+
+    query = db.query(
+        LeaderboardEntry.user_id,
+        LeaderboardEntry.total_seconds,
+        User.nickname,
+        User.profile_image_url
+    ).join(
+        User, User.user_id == LeaderboardEntry.user_id
+    ).filter(board_filter)
+
+    previous_total, rank, position = None, 0, 0
+    if cursor:
+        previous_total, cursor_user_id, rank, position = decode_cursor(cursor)
+        # total_seconds <= 커서 조건이 인덱스 범위가 되고, 같은 연습 시간 안에서는 user_id로 이어서 읽음
+        query = query.filter(
+            LeaderboardEntry.total_seconds <= previous_total,
+            or_(
+                LeaderboardEntry.total_seconds < previous_total,
+                LeaderboardEntry.user_id > cursor_user_id
+            )
+        )
+
+    rows = query.order_by(
+        LeaderboardEntry.total_seconds.desc(),
+        LeaderboardEntry.user_id
+    ).limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    result = []
+    for row in rows:
+        position += 1
+        total_seconds = int(row.total_seconds)
+        if total_seconds != previous_total:
+            rank = position
+            previous_total = total_seconds
+        result.append(LeaderboardRow(
+            rank=rank,
+            user_id=row.user_id,
+            nickname=row.nickname,
+            profile_image_url=row.profile_image_url,
+            total_seconds=total_seconds
+        ))
+    next_cursor = encode_cursor(result[-1], position) if has_more else None
+    return result, next_cursor
+
+
+def get_user_rank(
+    db: Session,
+    scope_type: str,
+    scope_id: int,
+    period_type: str,
+    user_id: int,
+    day: Optional[date] = None
+) -> Optional[LeaderboardRow]:
+    """
+    사용자의 순위 조회 (기록이 없으면 None)
+    - 순위 = 연습 시간이 더 많은 항목 수 + 1 (_count_above, 비용은 순위에 비례)
+    """
+    period_start = period_start_for(period_type, day or date.today())
+    board_filter = _board_filter(scope_type, scope_id, period_type, period_start)
+
+    row = db.query(
+        LeaderboardEntry.total_seconds,
+        User.nickname,
+        User.profile_image_url
+    ).join(
+        User, User.user_id == LeaderboardEntry.user_id
+    ).filter(
+        and_(board_filter, LeaderboardEntry.user_id == user_id)
+    ).first()
+    if row is None:
+        return None
+
+    total_seconds = int(row.total_seconds)
+    return LeaderboardRow(
+        rank=_count_above(db, board_filter, total_seconds) + 1,
+        user_id=user_id,
+        nickname=row.nickname,
+        profile_image_url=row.profile_image_url,
+        total_seconds=total_seconds
+    )
+
+
+# ========== 일괄 작업 ==========
+
+def rebuild_all_leaderboards(db: Session) -> int:
+    """
+    전체 순위표를 일일 합계에서 다시 생성 (백필)
+
+    Returns:
+        생성된 항목 수
+    """
+    db.query(LeaderboardEntry).delete(synchronize_session=False)
+    count = _populate(db, union_all(_group_scopes(), _instrument_scopes()))
+    db.commit()
+    logger.info(f"리더보드 재계산 완료: rows={count}")
+    return count
+
+
+def prune_expired_entries(db: Session) -> int:
+    """보관 기간이 지난 일 단위 순위표 삭제"""
+    deleted = db.query(LeaderboardEntry).filter(
+        and_(
+            LeaderboardEntry.period_type == "day",
+            LeaderboardEntry.period_start < date.today() - timedelta(days=DAY_RETENTION_DAYS)
+        )
+    ).delete(synchronize_session=False)
+    db.commit()
+    logger.info(f"만료된 리더보드 항목 삭제: rows={deleted}")
+    return deleted
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 전체 재계산 또는 만료 항목 정리
+    from app.core.database import SessionLocal
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("rebuild", "prune"):
+        print("사용법: python -m app.services.leaderboard [rebuild|prune]")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        if sys.argv[1] == "rebuild":
+            count = rebuild_all_leaderboards(db)
+            print(f"✅ 리더보드가 재계산되었습니다. (항목 {count}개)")
+        else:
+            count = prune_expired_entries(db)
+            print(f"✅ 만료된 리더보드 항목이 삭제되었습니다. (항목 {count}개)")
+    finally:
+        db.close()
@@ -0,0 +1,100 @@
+"""
+읽지 않은 알림 수 카운터 서비스
+- users.unread_notification_count: 읽지 않은 알림 수 (알림 배지용, 매 요청 COUNT 대신 사용)
+- 알림 생성(notification_outbox 디스패처)과 읽음 처리 시 UPDATE ... SET ± n 으로 원자적으로 갱신
+  (users.updated_at은 프로필 변경 시간이므로 카운터 갱신으로 바뀌지 않도록 유지)
+- 게시글 삭제로 알림이 함께 삭제되는 등 어긋난 값은 재계산 작업으로 일괄 보정 (주기 실행용 명령)
+
+    python -m app.services.notification_counters reconcile
+"""
+import logging
+import sys
+from typing import Dict, Optional, Sequence
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select, text
+from app.models.user import User
+from app.models.notification import Notification
+
+logger = logging.getLogger(__name__)
+
+
+def increment_unread_counts(db: Session, counts: Dict[int, int]) -> None:
+    """수신자별 읽지 않은 알림 수를 한 번의 UPDATE로 증가 (커밋하지 않음)"""
+    counts = {user_id: count for user_id, count in counts.items() if count}
+    if not counts:
+        return
+    user_ids = list(counts.keys())
+    db.execute(text("""
+        UPDATE users u
+        SET unread_notification_count = u.unread_notification_count + v.n
+        FROM unnest(CAST(:user_ids AS integer[]), CAST(:counts AS integer[])) AS v(user_id, n)
+        WHERE u.user_id = v.user_id
+    """), {"user_ids": user_ids, "counts": [counts[user_id] for user_id in user_ids]})
+
+
+def decrement_unread_count(db: Session, user_id: int, amount: int = 1) -> None:
+    """읽지 않은 알림 수 감소, 0 미만으로 내려가지 않음 (커밋하지 않음)"""
+    if amount <= 0:
+        return
+    db.query(User).filter(User.user_id == user_id).update(
+        {
+            User.unread_notification_count: func.greatest(User.unread_notification_count - amount, 0),
+            User.updated_at: User.updated_at
+        },
+        synchronize_session=False
+    )
+
+
+def reconcile_unread_counts(db: Session, user_ids: Optional[Sequence[int]] = None) -> int:
+    """
+    실제 읽지 않은 알림 수와 다른 users.unread_notification_count를 한 번의 UPDATE ... FROM 으로 보정
+    - user_ids가 없으면 전체 사용자 대상
+    - 값이 이미 같은 행은 갱신하지 않음
+
+    Returns:
+        보정된 사용자 수
+    """
+    counts = select(
+        User.user_id.label("user_id"),
+        func.count(Notification.notification_id).label("actual")
+    ).select_from(User).outerjoin(
+        Notification,
+        and_(
+            Notification.receiver_id == User.user_id,
+            Notification.is_read == False
+        )
+    )
+    if user_ids is not None:
+        if not user_ids:
+            return 0
+        counts = counts.where(User.user_id.in_(list(user_ids)))
+    counts = counts.group_by(User.user_id).subquery()
+
+    result = db.execute(
+        User.__table__.update().where(
+            and_(
+                User.user_id == counts.c.user_id,
+                User.unread_notification_count.is_distinct_from(counts.c.actual)
+            )
+        ).values(unread_notification_count=counts.c.actual, updated_at=User.updated_at)
+    )
+    db.commit()
+    if result.rowcount:
+        logger.warning(f"읽지 않은 알림 수 보정: users={result.rowcount}")
+    return result.rowcount
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 전체 사용자 읽지 않은 알림 수 보정
+    from app.core.database import SessionLocal
+
+    if len(sys.argv) < 2 or sys.argv[1] != "reconcile":
+        print("사용법: python -m app.services.notification_counters reconcile")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        count = reconcile_unread_counts(db)
+        print(f"✅ 읽지 않은 알림 수가 보정되었습니다. (사용자 {count}개)")
+    finally:
+        db.close()
@@ -0,0 +1,53 @@
+"""
+알림 응답 변환 서비스
+- 알림 목록 API와 실시간 푸시(app.services.notification_push)가 같은 응답 형식을 사용
+"""
+from typing import List, Sequence
+from sqlalchemy.orm import Session
+from app.models.user import User
+from app.models.notification import Notification
+from app.schemas.notification import NotificationResponse
+
+
+def build_notification_responses(db: Session, notifications: List[Notification]) -> List[NotificationResponse]:
+    """
+    Notification 목록을 응답으로 변환
+    - 발신자/묶음 알림의 최근 발신자 닉네임은 IN 쿼리 한 번으로 조회 (알림별 sender 지연 로딩 방지)
+    """
+    user_ids = set()
+    for n in notifications:
+        if n.sender_id:
+            user_ids.add(n.sender_id)
+        user_ids.update(n.recent_sender_ids or [])
+    nicknames = {}
+    if user_ids:
+        nicknames = dict(db.query(User.user_id, User.nickname).filter(User.user_id.in_(user_ids)).all())
+
+    return [
+        NotificationResponse(
+            notification_id=n.notification_id,
+            receiver_id=n.receiver_id,
+            sender_id=n.sender_id,
+            sender_nickname=nicknames.get(n.sender_id),
+            actor_count=n.actor_count or 1,
+            recent_sender_nicknames=[
+                nicknames[user_id] for user_id in (n.recent_sender_ids or []) if user_id in nicknames
+            ],
+            type=n.type,
+            post_id=n.post_id,
+            comment_id=n.comment_id,
+            content=n.content,
+            is_read=n.is_read,
+            created_at=n.created_at
+        ) for n in notifications
+    ]
+
+
+def load_notification_responses(db: Session, notification_ids: Sequence[int]) -> List[NotificationResponse]:
+    """알림 ID 목록으로 응답 조회 (최신순)"""
+    if not notification_ids:
+        return []
+    notifications = db.query(Notification).filter(
+        Notification.notification_id.in_(list(notification_ids))
+    ).order_by(Notification.created_at.desc(), Notification.notification_id.desc()).all()
+    return build_notification_responses(db, notifications)
@@ -0,0 +1,423 @@
+"""
+알림 outbox 서비스
+- 요청 처리 중에는 enqueue()로 notification_events에 이벤트 한 행만 추가 (요청 트랜잭션과 함께 커밋)
+- 디스패처가 처리 대기 이벤트를 FOR UPDATE SKIP LOCKED로 일괄 가져와
+  수신자/내용을 계산해 Notification 행으로 펼치고, 같은 배치 안의 중복 알림은 하나로 합침
+- 좋아요/댓글/답글 알림은 읽지 않은 (수신자, 종류, 게시글) 알림 한 행에 묶어 갱신 ("X님 외 N명")
+- 새로 추가된 알림만큼 수신자의 읽지 않은 알림 수 증가 (app.services.notification_counters)
+- 생성/갱신된 알림은 같은 트랜잭션에서 pg_notify로 발행 (app.services.notification_push)
+  (여러 워커/프로세스에서 디스패처를 동시에 돌려도 같은 이벤트를 두 번 처리하지 않음)
+- 실행 방식
+  - API 프로세스 안의 백그라운드 스레드 (settings.NOTIFICATION_DISPATCHER_ENABLED, 앱 시작 시 start_dispatcher)
+  - 별도 프로세스: python -m app.services.notification_outbox run   (한 번만 처리: once)
+- 처리 지연(lag) 지표: get_outbox_metrics() (관리자 API /api/admin/notifications/outbox)
+"""
+import logging
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, literal_column, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.board import Post, Comment
+from app.models.notification import AGGREGATED_TYPES, MAX_RECENT_SENDERS, Notification, NotificationEvent
+from app.services import notification_counters, notification_push
+
+logger = logging.getLogger(__name__)
+
+EVENT_POST_LIKED = "post_liked"
+EVENT_COMMENT_CREATED = "comment_created"
+EVENT_POST_HIDDEN = "post_hidden"
+
+EXCELLENT_POST_LIKES = 30  # 우수 게시글 알림 기준 좋아요 수
+MAX_ATTEMPTS = 5  # 이 횟수만큼 실패한 이벤트는 더 이상 가져오지 않음 (last_error 확인 후 수동 처리)
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_INTERVAL = 1.0  # 초, 처리할 이벤트가 없을 때 대기 시간
+
+
+def enqueue(
+    db: Session,
+    event_type: str,
+    actor_id: Optional[int] = None,
+    post_id: Optional[int] = None,
+    comment_id: Optional[int] = None,
+    payload: Optional[dict] = None
+) -> None:
+    """알림 이벤트 추가 (커밋하지 않음, 요청 트랜잭션과 함께 커밋)"""
+    db.add(NotificationEvent(
+        event_type=event_type,
+        actor_id=actor_id,
+        post_id=post_id,
+        comment_id=comment_id,
+        payload=payload
+    ))
+
+
+def _summary(value: Optional[str], length: int = 50) -> str:
+    """알림 내용 요약 (최대 length자)"""
+    value = value or ""
+    return (value[:length] + '...') if len(value) > length else value
+
+
+def _expand(db: Session, events: List[NotificationEvent]) -> Tuple[List[dict], List[dict]]:
+    """
+    이벤트 목록을 (일반 알림 행, 묶음 알림 행)으로 펼침
+    - 게시글/댓글/부모 댓글은 종류별 IN 쿼리 한 번씩 조회
+    - 일반 알림: (수신자, 발신자, 종류, 게시글, 댓글)이 같은 알림은 하나로 합침
+    - 묶음 알림(AGGREGATED_TYPES): (수신자, 종류, 게시글) 단위로 합침
+    - 대상이 삭제되었거나 본인 행동에 대한 알림은 만들지 않음
+    """
+    post_ids = {e.post_id for e in events if e.post_id}
+    comment_ids = {e.comment_id for e in events if e.comment_id}
+
+    posts: Dict[int, Tuple[int, str]] = {}
+    if post_ids:
+        posts = {
+            row.post_id: (row.user_id, row.title)
+            for row in db.query(Post.post_id, Post.user_id, Post.title).filter(
+                and_(Post.post_id.in_(post_ids), Post.deleted_at.is_(None))
+            )
+        }
+
+    comments: Dict[int, Tuple[int, Optional[int], str]] = {}
+    if comment_ids:
+        comments = {
+            row.comment_id: (row.user_id, row.parent_comment_id, row.content)
+            for row in db.query(Comment.comment_id, Comment.user_id, Comment.parent_comment_id, Comment.content).filter(
+                Comment.comment_id.in_(comment_ids)
+            )
+        }
+    parent_ids = {parent_id for _, parent_id, _ in comments.values() if parent_id}
+    parent_owners: Dict[int, int] = {}
+    if parent_ids:
+        parent_owners = dict(
+            db.query(Comment.comment_id, Comment.user_id).filter(Comment.comment_id.in_(parent_ids)).all()
+        )
+
+    rows: Dict[tuple, dict] = {}
+    grouped: Dict[tuple, dict] = {}
+
+    def _add(receiver_id, sender_id, type_, post_id, comment_id, content):
+        if receiver_id is None or receiver_id == sender_id:
+            return
+        if type_ in AGGREGATED_TYPES:
+            # 묶음 알림: 배치 안에서 먼저 (수신자, 종류, 게시글) 단위로 합침 (나중 이벤트가 최신)
+            key = (receiver_id, type_, post_id)
+            row = grouped.get(key)
+            if row is None:
+                row = grouped[key] = {
+                    "receiver_id": receiver_id,
+                    "type": type_,
+                    "post_id": post_id,
+                    "recent_sender_ids": [],
+                }
+            if sender_id in row["recent_sender_ids"]:
+                row["recent_sender_ids"].remove(sender_id)
+            row["recent_sender_ids"].insert(0, sender_id)
+            row.update(sender_id=sender_id, comment_id=comment_id, content=content)
+            return
+        key = (receiver_id, sender_id, type_, post_id, comment_id)
+        if key not in rows:
+            rows[key] = {
+                "receiver_id": receiver_id,
+                "sender_id": sender_id,
+                "type": type_,
+                "post_id": post_id,
+                "comment_id": comment_id,
+                "content": content,
+            }
+
+    for event in events:
+        post = posts.get(event.post_id)
+        if post is None:
+            continue
+        owner_id, title = post
+
+        if event.event_type == EVENT_POST_LIKED:
+            if owner_id == event.actor_id:
+                continue
+            _add(owner_id, event.actor_id, "like", event.post_id, None, _summary(title))
+            if (event.payload or {}).get("like_count") == EXCELLENT_POST_LIKES:
+                _add(owner_id, None, "excellent_post", event.post_id, None, _summary(title))
+
+        elif event.event_type == EVENT_COMMENT_CREATED:
+            comment = comments.get(event.comment_id)
+            if comment is None:
+                continue
+            _, parent_id, content = comment
+            # 게시글 작성자 알림
+            _add(owner_id, event.actor_id, "comment", event.post_id, event.comment_id, _summary(title))
+            # 답글인 경우 원댓글 작성자 알림 (게시글 작성자와 같아도 둘 다 보냄)
+            if parent_id:
+                _add(parent_owners.get(parent_id), event.actor_id, "reply", event.post_id, event.comment_id, content[:50])
+
+        elif event.event_type == EVENT_POST_HIDDEN:
+            _add(owner_id, None, "report_hidden", event.post_id, None, _summary(title))
+
+        else:
+            logger.warning(f"알 수 없는 알림 이벤트: event_id={event.event_id}, type={event.event_type}")
+
+    for row in grouped.values():
+        row["actor_count"] = len(row["recent_sender_ids"])
+        row["recent_sender_ids"] = row["recent_sender_ids"][:MAX_RECENT_SENDERS]
+    return list(rows.values()), list(grouped.values())
+
+
+# 기존 읽지 않은 묶음 알림과 합칠 때의 발신자 수/최근 발신자 계산
+# - 이미 최근 발신자 목록에 있는 사용자(예: 좋아요 취소 후 다시 좋아요)는 다시 세지 않음
+#   (목록 밖의 오래된 발신자가 다시 발생시키면 한 번 더 세어질 수 있음)
+_MERGED_ACTOR_COUNT = literal_column(
+    "notifications.actor_count + excluded.actor_count - ("
+    "SELECT count(*) FROM unnest(excluded.recent_sender_ids) AS s(id) "
+    "WHERE s.id = ANY(coalesce(notifications.recent_sender_ids, '{}')))"
+)
+_MERGED_RECENT_SENDERS = literal_column(
+    "ARRAY(SELECT id FROM unnest(excluded.recent_sender_ids || coalesce(notifications.recent_sender_ids, '{}')) "
+    "WITH ORDINALITY AS t(id, ord) GROUP BY id ORDER BY min(ord) LIMIT %d)" % MAX_RECENT_SENDERS
+)
+
+
+def _upsert_grouped(db: Session, grouped: List[dict]) -> list:
+    """
+    묶음 알림 저장 (읽지 않은 같은 (수신자, 종류, 게시글) 알림이 있으면 그 행을 갱신)
+
+    Returns:
+        (notification_id, receiver_id, inserted) 행 목록
+        (inserted가 False면 기존 행에 합쳐진 것이므로 읽지 않은 알림 수가 늘지 않음)
+    """
+    statement = pg_insert(Notification).values(grouped)
+    excluded = statement.excluded
+    statement = statement.on_conflict_do_update(
+        index_elements=[Notification.receiver_id, Notification.type, Notification.post_id],
+        index_where=text("is_read = false AND type IN ('like', 'comment', 'reply')"),
+        set_={
+            "sender_id": excluded.sender_id,
+            "comment_id": excluded.comment_id,
+            "content": excluded.content,
+            "actor_count": _MERGED_ACTOR_COUNT,
+            "recent_sender_ids": _MERGED_RECENT_SENDERS,
+            "created_at": func.localtimestamp(),
+        }
+    ).returning(
+        Notification.notification_id,
+        Notification.receiver_id,
+        literal_column("(xmax = 0)").label("inserted")
+    )
+    return db.execute(statement).all()
+
+
+# ========== 디스패처 ==========
+
+@dataclass
+class DispatchResult:
+    """배치 처리 결과"""
+    events: int = 0
+    notifications: int = 0
+
+
+_stats_lock = threading.Lock()
+_stats = {
+    "batches": 0,
+    "events": 0,
+    "notifications": 0,
+    "failures": 0,
+    "last_batch_ms": 0.0,
+    "last_dispatch_at": None,
+    "last_error": None,
+}
+
+
+def _record_stats(result: DispatchResult, elapsed_ms: float, error: Optional[str] = None) -> None:
+    with _stats_lock:
+        if error is not None:
+            _stats["failures"] += 1
+            _stats["last_error"] = error
+            return
+        _stats["batches"] += 1
+        _stats["events"] += result.events
+        _stats["notifications"] += result.notifications
+        _stats["last_batch_ms"] = round(elapsed_ms, 3)
+        _stats["last_dispatch_at"] = datetime.utcnow().isoformat()
+
+
+def dispatch_batch(db: Session, batch_size: int = DEFAULT_BATCH_SIZE) -> DispatchResult:
+    """
+    처리 대기 이벤트 한 배치를 알림으로 펼치고 처리 완료 표시 (커밋 포함)
+    - 실패하면 롤백 후 해당 이벤트의 attempts/last_error만 기록
+    """
+    started = time.perf_counter()
+    events = db.query(NotificationEvent).filter(
+        and_(
+            NotificationEvent.processed_at.is_(None),
+            NotificationEvent.attempts < MAX_ATTEMPTS
+        )
+    ).order_by(NotificationEvent.event_id).limit(batch_size).with_for_update(skip_locked=True).all()
+    if not events:
+        db.rollback()
+        return DispatchResult()
+
+    event_ids = [event.event_id for event in events]
+    try:
+        rows, grouped = _expand(db, events)
+        unread = Counter()
+        notification_ids: Dict[int, List[int]] = {}
+        if rows:
+            for row in db.execute(
+                pg_insert(Notification).values(rows).returning(Notification.notification_id, Notification.receiver_id)
+            ):
+                unread[row.receiver_id] += 1
+                notification_ids.setdefault(row.receiver_id, []).append(row.notification_id)
+        if grouped:
+            for row in _upsert_grouped(db, grouped):
+                if row.inserted:
+                    unread[row.receiver_id] += 1
+                notification_ids.setdefault(row.receiver_id, []).append(row.notification_id)
+        notification_counters.increment_unread_counts(db, unread)
+        # 커밋될 때 접속 중인 사용자에게 실시간 전달 (app.services.notification_push)
+        notification_push.publish_notifications(db, notification_ids)
+        db.query(NotificationEvent).filter(NotificationEvent.event_id.in_(event_ids)).update(
+            {
+                NotificationEvent.processed_at: func.localtimestamp(),
+                NotificationEvent.attempts: NotificationEvent.attempts + 1,
+            },
+            synchronize_session=False
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        error = str(e)[:1000]
+        db.query(NotificationEvent).filter(NotificationEvent.event_id.in_(event_ids)).update(
+            {
+                NotificationEvent.attempts: NotificationEvent.attempts + 1,
+                NotificationEvent.last_error: error,
+            },
+            synchronize_session=False
+        )
+        db.commit()
+        _record_stats(DispatchResult(), 0.0, error)
+        logger.error(f"알림 이벤트 처리 실패: events={len(event_ids)}, error={e}")
+        return DispatchResult()
+
+    result = DispatchResult(events=len(events), notifications=len(rows) + len(grouped))
+    _record_stats(result, (time.perf_counter() - started) * 1000)
+    return result
+
+
+def dispatch_pending(db: Session, batch_size: int = DEFAULT_BATCH_SIZE) -> DispatchResult:
+    """처리 대기 이벤트가 없을 때까지 배치 반복 처리"""
+    total = DispatchResult()
+    while True:
+        result = dispatch_batch(db, batch_size)
+        total.events += result.events
+        total.notifications += result.notifications
+        if result.events < batch_size:
+            return total
+
+
+def get_outbox_metrics(db: Session) -> dict:
+    """
+    outbox 처리 지연 지표
+    - pending: 처리 대기 이벤트 수, lag_seconds: 가장 오래된 대기 이벤트의 대기 시간
+    - failed: MAX_ATTEMPTS 만큼 실패하여 더 이상 처리하지 않는 이벤트 수
+    - dispatcher: 현재 프로세스 디스패처의 누적 처리량
+    """
+    pending, lag_seconds = db.query(
+        func.count(NotificationEvent.event_id),
+        func.extract("epoch", func.localtimestamp() - func.min(NotificationEvent.created_at))
+    ).filter(
+        and_(
+            NotificationEvent.processed_at.is_(None),
+            NotificationEvent.attempts < MAX_ATTEMPTS
+        )
+    ).one()
+    failed = db.query(func.count(NotificationEvent.event_id)).filter(
+        and_(
+            NotificationEvent.processed_at.is_(None),
+            NotificationEvent.attempts >= MAX_ATTEMPTS
+        )
+    ).scalar()
+    with _stats_lock:
+        dispatcher = dict(_stats)
+    return {
+        "pending": int(pending or 0),
+        "lag_seconds": round(float(lag_seconds), 3) if lag_seconds is not None else 0.0,
+        "failed": int(failed or 0),
+        "dispatcher": dispatcher,
+    }
+
+
+def run_forever(
+    session_factory: Callable[[], Session],
+    stop_event: threading.Event,
+    interval: float = DEFAULT_INTERVAL,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> None:
+    """stop_event가 설정될 때까지 처리 대기 이벤트를 반복 처리"""
+    while not stop_event.is_set():
+        db = session_factory()
+        try:
+            dispatch_pending(db, batch_size)
+        except Exception as e:
+            logger.error(f"알림 디스패처 오류: {e}")
+        finally:
+            db.close()
+        stop_event.wait(interval)
+
+
+_dispatcher_thread: Optional[threading.Thread] = None
+_dispatcher_stop = threading.Event()
+
+
+def start_dispatcher(
+    session_factory: Callable[[], Session],
+    interval: float = DEFAULT_INTERVAL,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> None:
+    """API 프로세스 안에서 디스패처 스레드 시작 (이미 실행 중이면 무시)"""
+    global _dispatcher_thread
+    if _dispatcher_thread is not None and _dispatcher_thread.is_alive():
+        return
+    _dispatcher_stop.clear()
+    _dispatcher_thread = threading.Thread(
+        target=run_forever,
+        args=(session_factory, _dispatcher_stop, interval, batch_size),
+        name="notification-dispatcher",
+        daemon=True
+    )
+    _dispatcher_thread.start()
+
+
+def stop_dispatcher(timeout: float = 5.0) -> None:
+    """디스패처 스레드 종료 (진행 중인 배치는 마저 처리)"""
+    global _dispatcher_thread
+    _dispatcher_stop.set()
+    if _dispatcher_thread is not None:
+        _dispatcher_thread.join(timeout)
+        _dispatcher_thread = None
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 별도 프로세스로 디스패처 실행 (API 프로세스에서는 NOTIFICATION_DISPATCHER_ENABLED=false 권장)
+    from app.core.database import SessionLocal
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("run", "once"):
+        print("사용법: python -m app.services.notification_outbox [run|once]")
+        sys.exit(1)
+
+    if sys.argv[1] == "once":
+        db = SessionLocal()
+        try:
+            result = dispatch_pending(db)
+            print(f"✅ 알림 이벤트를 처리했습니다. (이벤트 {result.events}개, 알림 {result.notifications}개)")
+        finally:
+            db.close()
+    else:
+        stop = threading.Event()
+        try:
+            run_forever(SessionLocal, stop)
+        except KeyboardInterrupt:
+            stop.set()
@@ -0,0 +1,261 @@
+"""
+알림 실시간 푸시 서비스 (WebSocket /api/notifications/ws)
+- 알림 생성/읽음 처리 트랜잭션 안에서 pg_notify로 사용자별 변경 사항을 발행 (커밋될 때만 전달됨)
+- 각 uvicorn 워커는 전용 DB 연결 하나로 LISTEN 하고, 자기 워커에 접속한 사용자에게만 전달
+  (외부 메시지 브로커 없이 여러 워커/서버에서 동작)
+- 연결마다 크기가 제한된 큐를 두고, 클라이언트가 느려 큐가 가득 차면 쌓인 메시지를 버리고
+  'resync' 메시지 하나만 보내 클라이언트가 목록을 다시 조회하게 함 (서버 메모리 무한 증가 방지)
+
+메시지 형식 (JSON)
+- {"type": "notifications", "notifications": [...], "unread_count": N}: 새 알림 또는 묶음 알림 갱신
+- {"type": "unread_count", "unread_count": N}: 읽음 처리 등으로 읽지 않은 알림 수만 변경
+- {"type": "resync"}: 놓친 메시지가 있을 수 있으므로 GET /api/notifications로 다시 조회
+"""
+import asyncio
+import json
+import logging
+import select
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from app.services import notification_feed
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "user_notifications"
+DEFAULT_QUEUE_SIZE = 100
+LISTEN_POLL_INTERVAL = 1.0  # 초, 종료 요청 확인 주기
+RECONNECT_DELAY = 5.0  # 초, LISTEN 연결이 끊겼을 때 재연결 대기 시간
+
+
+# ========== 발행 (요청/디스패처 트랜잭션 안에서 호출, 커밋하지 않음) ==========
+
+def publish_unread_counts(db: Session, user_ids: Iterable[int]) -> None:
+    """사용자별 현재 읽지 않은 알림 수 발행"""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return
+    db.execute(text("""
+        SELECT pg_notify(:channel, json_build_object(
+            'user_id', u.user_id,
+            'unread_count', u.unread_notification_count
+        )::text)
+        FROM users u
+        WHERE u.user_id = ANY(CAST(:user_ids AS integer[]))
+    """), {"channel": CHANNEL, "user_ids": user_ids})
+
+
+def publish_notifications(db: Session, notification_ids_by_user: Dict[int, List[int]]) -> None:
+    """
+    사용자별 새로 생성/갱신된 알림 ID와 현재 읽지 않은 알림 수 발행
+    - 알림 내용은 페이로드 크기 제한(8000바이트) 때문에 ID만 보내고, 접속한 사용자가 있는 워커에서만 조회
+    """
+    if not notification_ids_by_user:
+        return
+    items = [
+        {"user_id": user_id, "notification_ids": notification_ids}
+        for user_id, notification_ids in notification_ids_by_user.items()
+    ]
+    db.execute(text("""
+        SELECT pg_notify(:channel, json_build_object(
+            'user_id', u.user_id,
+            'unread_count', u.unread_notification_count,
+            'notification_ids', v.notification_ids
+        )::text)
+        FROM json_to_recordset(CAST(:items AS json)) AS v(user_id integer, notification_ids json)
+        JOIN users u ON u.user_id = v.user_id
+    """), {"channel": CHANNEL, "items": json.dumps(items)})
+
+
+# ========== 워커별 연결 관리 ==========
+
+class PushConnection:
+    """WebSocket 연결 하나의 전송 대기 큐"""
+
+    def __init__(self, user_id: int, queue_size: int = DEFAULT_QUEUE_SIZE):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.resyncs = 0
+
+    def offer(self, message: dict) -> bool:
+        """
+        메시지 추가 (이벤트 루프에서만 호출)
+        - 큐가 가득 차면 쌓인 메시지를 버리고 resync 메시지로 대체
+
+        Returns:
+            메시지를 그대로 추가했으면 True
+        """
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait({"type": "resync"})
+            self.resyncs += 1
+            return False
+
+
+class NotificationHub:
+    """
+    워커(프로세스)별 알림 푸시 허브
+    - LISTEN 전용 스레드가 받은 NOTIFY를 이벤트 루프로 넘기고, 이벤트 루프에서 연결별 큐에 분배
+    """
+
+    def __init__(self):
+        self._connections: Dict[int, Set[PushConnection]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session_factory: Optional[Callable[[], Session]] = None
+        self._queue_size = DEFAULT_QUEUE_SIZE
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._stats = {"notifies": 0, "messages": 0, "resyncs": 0, "listen_errors": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    # ----- 연결 등록 -----
+
+    def register(self, user_id: int) -> PushConnection:
+        connection = PushConnection(user_id, self._queue_size)
+        self._connections.setdefault(user_id, set()).add(connection)
+        return connection
+
+    def unregister(self, connection: PushConnection) -> None:
+        connections = self._connections.get(connection.user_id)
+        if connections is None:
+            return
+        connections.discard(connection)
+        if not connections:
+            del self._connections[connection.user_id]
+
+    def connection_count(self) -> int:
+        return sum(len(connections) for connections in self._connections.values())
+
+    def get_metrics(self) -> dict:
+        """현재 워커의 접속 수와 누적 전달 통계"""
+        return {
+            "running": self.running,
+            "connections": self.connection_count(),
+            "users": len(self._connections),
+            **self._stats,
+        }
+
+    # ----- 분배 (이벤트 루프) -----
+
+    def _broadcast(self, user_id: int, message: dict) -> None:
+        for connection in list(self._connections.get(user_id, ())):
+            self._stats["messages"] += 1
+            if not connection.offer(message):
+                self._stats["resyncs"] += 1
+
+    def _resync_all(self) -> None:
+        for user_id in list(self._connections):
+            self._broadcast(user_id, {"type": "resync"})
+
+    def handle_payload(self, payload: str) -> None:
+        """NOTIFY 페이로드 처리 (이벤트 루프에서 호출)"""
+        self._stats["notifies"] += 1
+        try:
+            data = json.loads(payload)
+            user_id = int(data["user_id"])
+        except (ValueError, KeyError, TypeError):
+            logger.warning(f"잘못된 알림 푸시 페이로드: {payload[:200]}")
+            return
+        if user_id not in self._connections:
+            return
+
+        notification_ids = data.get("notification_ids") or []
+        if not notification_ids or self._session_factory is None:
+            self._broadcast(user_id, {"type": "unread_count", "unread_count": data.get("unread_count", 0)})
+            return
+        asyncio.ensure_future(self._deliver_notifications(user_id, notification_ids, data.get("unread_count", 0)))
+
+    async def _deliver_notifications(self, user_id: int, notification_ids: Sequence[int], unread_count: int) -> None:
+        """알림 내용을 조회(스레드 풀)하여 해당 사용자의 연결에 전달"""
+        loop = asyncio.get_running_loop()
+        try:
+            notifications = await loop.run_in_executor(None, self._load, notification_ids)
+        except Exception as e:
+            logger.error(f"푸시 알림 조회 실패: user_id={user_id}, error={e}")
+            self._broadcast(user_id, {"type": "resync"})
+            return
+        self._broadcast(user_id, {
+            "type": "notifications",
+            "notifications": notifications,
+            "unread_count": unread_count,
+        })
+
+    def _load(self, notification_ids: Sequence[int]) -> List[dict]:
+        db = self._session_factory()
+        try:
+            return [
+                response.model_dump(mode="json")
+                for response in notification_feed.load_notification_responses(db, notification_ids)
+            ]
+        finally:
+            db.close()
+
+    # ----- LISTEN 스레드 -----
+
+    def start(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        dsn: str,
+        session_factory: Callable[[], Session],
+        queue_size: int = DEFAULT_QUEUE_SIZE
+    ) -> None:
+        """LISTEN 스레드 시작 (이미 실행 중이면 무시)"""
+        if self.running:
+            return
+        self._loop = loop
+        self._session_factory = session_factory
+        self._queue_size = queue_size
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, args=(dsn,), name="notification-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """LISTEN 스레드 종료"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _listen(self, dsn: str) -> None:
+        import psycopg2
+        import psycopg2.extensions
+
+        reconnected = False
+        while not self._stop.is_set():
+            connection = None
+            try:
+                connection = psycopg2.connect(dsn)
+                connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {CHANNEL}")
+                if reconnected:
+                    # 연결이 끊긴 동안 놓친 알림이 있을 수 있으므로 다시 조회하도록 요청
+                    self._loop.call_soon_threadsafe(self._resync_all)
+                while not self._stop.is_set():
+                    if select.select([connection], [], [], LISTEN_POLL_INTERVAL) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        notify = connection.notifies.pop(0)
+                        self._loop.call_soon_threadsafe(self.handle_payload, notify.payload)
+            except Exception as e:
+                self._stats["listen_errors"] += 1
+                logger.error(f"알림 LISTEN 연결 오류: {e}")
+                reconnected = True
+                self._stop.wait(RECONNECT_DELAY)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+
+hub = NotificationHub()
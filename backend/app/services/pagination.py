@@ -0,0 +1,68 @@
+"""
+커서(keyset) 페이지네이션 유틸리티
+- 커서는 (created_at, id) 쌍을 URL-safe base64로 인코딩한 문자열
+- OFFSET 스캔과 COUNT 없이 (created_at, id) < (커서) 조건과 복합 인덱스로 다음 페이지 조회
+- 전체 개수가 필요하면 EXPLAIN의 예상 행 수로 근사치 제공
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+from sqlalchemy.orm import Query, Session
+
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """(created_at, id)를 커서 문자열로 인코딩"""
+    raw = f"{created_at.isoformat()}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    커서 문자열을 (created_at, id)로 디코딩
+
+    Raises:
+        ValueError: 형식이 잘못된 커서
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_raw, row_id_raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").rsplit("|", 1)
+        created_at = datetime.fromisoformat(created_at_raw)
+        # DB 컬럼은 naive TIMESTAMP이므로 비교를 위해 tzinfo 제거
+        return created_at.replace(tzinfo=None), int(row_id_raw)
+    except Exception as e:
+        raise ValueError(f"잘못된 커서입니다: {cursor}") from e
+
+
+def estimate_count(db: Session, query: Query) -> int:
+    """
+    쿼리 결과 행 수 근사치 (EXPLAIN 예상 행 수, 실제 스캔 없음)
+    - 통계 정보 기반이므로 필터가 많을수록 오차가 커질 수 있음
+    - 검색어 등 사용자 입력은 SQL 문자열에 넣지 않고 바인드 파라미터로 전달 (text()로 다시 파싱하지 않음)
+    """
+    connection = db.connection()
+    compiled = query.statement.compile(
+        dialect=connection.dialect,
+        compile_kwargs={"render_postcompile": True}
+    )
+    params = compiled.params
+    if compiled.positional:
+        # asyncpg 등 위치 기반 파라미터 드라이버
+        params = tuple(params[name] for name in compiled.positiontup)
+    plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", params).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"].get("Plan Rows", 0))
+
+
+def next_cursor_for(rows: list, page_size: int, created_at_attr: str, id_attr: str) -> Tuple[list, Optional[str], bool]:
+    """
+    page_size + 1 개 조회 결과에서 (현재 페이지, 다음 커서, 다음 페이지 존재 여부) 계산
+    """
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, created_at_attr), getattr(last, id_attr))
+    return rows, next_cursor, has_more
@@ -0,0 +1,99 @@
+"""
+게시글 검색 서비스
+- posts.search_vector: 제목(가중치 A) + 본문(가중치 B)의 tsvector (DB 생성 컬럼으로 자동 유지, GIN 인덱스)
+- 한국어는 형태소 분석 사전이 없으므로 'simple' 설정으로 어절 단위 일치를 보고,
+  부분 문자열 일치는 pg_trgm GIN 인덱스(title, content)를 쓰는 ILIKE로 보완
+  (3글자 미만 검색어는 트라이그램을 뽑을 수 없어 인덱스 전체를 훑으므로 상대적으로 느림)
+- 관련도: ts_rank_cd(어절 일치) + word_similarity(검색어, 제목)
+- 하이라이트 스니펫은 본문에서 첫 일치 위치 주변을 잘라 HTML 이스케이프 후 <mark>로 감쌈
+"""
+import html
+import re
+from typing import List, Optional
+from sqlalchemy import func, or_
+from app.models.board import Post
+
+SEARCH_CONFIG = "simple"
+SNIPPET_RADIUS = 60  # 일치 위치 앞뒤로 보여줄 글자 수
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_END = "</mark>"
+
+
+def _escape_like(value: str) -> str:
+    """LIKE 패턴 특수문자 이스케이프"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def search_terms(q: str) -> List[str]:
+    """검색어를 공백 기준으로 나눈 하이라이트 대상 단어 목록 (따옴표/제외 연산자 제거)"""
+    terms = []
+    for raw in q.split():
+        if raw.startswith("-"):
+            continue
+        term = raw.strip('"')
+        if term and term.lower() not in (t.lower() for t in terms):
+            terms.append(term)
+    return terms
+
+
+def tsquery(q: str):
+    """websearch 문법(따옴표 구문, -제외, or) 검색어를 tsquery로 변환"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+
+def match_condition(q: str):
+    """
+    검색 조건 (어절 일치 OR 제목/본문 부분 문자열 일치)
+    - 세 조건 모두 GIN 인덱스를 사용하므로 플래너가 BitmapOr로 결합 가능
+    """
+    q = q.strip()
+    pattern = f"%{_escape_like(q)}%"
+    return or_(
+        Post.search_vector.op("@@")(tsquery(q)),
+        Post.title.ilike(pattern, escape="\\"),
+        Post.content.ilike(pattern, escape="\\")
+    )
+
+
+def rank_expression(q: str):
+    """관련도 점수 (높을수록 관련도 높음)"""
+    q = q.strip()
+    return func.ts_rank_cd(Post.search_vector, tsquery(q)) + func.word_similarity(q, Post.title)
+
+
+def build_snippet(content: str, terms: List[str], radius: int = SNIPPET_RADIUS) -> Optional[str]:
+    """
+    본문에서 첫 일치 위치 주변을 잘라 일치 부분을 <mark>로 감싼 스니펫 생성
+    - 본문은 HTML 이스케이프되므로 그대로 렌더링해도 안전
+    - 일치하는 단어가 없으면 본문 앞부분 사용
+    """
+    if not content:
+        return None
+
+    matcher = None
+    if terms:
+        matcher = re.compile(
+            "|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)),
+            re.IGNORECASE
+        )
+    first = matcher.search(content) if matcher else None
+    center = first.start() if first else 0
+    start = max(0, center - radius)
+    end = min(len(content), center + radius * 2 if not first else first.end() + radius)
+    window = content[start:end]
+
+    pieces = []
+    last = 0
+    if matcher:
+        for match in matcher.finditer(window):
+            pieces.append(html.escape(window[last:match.start()]))
+            pieces.append(f"{HIGHLIGHT_START}{html.escape(match.group(0))}{HIGHLIGHT_END}")
+            last = match.end()
+    pieces.append(html.escape(window[last:]))
+
+    snippet = "".join(pieces).replace("\n", " ")
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(content):
+        snippet = snippet + "…"
+    return snippet
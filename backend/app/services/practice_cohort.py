@@ -0,0 +1,289 @@
+"""
+연습 코호트 서비스
+- 코호트: 주요 악기와 특징(user type) 조합이 완전히 같은 사용자 집합
+- user_profiles.cohort_key ("악기ID:특징ID,...")는 악기/특징 변경 시 갱신
+- 코호트별 주간 집계(practice_cohort_weekly)를 일정 시간 동안 재사용하여
+  /api/practice/average-weekly 는 집계 한 행 + 본인 일일 합계 조회로 응답
+- 주기 실행용 명령 (이번 주 전체 코호트 재계산, cohort_key 백필)
+
+    python -m app.services.practice_cohort refresh
+    python -m app.services.practice_cohort backfill-keys
+"""
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.user import UserProfile
+from app.models.user_profile import UserProfileInstrument, UserProfileUserType
+from app.models.practice import PracticeDailyTotal, PracticeCohortWeekly
+
+logger = logging.getLogger(__name__)
+
+COHORT_TTL = timedelta(minutes=10)  # 주간 집계 재사용 시간
+WEEK_DAYS = 7
+
+
+@dataclass(frozen=True)
+class WeeklyAverage:
+    """코호트 주간 평균 (본인 제외)"""
+    daily_averages: List[int]
+    consistency_percentage: int
+    total_users: int
+
+
+EMPTY_WEEKLY_AVERAGE = WeeklyAverage(daily_averages=[0] * WEEK_DAYS, consistency_percentage=0, total_users=0)
+
+
+def build_cohort_key(instrument_id: Optional[int], user_type_ids: Sequence[int]) -> Optional[str]:
+    """주요 악기와 특징 목록으로 코호트 키 생성 (둘 중 하나라도 없으면 None)"""
+    if not instrument_id or not user_type_ids:
+        return None
+    return f"{instrument_id}:{','.join(str(i) for i in sorted(set(user_type_ids)))}"
+
+
+def refresh_cohort_key(db: Session, profile: UserProfile) -> Optional[str]:
+    """
+    프로필의 악기/특징 관계로 cohort_key 재계산 (관계 flush 이후 호출, 커밋하지 않음)
+    """
+    instrument_id = db.query(UserProfileInstrument.instrument_id).filter(
+        and_(
+            UserProfileInstrument.profile_id == profile.profile_id,
+            UserProfileInstrument.is_primary.is_(True)
+        )
+    ).scalar()
+    user_type_ids = [
+        row.user_type_id for row in db.query(UserProfileUserType.user_type_id).filter(
+            UserProfileUserType.profile_id == profile.profile_id
+        )
+    ]
+    profile.cohort_key = build_cohort_key(instrument_id, user_type_ids)
+    return profile.cohort_key
+
+
+# ========== 주간 집계 ==========
+
+def _compute_cohort_weeks(
+    db: Session,
+    week_start: date,
+    week_end: date,
+    cohort_key: Optional[str] = None
+) -> Dict[str, dict]:
+    """
+    코호트별 주간 집계 계산 (cohort_key가 없으면 전체 코호트)
+    - 사용자 수, 일별 합계/인원, 7일 모두 연습한 사용자 수를 각각 GROUP BY 한 번으로 계산
+    """
+    profile_filter = UserProfile.cohort_key.isnot(None)
+    if cohort_key is not None:
+        profile_filter = UserProfile.cohort_key == cohort_key
+
+    results: Dict[str, dict] = {}
+    for row in db.query(
+        UserProfile.cohort_key,
+        func.count(UserProfile.profile_id).label("user_count")
+    ).filter(profile_filter).group_by(UserProfile.cohort_key):
+        results[row.cohort_key] = {
+            "cohort_key": row.cohort_key,
+            "week_start": week_start,
+            "week_end": week_end,
+            "user_count": int(row.user_count),
+            "day_totals": [0] * WEEK_DAYS,
+            "day_user_counts": [0] * WEEK_DAYS,
+            "full_week_users": 0,
+        }
+    if not results:
+        return results
+
+    week_filter = and_(
+        profile_filter,
+        PracticeDailyTotal.practice_date >= week_start,
+        PracticeDailyTotal.practice_date <= week_end
+    )
+    daily_rows = db.query(
+        UserProfile.cohort_key,
+        PracticeDailyTotal.practice_date,
+        func.sum(PracticeDailyTotal.total_seconds).label("total_seconds"),
+        func.count(PracticeDailyTotal.user_id).label("user_count")
+    ).join(
+        UserProfile, UserProfile.user_id == PracticeDailyTotal.user_id
+    ).filter(week_filter).group_by(UserProfile.cohort_key, PracticeDailyTotal.practice_date)
+
+    for row in daily_rows:
+        index = (row.practice_date - week_start).days
+        if row.cohort_key in results and 0 <= index < WEEK_DAYS:
+            results[row.cohort_key]["day_totals"][index] = int(row.total_seconds or 0)
+            results[row.cohort_key]["day_user_counts"][index] = int(row.user_count)
+
+    full_week = select(
+        UserProfile.cohort_key
+    ).join_from(
+        UserProfile, PracticeDailyTotal, UserProfile.user_id == PracticeDailyTotal.user_id
+    ).where(week_filter).group_by(
+        UserProfile.cohort_key, PracticeDailyTotal.user_id
+    ).having(
+        func.count(PracticeDailyTotal.practice_date) == (week_end - week_start).days + 1
+    ).subquery()
+    for row in db.execute(
+        select(full_week.c.cohort_key, func.count().label("users")).group_by(full_week.c.cohort_key)
+    ):
+        if row.cohort_key in results:
+            results[row.cohort_key]["full_week_users"] = int(row.users)
+
+    return results
+
+
+def _save_cohort_weeks(db: Session, rows: Sequence[dict]) -> None:
+    """주간 집계 저장 (있으면 덮어씀, 커밋하지 않음)"""
+    if not rows:
+        return
+    stmt = pg_insert(PracticeCohortWeekly).values(list(rows))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PracticeCohortWeekly.cohort_key, PracticeCohortWeekly.week_start, PracticeCohortWeekly.week_end],
+        set_={
+            "user_count": stmt.excluded.user_count,
+            "day_totals": stmt.excluded.day_totals,
+            "day_user_counts": stmt.excluded.day_user_counts,
+            "full_week_users": stmt.excluded.full_week_users,
+            "refreshed_at": func.now(),
+        }
+    )
+    db.execute(stmt)
+
+
+def get_cohort_week(db: Session, cohort_key: str, week_start: date, week_end: date) -> Optional[PracticeCohortWeekly]:
+    """
+    코호트 주간 집계 조회 (없거나 COHORT_TTL보다 오래되었으면 다시 계산하여 저장)
+    """
+    fresh = db.query(PracticeCohortWeekly).filter(
+        and_(
+            PracticeCohortWeekly.cohort_key == cohort_key,
+            PracticeCohortWeekly.week_start == week_start,
+            PracticeCohortWeekly.week_end == week_end,
+            PracticeCohortWeekly.refreshed_at >= func.now() - COHORT_TTL
+        )
+    ).first()
+    if fresh is not None:
+        return fresh
+
+    computed = _compute_cohort_weeks(db, week_start, week_end, cohort_key).get(cohort_key)
+    if computed is None:
+        return None
+    _save_cohort_weeks(db, [computed])
+    db.commit()
+    return PracticeCohortWeekly(**computed)
+
+
+def _own_daily_totals(db: Session, user_id: int, start_date: date, end_date: date):
+    """본인 주간 일일 합계 (기본키 범위 조회)"""
+    return db.query(
+        PracticeDailyTotal.practice_date,
+        PracticeDailyTotal.total_seconds
+    ).filter(
+        and_(
+            PracticeDailyTotal.user_id == user_id,
+            PracticeDailyTotal.practice_date >= start_date,
+            PracticeDailyTotal.practice_date <= end_date
+        )
+    ).all()
+
+
+def get_weekly_average(db: Session, profile: UserProfile, week_start: date, week_end: date) -> WeeklyAverage:
+    """
+    같은 코호트 사용자(본인 제외)의 일별 평균 연습 시간과 매일 연습한 사용자 비율
+    - 코호트 집계에서 본인의 일일 합계를 빼서 계산 (집계가 최대 COHORT_TTL 만큼 늦을 수 있어 0 미만은 0으로 보정)
+    """
+    if not profile.cohort_key:
+        return EMPTY_WEEKLY_AVERAGE
+
+    cohort = get_cohort_week(db, profile.cohort_key, week_start, week_end)
+    if cohort is None:
+        return EMPTY_WEEKLY_AVERAGE
+
+    own_totals = {
+        row.practice_date: int(row.total_seconds or 0)
+        for row in _own_daily_totals(db, profile.user_id, week_start, week_end)
+    }
+
+    total_users = max(0, cohort.user_count - 1)
+    if total_users == 0:
+        return EMPTY_WEEKLY_AVERAGE
+
+    daily_averages = []
+    for index in range(WEEK_DAYS):
+        day = week_start + timedelta(days=index)
+        day_total = int(cohort.day_totals[index] or 0)
+        day_count = int(cohort.day_user_counts[index] or 0)
+        if day in own_totals:
+            day_total = max(0, day_total - own_totals[day])
+            day_count = max(0, day_count - 1)
+        daily_averages.append(int(day_total / day_count) if day_count > 0 else 0)
+
+    full_week_users = cohort.full_week_users
+    if len(own_totals) == (week_end - week_start).days + 1:
+        full_week_users = max(0, full_week_users - 1)
+
+    return WeeklyAverage(
+        daily_averages=daily_averages,
+        consistency_percentage=min(100, int(full_week_users / total_users * 100)),
+        total_users=total_users
+    )
+
+
+# ========== 일괄 작업 ==========
+
+def refresh_all_cohorts(db: Session, week_start: date, week_end: date) -> int:
+    """전체 코호트의 주간 집계를 한 번에 다시 계산 (주기 실행용)"""
+    rows = list(_compute_cohort_weeks(db, week_start, week_end).values())
+    _save_cohort_weeks(db, rows)
+    db.commit()
+    logger.info(f"코호트 주간 집계 갱신 완료: week={week_start}~{week_end}, cohorts={len(rows)}")
+    return len(rows)
+
+
+def backfill_cohort_keys(db: Session) -> int:
+    """전체 프로필의 cohort_key를 악기/특징 관계에서 다시 계산"""
+    primary_instruments = dict(
+        db.query(UserProfileInstrument.profile_id, UserProfileInstrument.instrument_id).filter(
+            UserProfileInstrument.is_primary.is_(True)
+        ).all()
+    )
+    user_types: Dict[int, List[int]] = {}
+    for profile_id, user_type_id in db.query(UserProfileUserType.profile_id, UserProfileUserType.user_type_id):
+        user_types.setdefault(profile_id, []).append(user_type_id)
+
+    mappings = [
+        {
+            "profile_id": profile_id,
+            "cohort_key": build_cohort_key(primary_instruments.get(profile_id), user_types.get(profile_id, []))
+        }
+        for (profile_id,) in db.query(UserProfile.profile_id)
+    ]
+    db.bulk_update_mappings(UserProfile, mappings)
+    db.commit()
+    logger.info(f"cohort_key 백필 완료: profiles={len(mappings)}")
+    return len(mappings)
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 이번 주(일~토) 코호트 집계 갱신 또는 cohort_key 백필
+    from app.core.database import SessionLocal
+
+    if len(sys.argv) < 2 or sys.argv[1] not in ("refresh", "backfill-keys"):
+        print("사용법: python -m app.services.practice_cohort [refresh|backfill-keys]")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        if sys.argv[1] == "refresh":
+            today = date.today()
+            week_start = today - timedelta(days=(today.weekday() + 1) % 7)  # 일요일 시작 (화면 기준)
+            count = refresh_all_cohorts(db, week_start, week_start + timedelta(days=WEEK_DAYS - 1))
+            print(f"✅ 코호트 주간 집계가 갱신되었습니다. (코호트 {count}개)")
+        else:
+            count = backfill_cohort_keys(db)
+            print(f"✅ cohort_key가 백필되었습니다. (프로필 {count}개)")
+    finally:
+        db.close()
@@ -0,0 +1,132 @@
+"""
+일일 연습 합계 서비스
+- practice_daily_totals 테이블을 세션 종료/삭제 시 증분 갱신
+- 달력/주간 통계 조회용 일 단위 집계 제공
+"""
+import logging
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.practice import PracticeSession, PracticeDailyTotal
+
+logger = logging.getLogger(__name__)
+
+
+def add_session(db: Session, session: PracticeSession) -> int:
+    """
+    완료된 세션을 일일 합계에 반영 (커밋하지 않음)
+
+    Returns:
+        반영 후 해당 날짜의 세션 수 (1이면 새로 연습한 날)
+    """
+    stmt = pg_insert(PracticeDailyTotal).values(
+        user_id=session.user_id,
+        practice_date=session.practice_date,
+        total_seconds=session.actual_play_time or 0,
+        session_count=1
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PracticeDailyTotal.user_id, PracticeDailyTotal.practice_date],
+        set_={
+            "total_seconds": PracticeDailyTotal.total_seconds + stmt.excluded.total_seconds,
+            "session_count": PracticeDailyTotal.session_count + 1,
+        }
+    ).returning(PracticeDailyTotal.session_count)
+    return int(db.execute(stmt).scalar() or 0)
+
+
+def remove_session(db: Session, session: PracticeSession) -> int:
+    """
+    완료된 세션 삭제를 일일 합계에 반영 (커밋하지 않음)
+    - 남은 세션이 없으면 해당 날짜 행 삭제
+
+    Returns:
+        반영 후 해당 날짜의 세션 수 (0이면 연습한 날에서 제외됨)
+    """
+    day_filter = and_(
+        PracticeDailyTotal.user_id == session.user_id,
+        PracticeDailyTotal.practice_date == session.practice_date
+    )
+    remaining = db.execute(
+        PracticeDailyTotal.__table__.update().where(day_filter).values(
+            total_seconds=func.greatest(PracticeDailyTotal.total_seconds - (session.actual_play_time or 0), 0),
+            session_count=PracticeDailyTotal.session_count - 1
+        ).returning(PracticeDailyTotal.session_count)
+    ).scalar()
+
+    if remaining is None:
+        return 0
+    if remaining <= 0:
+        db.execute(PracticeDailyTotal.__table__.delete().where(day_filter))
+        return 0
+    return int(remaining)
+
+
+def get_daily_totals(
+    db: Session,
+    user_ids: Sequence[int],
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> List[PracticeDailyTotal]:
+    """여러 사용자의 일일 합계를 한 번의 쿼리로 조회 (user_id, 날짜 순)"""
+    if not user_ids:
+        return []
+
+    query = db.query(PracticeDailyTotal).filter(PracticeDailyTotal.user_id.in_(list(user_ids)))
+    if start_date:
+        query = query.filter(PracticeDailyTotal.practice_date >= start_date)
+    if end_date:
+        query = query.filter(PracticeDailyTotal.practice_date <= end_date)
+    return query.order_by(PracticeDailyTotal.user_id, PracticeDailyTotal.practice_date).all()
+
+
+def get_totals_by_date(
+    db: Session,
+    user_ids: Sequence[int],
+    start_date: date,
+    end_date: date
+) -> Dict[date, int]:
+    """여러 사용자의 날짜별 연습 시간 합계 ({날짜: 초})"""
+    if not user_ids:
+        return {}
+
+    rows = db.query(
+        PracticeDailyTotal.practice_date,
+        func.sum(PracticeDailyTotal.total_seconds).label("total_seconds")
+    ).filter(
+        and_(
+            PracticeDailyTotal.user_id.in_(list(user_ids)),
+            PracticeDailyTotal.practice_date >= start_date,
+            PracticeDailyTotal.practice_date <= end_date
+        )
+    ).group_by(PracticeDailyTotal.practice_date).all()
+    return {row.practice_date: int(row.total_seconds or 0) for row in rows}
+
+
+def rebuild_all_daily_totals(db: Session) -> int:
+    """
+    전체 일일 합계를 연습 기록에서 다시 계산 (커밋하지 않음)
+
+    Returns:
+        생성된 행 수
+    """
+    db.query(PracticeDailyTotal).delete(synchronize_session=False)
+    source = select(
+        PracticeSession.user_id,
+        PracticeSession.practice_date,
+        func.coalesce(func.sum(PracticeSession.actual_play_time), 0),
+        func.count(PracticeSession.session_id)
+    ).where(
+        PracticeSession.status == "completed"
+    ).group_by(PracticeSession.user_id, PracticeSession.practice_date)
+
+    result = db.execute(
+        PracticeDailyTotal.__table__.insert().from_select(
+            ["user_id", "practice_date", "total_seconds", "session_count"],
+            source
+        )
+    )
+    logger.info(f"일일 연습 합계 재계산 완료: rows={result.rowcount}")
+    return result.rowcount
@@ -0,0 +1,190 @@
+"""
+연습 통계 롤업 서비스
+- practice_stats 테이블을 세션 종료/삭제 시 증분 갱신 (일일 합계 practice_daily_totals 포함)
+- /api/practice/statistics 는 기본키 조회 한 번으로 응답
+- 기존 데이터 백필용 일괄 재계산 명령 제공
+
+    python -m app.services.practice_stats rebuild
+"""
+import logging
+import sys
+from datetime import date, timedelta
+from typing import Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from app.models.practice import PracticeSession, PracticeStats, PracticeDailyTotal
+from app.services import practice_daily, streaks
+
+logger = logging.getLogger(__name__)
+
+
+def _refresh_streaks(db: Session, stats: PracticeStats) -> None:
+    """마지막 날짜와 연속 일수를 재계산 (과거 날짜 추가/삭제 시에만 사용)"""
+    db.flush()
+    streak = streaks.get_user_streak(db, stats.user_id)
+    stats.last_practice_date = streak.last_practice_date
+    stats.current_streak = streak.current_streak
+    stats.longest_streak = streak.longest_streak
+
+
+def _get_locked_stats(db: Session, user_id: int) -> Optional[PracticeStats]:
+    """동시 세션 종료 시 갱신 유실을 막기 위해 롤업 행을 잠그고 조회"""
+    return db.query(PracticeStats).filter(
+        PracticeStats.user_id == user_id
+    ).with_for_update().first()
+
+
+def rebuild_user_practice_stats(db: Session, user_id: int) -> PracticeStats:
+    """
+    한 사용자의 롤업을 일일 합계에서 다시 계산 (커밋하지 않음)
+    """
+    totals = db.query(
+        func.coalesce(func.sum(PracticeDailyTotal.total_seconds), 0).label("total_time"),
+        func.coalesce(func.sum(PracticeDailyTotal.session_count), 0).label("total_sessions")
+    ).filter(PracticeDailyTotal.user_id == user_id).first()
+
+    stats = _get_locked_stats(db, user_id)
+    if stats is None:
+        stats = PracticeStats(user_id=user_id)
+        db.add(stats)
+
+    stats.total_practice_time = int(totals.total_time or 0)
+    stats.total_sessions = int(totals.total_sessions or 0)
+    _refresh_streaks(db, stats)
+    db.flush()
+    return stats
+
+
+def apply_session_completed(db: Session, session: PracticeSession) -> None:
+    """
+    세션 종료 시 일일 합계와 롤업 증분 갱신
+    - 호출한 쪽의 트랜잭션 안에서 실행되며 커밋은 호출한 쪽에서 수행
+    """
+    day_session_count = practice_daily.add_session(db, session)
+    stats = _get_locked_stats(db, session.user_id)
+    if stats is None:
+        # 롤업이 아직 없는 사용자: 이번 세션을 포함한 전체 기록으로 생성
+        rebuild_user_practice_stats(db, session.user_id)
+        return
+
+    stats.total_practice_time = (stats.total_practice_time or 0) + (session.actual_play_time or 0)
+    stats.total_sessions = (stats.total_sessions or 0) + 1
+
+    if day_session_count > 1:
+        # 이미 연습한 날이면 연속 일수는 변하지 않음
+        return
+
+    practice_date = session.practice_date
+    last_date = stats.last_practice_date
+    if last_date is None or practice_date > last_date:
+        if last_date is not None and practice_date == last_date + timedelta(days=1):
+            stats.current_streak = (stats.current_streak or 0) + 1
+        else:
+            stats.current_streak = 1
+        stats.last_practice_date = practice_date
+        stats.longest_streak = max(stats.longest_streak or 0, stats.current_streak)
+    else:
+        # 과거 날짜가 새로 채워진 경우 구간이 합쳐질 수 있으므로 재계산
+        _refresh_streaks(db, stats)
+
+
+def apply_session_deleted(db: Session, session: PracticeSession) -> None:
+    """
+    완료된 세션 삭제 시 일일 합계와 롤업 증분 갱신 (db.delete(session) 이후, 커밋 이전에 호출)
+    """
+    if session.status != "completed":
+        return
+
+    remaining_day_sessions = practice_daily.remove_session(db, session)
+    stats = _get_locked_stats(db, session.user_id)
+    if stats is None:
+        rebuild_user_practice_stats(db, session.user_id)
+        return
+
+    stats.total_practice_time = max(0, (stats.total_practice_time or 0) - (session.actual_play_time or 0))
+    stats.total_sessions = max(0, (stats.total_sessions or 0) - 1)
+
+    if remaining_day_sessions == 0:
+        _refresh_streaks(db, stats)
+
+
+def get_practice_stats(db: Session, user_id: int) -> PracticeStats:
+    """
+    롤업 조회 (기본키 조회)
+    - 롤업이 없는 사용자는 한 번만 기록에서 생성하여 저장
+    """
+    stats = db.get(PracticeStats, user_id)
+    if stats is None:
+        stats = rebuild_user_practice_stats(db, user_id)
+        db.commit()
+    return stats
+
+
+def effective_current_streak(stats: PracticeStats, today: Optional[date] = None) -> int:
+    """오늘 연습 기록이 있어야 연속 일수로 인정 (기존 계산 방식과 동일)"""
+    return streaks.StreakInfo(
+        last_practice_date=stats.last_practice_date,
+        current_streak=stats.current_streak or 0
+    ).consecutive_days(today)
+
+
+def rebuild_all_practice_stats(db: Session) -> int:
+    """
+    전체 사용자 일일 합계 및 롤업 일괄 재계산 (백필)
+    - 일일 합계는 INSERT ... SELECT 한 번으로 재생성
+    - 합계는 GROUP BY 한 번, 연속 일수는 gaps-and-islands 쿼리 한 번으로 계산
+
+    Returns:
+        생성된 롤업 행 수
+    """
+    practice_daily.rebuild_all_daily_totals(db)
+
+    totals = db.query(
+        PracticeDailyTotal.user_id,
+        func.sum(PracticeDailyTotal.total_seconds).label("total_time"),
+        func.sum(PracticeDailyTotal.session_count).label("total_sessions")
+    ).group_by(PracticeDailyTotal.user_id).all()
+
+    rows = {
+        row.user_id: {
+            "user_id": row.user_id,
+            "total_practice_time": int(row.total_time or 0),
+            "total_sessions": int(row.total_sessions or 0),
+            "last_practice_date": None,
+            "current_streak": 0,
+            "longest_streak": 0,
+        }
+        for row in totals
+    }
+
+    for user_id, streak in streaks.get_streaks(db).items():
+        if user_id in rows:
+            rows[user_id].update(
+                last_practice_date=streak.last_practice_date,
+                current_streak=streak.current_streak,
+                longest_streak=streak.longest_streak
+            )
+
+    db.query(PracticeStats).delete(synchronize_session=False)
+    if rows:
+        db.bulk_insert_mappings(PracticeStats, list(rows.values()))
+    db.commit()
+
+    logger.info(f"연습 통계 롤업 재계산 완료: users={len(rows)}")
+    return len(rows)
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 전체 롤업 재계산
+    from app.core.database import SessionLocal
+
+    if len(sys.argv) < 2 or sys.argv[1] != "rebuild":
+        print("사용법: python -m app.services.practice_stats rebuild")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        count = rebuild_all_practice_stats(db)
+        print(f"✅ 일일 연습 합계와 통계 롤업이 재계산되었습니다. (사용자 {count}명)")
+    finally:
+        db.close()
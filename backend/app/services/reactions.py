@@ -0,0 +1,137 @@
+"""
+게시판 반응(좋아요/북마크) 토글 서비스
+- 토글 한 번을 하나의 SQL 문(데이터 변경 CTE)으로 처리
+  1) 대상(게시글/댓글) 존재 및 삭제 여부 확인
+  2) DELETE ... RETURNING 으로 기존 반응 취소 시도
+  3) 취소된 것이 없으면 INSERT ... ON CONFLICT DO NOTHING RETURNING 으로 추가
+  4) 카운터 컬럼이 있으면 UPDATE ... SET like_count = like_count ± 1 (행 잠금 후 최신 값 기준이므로 동시 요청에도 정확)
+- 커밋은 호출자가 담당 (알림 추가 등과 한 트랜잭션으로 묶거나 여러 토글을 한 번에 커밋)
+"""
+from dataclasses import dataclass
+from typing import Dict, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+POST_LIKE = "post_like"
+POST_BOOKMARK = "post_bookmark"
+COMMENT_LIKE = "comment_like"
+
+
+@dataclass(frozen=True)
+class _ToggleSpec:
+    """토글 대상 테이블 정보 (코드 상수로만 구성, 사용자 입력 아님)"""
+    target_table: str
+    target_key: str
+    reaction_table: str
+    counter_column: Optional[str]
+    label_column: str  # 알림 내용에 쓰는 컬럼
+
+
+_SPECS: Dict[str, _ToggleSpec] = {
+    POST_LIKE: _ToggleSpec("posts", "post_id", "post_likes", "like_count", "title"),
+    POST_BOOKMARK: _ToggleSpec("posts", "post_id", "post_bookmarks", None, "title"),
+    COMMENT_LIKE: _ToggleSpec("comments", "comment_id", "comment_likes", "like_count", "content"),
+}
+
+TOGGLE_KINDS = tuple(_SPECS.keys())
+
+
+@dataclass(frozen=True)
+class ToggleResult:
+    """토글 결과"""
+    kind: str
+    target_id: int
+    found: bool  # 대상이 없거나 삭제되었으면 False
+    is_active: bool = False  # 토글 후 반응 상태 (좋아요/북마크 여부)
+    changed: bool = False  # 실제로 추가/취소되었는지 (동시 요청으로 이미 반영된 경우 False)
+    count: Optional[int] = None  # 토글 후 카운터 값 (카운터가 없는 종류는 None)
+    owner_id: Optional[int] = None  # 대상 작성자 ID (알림용)
+    label: Optional[str] = None  # 게시글 제목 또는 댓글 내용 (알림용)
+
+
+def _build_toggle_sql(spec: _ToggleSpec) -> str:
+    # target CTE 안에서는 별칭 없이 컬럼을 읽고, 최종 SELECT에서는 target t의 counter로 참조
+    counter_select = spec.counter_column if spec.counter_column else "NULL::integer"
+    counter_cte = ""
+    counter_result = "t.counter"
+    if spec.counter_column:
+        counter_cte = f""",
+        counted AS (
+            UPDATE {spec.target_table}
+            SET {spec.counter_column} = GREATEST(
+                coalesce({spec.counter_column}, 0)
+                + (SELECT count(*) FROM inserted)
+                - (SELECT count(*) FROM removed),
+                0
+            )
+            WHERE {spec.target_key} = :target_id
+              AND EXISTS (SELECT 1 FROM inserted UNION ALL SELECT 1 FROM removed)
+            RETURNING {spec.counter_column} AS counter
+        )"""
+        counter_result = "coalesce((SELECT counter FROM counted), t.counter)"
+
+    return f"""
+        WITH target AS (
+            SELECT {spec.target_key}, user_id AS owner_id, {spec.label_column} AS label, {counter_select} AS counter
+            FROM {spec.target_table}
+            WHERE {spec.target_key} = :target_id AND deleted_at IS NULL
+        ),
+        removed AS (
+            DELETE FROM {spec.reaction_table}
+            WHERE {spec.target_key} = :target_id
+              AND user_id = :user_id
+              AND EXISTS (SELECT 1 FROM target)
+            RETURNING {spec.target_key}
+        ),
+        inserted AS (
+            INSERT INTO {spec.reaction_table} ({spec.target_key}, user_id, created_at)
+            SELECT {spec.target_key}, :user_id, now() FROM target
+            WHERE NOT EXISTS (SELECT 1 FROM removed)
+            ON CONFLICT ({spec.target_key}, user_id) DO NOTHING
+            RETURNING {spec.target_key}
+        ){counter_cte}
+        SELECT
+            (SELECT count(*) FROM inserted) AS inserted,
+            (SELECT count(*) FROM removed) AS removed,
+            {counter_result} AS counter,
+            t.owner_id,
+            t.label
+        FROM target t
+    """
+
+
+_SQL: Dict[str, str] = {kind: _build_toggle_sql(spec) for kind, spec in _SPECS.items()}
+
+
+def toggle(db: Session, kind: str, target_id: int, user_id: int) -> ToggleResult:
+    """
+    반응 토글 (SQL 한 번, 커밋하지 않음)
+
+    Raises:
+        ValueError: 알 수 없는 토글 종류
+    """
+    if kind not in _SQL:
+        raise ValueError(f"알 수 없는 토글 종류입니다: {kind}")
+
+    row = db.execute(text(_SQL[kind]), {"target_id": target_id, "user_id": user_id}).first()
+    if row is None:
+        return ToggleResult(kind=kind, target_id=target_id, found=False)
+
+    if row.inserted:
+        is_active = True
+    elif row.removed:
+        is_active = False
+    else:
+        # 동시에 들어온 같은 사용자의 요청이 먼저 추가한 경우 (ON CONFLICT DO NOTHING)
+        is_active = True
+
+    return ToggleResult(
+        kind=kind,
+        target_id=target_id,
+        found=True,
+        is_active=is_active,
+        changed=bool(row.inserted or row.removed),
+        count=int(row.counter) if row.counter is not None else None,
+        owner_id=row.owner_id,
+        label=row.label
+    )
@@ -0,0 +1,82 @@
+"""
+연속 연습 일수 서비스
+- practice_daily_totals(사용자별 연습한 날 1행)에 대한 gaps-and-islands 윈도 쿼리 한 번으로
+  마지막 연습일, 마지막 연습일에서 끝나는 연속 일수, 최장 연속 일수를 계산
+- 날짜 - ROW_NUMBER() 값이 같은 행들이 하나의 연속 구간이 됨 (조회 기간 제한 없음)
+"""
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, Optional, Sequence
+from sqlalchemy.orm import Session
+from sqlalchemy import Integer, cast, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from app.models.practice import PracticeDailyTotal
+
+
+@dataclass(frozen=True)
+class StreakInfo:
+    """사용자별 연속 연습 정보"""
+    last_practice_date: Optional[date] = None
+    current_streak: int = 0  # 마지막 연습일에서 끝나는 연속 일수
+    longest_streak: int = 0
+
+    def consecutive_days(self, today: Optional[date] = None) -> int:
+        """오늘 연습 기록이 있어야 연속 일수로 인정 (오늘부터 역순으로 센 연속 일수)"""
+        today = today or date.today()
+        if self.last_practice_date != today:
+            return 0
+        return self.current_streak
+
+
+def get_streaks(db: Session, user_ids: Optional[Sequence[int]] = None) -> Dict[int, StreakInfo]:
+    """
+    여러 사용자의 연속 연습 정보를 한 번의 쿼리로 계산
+
+    Args:
+        user_ids: 대상 사용자 ID 목록 (None이면 전체 사용자)
+
+    Returns:
+        {user_id: StreakInfo} (연습 기록이 없는 사용자는 포함되지 않음)
+    """
+    if user_ids is not None and not user_ids:
+        return {}
+
+    row_number = func.row_number().over(
+        partition_by=PracticeDailyTotal.user_id,
+        order_by=PracticeDailyTotal.practice_date
+    )
+    islands = select(
+        PracticeDailyTotal.user_id,
+        PracticeDailyTotal.practice_date,
+        (PracticeDailyTotal.practice_date - cast(row_number, Integer)).label("island")
+    )
+    if user_ids is not None:
+        islands = islands.where(PracticeDailyTotal.user_id.in_(list(user_ids)))
+    islands = islands.subquery("islands")
+
+    runs = select(
+        islands.c.user_id,
+        func.max(islands.c.practice_date).label("end_date"),
+        func.count().label("length")
+    ).group_by(islands.c.user_id, islands.c.island).subquery("runs")
+
+    stmt = select(
+        runs.c.user_id,
+        func.max(runs.c.end_date).label("last_date"),
+        func.max(runs.c.length).label("longest"),
+        func.array_agg(aggregate_order_by(runs.c.length, runs.c.end_date.desc()))[1].label("current")
+    ).group_by(runs.c.user_id)
+
+    return {
+        row.user_id: StreakInfo(
+            last_practice_date=row.last_date,
+            current_streak=int(row.current or 0),
+            longest_streak=int(row.longest or 0)
+        )
+        for row in db.execute(stmt)
+    }
+
+
+def get_user_streak(db: Session, user_id: int) -> StreakInfo:
+    """한 사용자의 연속 연습 정보"""
+    return get_streaks(db, [user_id]).get(user_id, StreakInfo())
@@ -0,0 +1,149 @@
+"""
+게시판 태그 통계 서비스
+- tag_stats: 태그 -> 노출 게시글 수(삭제/숨김 제외), 마지막 사용 시간
+- 게시글 작성/수정/삭제/숨김/복구 시 변경 전후의 (태그, 노출 여부)를 비교하여 증분 갱신
+- 자동완성/인기 태그는 tag_stats 인덱스 조회만으로 응답 (게시글 배열 unnest 없음)
+- 어긋난 값은 전체 재계산 명령으로 보정 (주기 실행용)
+
+    python -m app.services.tag_stats rebuild
+"""
+import logging
+import sys
+from datetime import datetime, timedelta
+from typing import Iterable, List, Optional, Set
+from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from app.models.board import Post, TagStat
+
+logger = logging.getLogger(__name__)
+
+TRENDING_DAYS = 7
+MAX_TAG_LENGTH = 100  # tag_stats.tag 길이
+
+
+def normalize_tags(tags: Optional[Iterable[str]]) -> Set[str]:
+    """공백 제거, 빈 태그/중복 제거 (MAX_TAG_LENGTH 초과 태그는 통계에서 제외)"""
+    return {
+        tag.strip() for tag in (tags or [])
+        if tag and tag.strip() and len(tag.strip()) <= MAX_TAG_LENGTH
+    }
+
+
+def clean_tags(tags: Optional[Iterable[str]]) -> Optional[List[str]]:
+    """저장용 태그 목록 (공백 제거, MAX_TAG_LENGTH로 자름, 빈 태그/중복 제거, 입력 순서 유지, 비어 있으면 None)"""
+    cleaned: List[str] = []
+    for tag in tags or []:
+        tag = tag.strip()[:MAX_TAG_LENGTH] if tag else ""
+        if tag and tag not in cleaned:
+            cleaned.append(tag)
+    return cleaned or None
+
+
+def is_visible(post: Post) -> bool:
+    """목록에 노출되는 게시글인지 (board._visible_posts_filter와 같은 조건)"""
+    return post.deleted_at is None and not post.is_hidden
+
+
+def visible_tags(post: Post) -> Set[str]:
+    """통계에 반영되는 게시글 태그 (노출되지 않는 게시글은 빈 집합)"""
+    return normalize_tags(post.manual_tags) if is_visible(post) else set()
+
+
+def apply_tag_change(db: Session, before: Set[str], after: Set[str]) -> None:
+    """
+    게시글 하나의 반영 태그 변경을 통계에 적용 (커밋하지 않음)
+
+    Args:
+        before: 변경 전 반영 태그 (visible_tags)
+        after: 변경 후 반영 태그 (visible_tags)
+    """
+    added = sorted(after - before)
+    removed = sorted(before - after)
+
+    if added:
+        stmt = pg_insert(TagStat).values([
+            {"tag": tag, "post_count": 1, "last_used_at": func.now()} for tag in added
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[TagStat.tag],
+            set_={
+                "post_count": TagStat.post_count + 1,
+                "last_used_at": stmt.excluded.last_used_at,
+            }
+        )
+        db.execute(stmt)
+
+    if removed:
+        db.query(TagStat).filter(TagStat.tag.in_(removed)).update(
+            {TagStat.post_count: func.greatest(TagStat.post_count - 1, 0)},
+            synchronize_session=False
+        )
+
+
+def autocomplete(db: Session, prefix: str, limit: int = 10) -> List[TagStat]:
+    """접두사로 시작하는 태그 (노출 게시글 수 많은 순)"""
+    prefix = prefix.strip()
+    if not prefix:
+        return []
+    pattern = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    return db.query(TagStat).filter(
+        and_(
+            TagStat.tag.like(pattern, escape="\\"),
+            TagStat.post_count > 0
+        )
+    ).order_by(TagStat.post_count.desc(), TagStat.tag).limit(limit).all()
+
+
+def trending(db: Session, days: int = TRENDING_DAYS, limit: int = 10) -> List[TagStat]:
+    """최근 days일 안에 사용된 태그 중 노출 게시글 수 많은 순"""
+    since = datetime.utcnow() - timedelta(days=days)
+    return db.query(TagStat).filter(
+        and_(
+            TagStat.last_used_at >= since,
+            TagStat.post_count > 0
+        )
+    ).order_by(TagStat.post_count.desc(), TagStat.last_used_at.desc()).limit(limit).all()
+
+
+def rebuild_tag_stats(db: Session) -> int:
+    """
+    노출 게시글 태그로 tag_stats 전체 재계산 (주기 실행용)
+    - 게시글이 없어진 태그는 post_count 0으로 유지 (last_used_at 보존)
+
+    Returns:
+        post_count가 1 이상인 태그 수
+    """
+    db.query(TagStat).update({TagStat.post_count: 0}, synchronize_session=False)
+    counted = db.execute(text("""
+        INSERT INTO tag_stats (tag, post_count, last_used_at)
+        SELECT btrim(t.tag), count(DISTINCT p.post_id), max(coalesce(p.updated_at, p.created_at, now()))
+        FROM posts p, unnest(p.manual_tags) AS t(tag)
+        WHERE p.deleted_at IS NULL
+          AND (p.is_hidden = false OR p.is_hidden IS NULL)
+          AND btrim(t.tag) <> ''
+          AND length(btrim(t.tag)) <= :max_length
+        GROUP BY btrim(t.tag)
+        ON CONFLICT (tag) DO UPDATE
+        SET post_count = EXCLUDED.post_count,
+            last_used_at = GREATEST(tag_stats.last_used_at, EXCLUDED.last_used_at)
+    """), {"max_length": MAX_TAG_LENGTH}).rowcount
+    db.commit()
+    logger.info(f"태그 통계 재계산 완료: tags={counted}")
+    return counted
+
+
+if __name__ == "__main__":
+    # 직접 실행 시 태그 통계 전체 재계산
+    from app.core.database import SessionLocal
+
+    if len(sys.argv) < 2 or sys.argv[1] != "rebuild":
+        print("사용법: python -m app.services.tag_stats rebuild")
+        sys.exit(1)
+
+    db = SessionLocal()
+    try:
+        count = rebuild_tag_stats(db)
+        print(f"✅ 태그 통계가 재계산되었습니다. (태그 {count}개)")
+    finally:
+        db.close()
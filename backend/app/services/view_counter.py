@@ -0,0 +1,171 @@
+"""
+게시글 조회수 지연 반영(write-behind) 서비스
+- 조회 시 DB에 쓰지 않고 워커 메모리에 post_id별 증가분을 모아 두었다가
+  UPDATE posts SET view_count = view_count + n 한 번으로 일괄 반영
+- 같은 조회자(로그인 사용자 ID, 비로그인은 IP)가 VIEW_DEDUP_WINDOW 안에 다시 조회하면 세지 않음
+  (중복 판정은 워커 프로세스 단위이므로 여러 워커에 나뉘어 들어온 새로고침은 워커 수만큼 셀 수 있음)
+- 반영 시점: 반영 스레드(start_flusher)가 FLUSH_INTERVAL마다, 그리고 애플리케이션 종료(shutdown) 시
+  (조회 요청은 메모리에 기록만 하고 요청 세션으로 커밋하지 않음)
+- 유실 범위: 워커가 비정상 종료되면 마지막 반영 이후 쌓인 증가분(최대 FLUSH_INTERVAL 동안의 조회)이 사라짐
+  (반영 스레드 없이 실행하면 종료 시까지 반영되지 않으므로 유실 범위에 상한이 없음)
+  조회수는 근사치여도 되는 지표이므로 이 손실을 허용하고 조회 요청의 행 잠금/쓰기를 없앰
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+VIEW_DEDUP_WINDOW = 30 * 60  # 초, 같은 조회자의 재조회를 세지 않는 시간
+FLUSH_INTERVAL = 10.0  # 초
+MAX_RECENT_VIEWERS = 100_000  # 중복 판정용 기록 최대 개수 (메모리 상한)
+
+_lock = threading.Lock()
+_pending: Dict[int, int] = {}
+_pending_total = 0
+_recent: "OrderedDict[Tuple[int, str], float]" = OrderedDict()  # (post_id, 조회자) -> 처음 센 시간 (시간순)
+
+
+def viewer_key(user_id: Optional[int], client_host: Optional[str]) -> str:
+    """중복 판정용 조회자 키 (로그인 사용자는 사용자 ID, 비로그인은 IP)"""
+    if user_id:
+        return f"user:{user_id}"
+    return f"ip:{client_host or 'unknown'}"
+
+
+def _prune_recent(now: float) -> None:
+    """중복 판정 기록 정리 (_lock 보유 상태에서 호출)"""
+    while _recent:
+        key, seen_at = next(iter(_recent.items()))
+        if now - seen_at < VIEW_DEDUP_WINDOW and len(_recent) <= MAX_RECENT_VIEWERS:
+            break
+        del _recent[key]
+
+
+def record_view(post_id: int, viewer: str, now: Optional[float] = None) -> bool:
+    """
+    조회 기록 (DB 접근 없음)
+
+    Returns:
+        조회수에 반영될 조회이면 True, 중복 조회이면 False
+    """
+    global _pending_total
+    now = time.monotonic() if now is None else now
+    key = (post_id, viewer)
+    with _lock:
+        seen_at = _recent.get(key)
+        if seen_at is not None and now - seen_at < VIEW_DEDUP_WINDOW:
+            return False
+        _recent.pop(key, None)
+        _recent[key] = now
+        _pending[post_id] = _pending.get(post_id, 0) + 1
+        _pending_total += 1
+        _prune_recent(now)
+    return True
+
+
+def pending_views(post_id: int) -> int:
+    """아직 DB에 반영되지 않은 조회수 (응답에 더해 보여주기용)"""
+    with _lock:
+        return _pending.get(post_id, 0)
+
+
+def flush(db: Session) -> int:
+    """
+    쌓인 조회수를 한 번의 UPDATE로 반영 (커밋 포함)
+    - 실패하면 증가분을 되돌려 놓아 다음 반영 때 다시 시도
+
+    Returns:
+        반영한 조회수 합계
+    """
+    global _pending, _pending_total
+    with _lock:
+        batch, _pending = _pending, {}
+        _pending_total = 0
+    if not batch:
+        return 0
+
+    post_ids = list(batch.keys())
+    counts = [batch[post_id] for post_id in post_ids]
+    try:
+        db.execute(text("""
+            UPDATE posts p
+            SET view_count = coalesce(p.view_count, 0) + v.n
+            FROM unnest(CAST(:post_ids AS integer[]), CAST(:counts AS integer[])) AS v(post_id, n)
+            WHERE p.post_id = v.post_id
+        """), {"post_ids": post_ids, "counts": counts})
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        _restore(batch)
+        logger.error(f"조회수 반영 실패: posts={len(batch)}, error={e}")
+        return 0
+    return sum(counts)
+
+
+def _restore(batch: Dict[int, int]) -> None:
+    """반영에 실패한 증가분 되돌리기"""
+    global _pending_total
+    with _lock:
+        for post_id, count in batch.items():
+            _pending[post_id] = _pending.get(post_id, 0) + count
+            _pending_total += count
+
+
+def reset() -> None:
+    """반영하지 않고 모든 상태 비우기 (테스트용)"""
+    global _pending, _pending_total
+    with _lock:
+        _pending = {}
+        _pending_total = 0
+        _recent.clear()
+
+
+# ========== 반영 스레드 (API 프로세스) ==========
+
+def run_flusher(session_factory: Callable[[], Session], stop_event: threading.Event, interval: float = FLUSH_INTERVAL) -> None:
+    """stop_event가 설정될 때까지 interval마다 쌓인 조회수 반영"""
+    while not stop_event.wait(interval):
+        with _lock:
+            due = _pending_total > 0
+        if not due:
+            continue
+        db = session_factory()
+        try:
+            flush(db)
+        except Exception as e:
+            logger.error(f"조회수 반영 스레드 오류: {e}")
+        finally:
+            db.close()
+
+
+_flusher_thread: Optional[threading.Thread] = None
+_flusher_stop = threading.Event()
+
+
+def start_flusher(session_factory: Callable[[], Session], interval: float = FLUSH_INTERVAL) -> None:
+    """반영 스레드 시작 (이미 실행 중이면 무시)"""
+    global _flusher_thread
+    if _flusher_thread is not None and _flusher_thread.is_alive():
+        return
+    _flusher_stop.clear()
+    _flusher_thread = threading.Thread(
+        target=run_flusher,
+        args=(session_factory, _flusher_stop, interval),
+        name="view-count-flusher",
+        daemon=True
+    )
+    _flusher_thread.start()
+
+
+def stop_flusher(timeout: float = 5.0) -> None:
+    """반영 스레드 종료 (남은 증가분은 종료 시 flush()로 반영)"""
+    global _flusher_thread
+    _flusher_stop.set()
+    if _flusher_thread is not None:
+        _flusher_thread.join(timeout)
+        _flusher_thread = None
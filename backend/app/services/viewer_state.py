@@ -0,0 +1,69 @@
+"""
+게시판 조회자 상태 서비스
+- 현재 사용자의 좋아요/북마크/신고 여부를 페이지에 포함된 게시글/댓글 ID로만 조회
+- 종류별로 IN (...) 쿼리 한 번씩, 결과는 ID 집합으로 반환
+  (게시글의 전체 좋아요/북마크/신고 목록을 불러오지 않으므로 조회 행 수는 페이지 크기 이하)
+"""
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, Set
+from sqlalchemy.orm import Session
+from sqlalchemy import and_
+from app.models.board import PostLike, PostBookmark, PostReport, CommentLike
+
+
+@dataclass(frozen=True)
+class PostViewerState:
+    """현재 사용자가 좋아요/북마크/신고한 게시글 ID 집합"""
+    liked_post_ids: Set[int] = field(default_factory=set)
+    bookmarked_post_ids: Set[int] = field(default_factory=set)
+    reported_post_ids: Set[int] = field(default_factory=set)
+
+
+EMPTY_POST_VIEWER_STATE = PostViewerState()
+
+
+def get_post_viewer_state(db: Session, user_id: Optional[int], post_ids: Iterable[int]) -> PostViewerState:
+    """
+    게시글 ID 목록에 대한 현재 사용자의 좋아요/북마크/신고 여부 조회
+    - 비로그인 사용자나 빈 목록이면 쿼리하지 않음
+    """
+    post_ids = list(set(post_ids))
+    if not user_id or not post_ids:
+        return EMPTY_POST_VIEWER_STATE
+
+    liked = {
+        row.post_id for row in db.query(PostLike.post_id).filter(
+            and_(PostLike.user_id == user_id, PostLike.post_id.in_(post_ids))
+        )
+    }
+    bookmarked = {
+        row.post_id for row in db.query(PostBookmark.post_id).filter(
+            and_(PostBookmark.user_id == user_id, PostBookmark.post_id.in_(post_ids))
+        )
+    }
+    reported = {
+        row.post_id for row in db.query(PostReport.post_id).filter(
+            and_(PostReport.reporter_id == user_id, PostReport.post_id.in_(post_ids))
+        )
+    }
+    return PostViewerState(
+        liked_post_ids=liked,
+        bookmarked_post_ids=bookmarked,
+        reported_post_ids=reported
+    )
+
+
+def get_liked_comment_ids(db: Session, user_id: Optional[int], comment_ids: Iterable[int]) -> Set[int]:
+    """
+    댓글 ID 목록 중 현재 사용자가 좋아요한 댓글 ID 집합
+    - 비로그인 사용자나 빈 목록이면 쿼리하지 않음
+    """
+    comment_ids = list(set(comment_ids))
+    if not user_id or not comment_ids:
+        return set()
+
+    return {
+        row.comment_id for row in db.query(CommentLike.comment_id).filter(
+            and_(CommentLike.user_id == user_id, CommentLike.comment_id.in_(comment_ids))
+        )
+    }
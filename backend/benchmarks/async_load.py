@@ -0,0 +1,104 @@
+"""
+읽기 엔드포인트 동시 부하 벤치마크 (비동기 DB 세션 적용 전후 비교용)
+
+실행 중인 API 서버(워커 1개)에 로그인한 사용자 하나로 연습 기록/알림/게시판/그룹 통계 조회를
+동시에 반복 호출하고, 처리량(req/s)과 엔드포인트별 p50/p99를 출력합니다.
+동기 세션을 쓰는 async 엔드포인트는 쿼리가 끝날 때까지 이벤트 루프를 막으므로 동시 요청 수를 늘려도
+처리량이 거의 늘지 않고 지연 시간만 길어지며, 비동기 세션(get_async_db)에서는 쿼리를 기다리는 동안
+다른 요청이 처리되어 처리량이 연결 풀 크기까지 늘어납니다.
+
+    cd backend
+    uvicorn app.main:app --workers 1 &
+    python -m benchmarks.async_load --base-url http://localhost:8000 --concurrency 50 --duration 20 --register
+
+같은 옵션으로 이전 버전 서버에서도 실행하여 결과를 비교합니다. (httpx 필요: requirements-test.txt)
+"""
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+EMAIL = "bench-load@example.com"
+PASSWORD = "bench-password-1234"
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _paths(group_id: Optional[int]) -> List[str]:
+    paths = [
+        "/api/practice/sessions",
+        "/api/practice/statistics",
+        "/api/notifications",
+        "/api/notifications/unread-count",
+        "/api/board/posts",
+    ]
+    if group_id is not None:
+        paths += [
+            f"/api/groups/{group_id}/statistics",
+            f"/api/groups/{group_id}/members/statistics",
+        ]
+    return paths
+
+
+async def _login(client: httpx.AsyncClient, register: bool) -> None:
+    if register:
+        await client.post("/api/auth/register", json={
+            "email": EMAIL, "password": PASSWORD, "nickname": "bench-load"
+        })
+    response = await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+    response.raise_for_status()
+    client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+
+async def run(base_url: str, concurrency: int, duration: float, group_id: Optional[int], register: bool) -> None:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0, limits=limits) as client:
+        await _login(client, register)
+        paths = _paths(group_id)
+        latencies: Dict[str, List[float]] = {path: [] for path in paths}
+        errors: Dict[int, int] = {}
+        deadline = time.perf_counter() + duration
+
+        async def _worker(offset: int):
+            for path in itertools.islice(itertools.cycle(paths), offset, None):
+                if time.perf_counter() >= deadline:
+                    return
+                started = time.perf_counter()
+                response = await client.get(path)
+                latencies[path].append((time.perf_counter() - started) * 1000)
+                if response.status_code >= 400:
+                    errors[response.status_code] = errors.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker(i % len(paths)) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    total = sum(len(values) for values in latencies.values())
+    print(f"동시 {concurrency}, {elapsed:.1f}초, 요청 {total}회, {total / elapsed:.1f} req/s, 오류: {errors or '없음'}")
+    for path, values in latencies.items():
+        print(
+            f"{path:45} n={len(values):6} "
+            f"p50={statistics.median(values) if values else 0:.1f}ms "
+            f"p99={_percentile(values, 99):.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="읽기 엔드포인트 동시 부하 벤치마크")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=20.0, help="측정 시간 (초)")
+    parser.add_argument("--group-id", type=int, default=None, help="그룹 통계 엔드포인트도 포함 (공개 그룹 또는 가입한 그룹)")
+    parser.add_argument("--register", action="store_true", help="벤치마크용 계정 생성")
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.concurrency, args.duration, args.group_id, args.register))
@@ -0,0 +1,99 @@
+"""
+로그인 폭주 중 다른 엔드포인트 지연 시간 측정 벤치마크
+
+실행 중인 API 서버(워커 1개 권장)에 로그인 요청을 동시에 보내면서,
+같은 시간 동안 가벼운 엔드포인트(GET /health)의 응답 시간을 계속 측정하여 p50/p99를 출력합니다.
+비밀번호 해싱이 이벤트 루프에서 실행되면 로그인 하나가 끝날 때까지 다른 요청이 멈추므로 p99가 수백 ms~수 초로 늘어나고,
+전용 풀(app.core.password_pool)에서 실행되면 로그인 중에도 p99가 거의 그대로 유지됩니다.
+
+    cd backend
+    uvicorn app.main:app --workers 1 &
+    python -m benchmarks.login_burst --base-url http://localhost:8000 --logins 40 --concurrency 20
+
+로그인 계정이 없으면 먼저 --register 옵션으로 만듭니다. (httpx 필요: requirements-test.txt)
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+
+EMAIL = "bench-login@example.com"
+PASSWORD = "bench-password-1234"
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def _probe(client: httpx.AsyncClient, path: str, stop: asyncio.Event, latencies: List[float]) -> None:
+    """stop까지 가벼운 엔드포인트를 반복 호출하며 응답 시간(ms) 기록"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path)
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0.01)
+
+
+async def _login_burst(client: httpx.AsyncClient, logins: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    codes: dict = {}
+
+    async def _login():
+        async with semaphore:
+            response = await client.post("/api/auth/login", json={"email": EMAIL, "password": PASSWORD})
+            codes[response.status_code] = codes.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(_login() for _ in range(logins)))
+    return codes
+
+
+async def run(base_url: str, logins: int, concurrency: int, probe_path: str, register: bool) -> None:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60.0) as client:
+        if register:
+            await client.post("/api/auth/register", json={
+                "email": EMAIL, "password": PASSWORD, "nickname": "bench-login"
+            })
+
+        # 기준선: 로그인 없이 측정
+        baseline: List[float] = []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe(client, probe_path, stop, baseline))
+        await asyncio.sleep(2.0)
+        stop.set()
+        await probe
+
+        # 로그인 폭주 중 측정
+        during: List[float] = []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(_probe(client, probe_path, stop, during))
+        started = time.perf_counter()
+        codes = await _login_burst(client, logins, concurrency)
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await probe
+
+    print(f"로그인 {logins}회 (동시 {concurrency}), {elapsed:.2f}초, 응답 코드: {codes}")
+    for label, values in (("기준선", baseline), ("로그인 중", during)):
+        print(
+            f"{label:6} {probe_path}: n={len(values)} "
+            f"p50={statistics.median(values) if values else 0:.1f}ms "
+            f"p99={_percentile(values, 99):.1f}ms max={max(values, default=0):.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 다른 엔드포인트 지연 시간 측정")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--logins", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--probe-path", default="/health")
+    parser.add_argument("--register", action="store_true", help="벤치마크용 계정 생성")
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.logins, args.concurrency, args.probe_path, args.register))
@@ -1,16 +1,22 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
-from main import app  # backend/app/main.py -> backend/main.py (if run from backend root) or app.main
 import os
+# Tests dispatch notification events explicitly (notification_outbox.dispatch_batch)
+os.environ.setdefault("NOTIFICATION_DISPATCHER_ENABLED", "false")
+# The push listener would LISTEN on the application database, not the test database
+os.environ.setdefault("NOTIFICATION_PUSH_ENABLED", "false")
+# The view count flusher would write pending test views to the application database
+os.environ.setdefault("VIEW_COUNT_FLUSHER_ENABLED", "false")
+from app.main import app
 import sys
 
 # Add the project root to the python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.core.database import Base, get_db
+from app.core.database import Base, get_async_db, get_db
 from app.core.security import create_access_token
 from app.models.user import User
 
@@ -33,12 +39,28 @@ def setup_test_db():
     # Import all models to ensure they are registered with Base.metadata
     import app.models  # noqa: F401
     
+    # Extensions used by indexes (e.g. pg_trgm trigram indexes on posts)
+    with engine.begin() as connection:
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
     # Create tables
     Base.metadata.create_all(bind=engine)
     yield
     # Drop tables
     Base.metadata.drop_all(bind=engine)
 
+@pytest.fixture(autouse=True)
+def clear_process_caches():
+    """
+    Process-wide caches must not leak between tests (each test rolls back its data).
+    """
+    from app.services import achievement_catalog, auth_cache
+    achievement_catalog.clear()
+    auth_cache.clear()
+    yield
+    achievement_catalog.clear()
+    auth_cache.clear()
+
 @pytest.fixture
 def db_session():
     """
@@ -55,6 +77,67 @@ def db_session():
     transaction.rollback()
     connection.close()
 
+class SyncBackedAsyncSession:
+    """
+    Minimal AsyncSession stand-in for get_async_db that runs on the test's sync session,
+    so async endpoints see the same rolled-back transaction (and the same connection for query counting).
+    """
+
+    def __init__(self, session):
+        self.sync_session = session
+
+    async def execute(self, *args, **kwargs):
+        return self.sync_session.execute(*args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return self.sync_session.scalar(*args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return self.sync_session.scalars(*args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return self.sync_session.get(*args, **kwargs)
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self.sync_session, *args, **kwargs)
+
+    async def refresh(self, instance, *args, **kwargs):
+        self.sync_session.refresh(instance, *args, **kwargs)
+
+    async def flush(self):
+        self.sync_session.flush()
+
+    async def commit(self):
+        self.sync_session.commit()
+
+    async def rollback(self):
+        self.sync_session.rollback()
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+@pytest.fixture
+def count_queries(db_session):
+    """
+    Runs a callable and counts the SQL statements executed on the test connection.
+    Usage: result, query_count = count_queries(lambda: client.get(...))
+    """
+    def _count_queries(func):
+        statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        connection = db_session.connection()
+        event.listen(connection, "before_cursor_execute", _before_cursor_execute)
+        try:
+            result = func()
+        finally:
+            event.remove(connection, "before_cursor_execute", _before_cursor_execute)
+        return result, len(statements)
+
+    return _count_queries
+
 @pytest.fixture
 def client(db_session):
     """
@@ -65,10 +148,17 @@ def client(db_session):
             yield db_session
         finally:
             pass
+
+    async def override_get_async_db():
+        yield SyncBackedAsyncSession(db_session)
             
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
+        # Pending view counts belong to rolled-back test data; don't flush them on shutdown
+        from app.services import view_counter
+        view_counter.reset()
     app.dependency_overrides.clear()
 
 @pytest.fixture
@@ -93,7 +183,7 @@ def token(test_user):
     """
     Generates a valid access token for the test user.
     """
-    return create_access_token(subject=str(test_user.user_id))
+    return create_access_token({"sub": str(test_user.user_id)})
 
 @pytest.fixture
 def authorized_client(client, token):
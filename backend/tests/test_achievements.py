@@ -0,0 +1,62 @@
+from fastapi import status
+from datetime import date
+from app.models.achievement import Achievement, UserAchievement
+from app.services import achievement_engine
+
+def test_award_achievements_on_session_end(authorized_client, db_session, test_user):
+    """
+    Test that ending a session awards matching achievements exactly once
+    """
+    time_achievement = Achievement(title="First Hour", condition_type="practice_time", condition_value=3600)
+    session_achievement = Achievement(title="First Session", condition_type="total_sessions", condition_value=1)
+    unreachable = Achievement(title="Ten Sessions", condition_type="total_sessions", condition_value=10)
+    db_session.add_all([time_achievement, session_achievement, unreachable])
+    db_session.commit()
+
+    session = authorized_client.post("/api/practice/sessions", json={
+        "practice_date": str(date.today()),
+        "instrument": "Piano"
+    }).json()
+    response = authorized_client.put(f"/api/practice/sessions/{session['session_id']}", json={
+        "end_time": str(date.today()) + "T23:59:59",
+        "actual_play_time": 3600
+    })
+    assert response.status_code == status.HTTP_200_OK
+
+    earned_ids = {
+        ua.achievement_id for ua in db_session.query(UserAchievement).filter(
+            UserAchievement.user_id == test_user.user_id
+        )
+    }
+    assert earned_ids == {time_achievement.achievement_id, session_achievement.achievement_id}
+
+    # Re-evaluating must not award duplicates
+    result = achievement_engine.evaluate_user_achievements(db_session, test_user.user_id)
+    assert result.newly_earned == []
+    assert "load_metrics" in result.timings
+
+def test_achievement_catalog_cache(authorized_client, db_session, test_user, count_queries):
+    """
+    Test author rendering reads achievements from the cached catalog and admin edits invalidate it
+    """
+    from app.models.cache_version import CacheVersion
+    from app.services import achievement_catalog
+    achievement = Achievement(title="Cached", condition_type="total_sessions", condition_value=1)
+    db_session.add(achievement)
+    db_session.flush()
+    db_session.add(UserAchievement(user_id=test_user.user_id, achievement_id=achievement.achievement_id))
+    test_user.selected_achievement_id = achievement.achievement_id
+    test_user.is_admin = True
+    db_session.commit()
+
+    assert achievement_catalog.get_achievement(db_session, achievement.achievement_id).title == "Cached"
+    cached, query_count = count_queries(
+        lambda: [achievement_catalog.get_achievement(db_session, achievement.achievement_id) for _ in range(100)]
+    )
+    assert query_count == 0
+    assert all(a.title == "Cached" for a in cached)
+
+    response = authorized_client.patch(f"/api/achievements/{achievement.achievement_id}", json={"title": "Renamed"})
+    assert response.status_code == status.HTTP_200_OK
+    assert db_session.query(CacheVersion.version).filter(CacheVersion.name == "achievements").scalar() == 1
+    assert achievement_catalog.get_achievement(db_session, achievement.achievement_id).title == "Renamed"
@@ -52,3 +52,50 @@ def test_login_user(client, db_session):
     data = response.json()
     assert "access_token" in data
     assert data["token_type"] == "bearer"
+
+def test_authenticated_user_is_cached_until_invalidated(authorized_client, db_session, count_queries):
+    """
+    Test repeated authenticated requests skip the users lookup and account deletion takes effect at once
+    """
+    db_session.expire_all()
+    _, cold_count = count_queries(lambda: authorized_client.get("/api/practice/sessions/active"))
+    db_session.expire_all()
+    response, warm_count = count_queries(lambda: authorized_client.get("/api/practice/sessions/active"))
+    assert response.status_code == status.HTTP_200_OK
+    assert warm_count == cold_count - 1
+
+    assert authorized_client.delete("/api/users/me").status_code == status.HTTP_200_OK
+    response = authorized_client.get("/api/practice/sessions/active")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    assert response.json()["detail"] == "탈퇴한 사용자입니다."
+
+def test_password_pool_rejects_when_saturated(client, monkeypatch):
+    """
+    Test password hashing runs through the bounded pool and fails fast with 503 when it is full
+    """
+    from app.core import password_pool
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_PENDING", 0)
+    response = client.post("/api/auth/register", json={
+        "email": "busy@example.com", "password": "busypassword", "nickname": "Busy"
+    })
+    assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert response.headers["Retry-After"] == "1"
+    assert password_pool.get_metrics()["rejected"] >= 1
+
+def test_password_pool_counts_failed_jobs_separately():
+    """
+    Test jobs that raise are counted as failed, not completed
+    """
+    import asyncio
+    import pytest
+    from app.core import password_pool
+
+    before = password_pool.get_metrics()
+    with pytest.raises(ValueError):
+        asyncio.run(password_pool._run(int, "not-a-number"))
+    after = password_pool.get_metrics()
+    assert after["failed"] == before["failed"] + 1
+    assert after["completed"] == before["completed"]
+    assert after["pending"] == 0
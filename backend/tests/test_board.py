@@ -0,0 +1,347 @@
+from fastapi import status
+
+def _create_posts(client, count):
+    return [
+        client.post("/api/board/posts", json={"title": f"Post {i}", "content": "content", "category": "free"}).json()["post_id"]
+        for i in range(count)
+    ]
+
+def test_get_posts_cursor_pagination(authorized_client):
+    """
+    Test keyset pagination returns every post exactly once in newest-first order
+    """
+    post_ids = _create_posts(authorized_client, 5)
+
+    seen = []
+    cursor = ""
+    while True:
+        response = authorized_client.get("/api/board/posts", params={"cursor": cursor, "page_size": 2})
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total_is_estimate"] is True
+        seen.extend(post["post_id"] for post in data["posts"])
+        if not data["has_more"]:
+            assert data["next_cursor"] is None
+            break
+        cursor = data["next_cursor"]
+
+    assert seen == sorted(post_ids, reverse=True)
+
+def test_get_posts_page_mode_and_invalid_cursor(authorized_client):
+    """
+    Test page mode keeps exact totals and bad cursors are rejected
+    """
+    _create_posts(authorized_client, 3)
+
+    data = authorized_client.get("/api/board/posts", params={"page": 1, "page_size": 2}).json()
+    assert data["total"] == 3
+    assert data["total_pages"] == 2
+    assert data["has_more"] is True
+    assert data["total_is_estimate"] is False
+
+    response = authorized_client.get("/api/board/posts", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+def test_get_posts_estimated_total_with_colon_in_search(authorized_client):
+    """
+    Test the EXPLAIN-based total estimate passes search terms as bind parameters (":b" is not a placeholder)
+    """
+    authorized_client.post("/api/board/posts", json={"title": "a :b", "content": "colon :b test", "category": "free"})
+
+    response = authorized_client.get(
+        "/api/board/posts", params={"cursor": "", "with_total": True, "search": "a :b"}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total_is_estimate"] is True
+    assert data["total"] >= 0
+
+def test_comment_count_maintained_on_write(authorized_client, db_session):
+    """
+    Test comment_count follows comment create/delete and reconcile fixes drift
+    """
+    from app.models.board import Post
+    from app.services import board_counters
+
+    post_id = _create_posts(authorized_client, 1)[0]
+    first = authorized_client.post(f"/api/board/posts/{post_id}/comments", json={"content": "first"}).json()
+    authorized_client.post(
+        f"/api/board/posts/{post_id}/comments",
+        json={"content": "reply", "parent_comment_id": first["comment_id"]}
+    )
+    assert authorized_client.get(f"/api/board/posts/{post_id}").json()["comment_count"] == 2
+
+    assert authorized_client.delete(f"/api/board/comments/{first['comment_id']}").status_code == status.HTTP_200_OK
+    assert authorized_client.delete(f"/api/board/comments/{first['comment_id']}").status_code == status.HTTP_404_NOT_FOUND
+    assert authorized_client.get(f"/api/board/posts/{post_id}").json()["comment_count"] == 1
+
+    db_session.query(Post).filter(Post.post_id == post_id).update({Post.comment_count: 7})
+    db_session.commit()
+    assert board_counters.reconcile_comment_counts(db_session) == 1
+    assert board_counters.reconcile_comment_counts(db_session) == 0
+    db_session.expire_all()
+    assert db_session.query(Post).get(post_id).comment_count == 1
+
+def test_viewer_state_only_reflects_current_user(authorized_client, db_session, test_user):
+    """
+    Test is_liked/is_bookmarked come from the current user's rows only
+    """
+    from app.models.user import User
+    from app.models.board import PostLike, PostBookmark
+
+    post_ids = _create_posts(authorized_client, 3)
+    for i in range(5):
+        other = User(
+            email=f"liker{i}@example.com",
+            nickname=f"liker{i}",
+            unique_code=f"LIKER{i:07d}",
+            password_hash="hashed_password",
+            is_active=True
+        )
+        db_session.add(other)
+        db_session.flush()
+        db_session.add_all([PostLike(post_id=post_id, user_id=other.user_id) for post_id in post_ids])
+    db_session.add(PostLike(post_id=post_ids[0], user_id=test_user.user_id))
+    db_session.add(PostBookmark(post_id=post_ids[1], user_id=test_user.user_id))
+    db_session.commit()
+
+    posts = {post["post_id"]: post for post in authorized_client.get("/api/board/posts").json()["posts"]}
+    assert [posts[post_id]["is_liked"] for post_id in post_ids] == [True, False, False]
+    assert [posts[post_id]["is_bookmarked"] for post_id in post_ids] == [False, True, False]
+
+    detail = authorized_client.get(f"/api/board/posts/{post_ids[0]}").json()
+    assert detail["is_liked"] is True
+    assert detail["is_bookmarked"] is False
+
+def test_search_posts_ranks_and_highlights(authorized_client):
+    """
+    Test Korean substring search, filters inside the search query, ranking and escaped snippets
+    """
+    posts = [
+        {"title": "피아노 연습 루틴", "content": "매일 스케일 연습을 합니다 <b>꾸준히</b>", "category": "tip"},
+        {"title": "기타 질문", "content": "코드 전환 연습이 어렵습니다", "category": "question"},
+        {"title": "자유 글", "content": "오늘은 쉬었습니다", "category": "free"},
+    ]
+    ids = [authorized_client.post("/api/board/posts", json=post).json()["post_id"] for post in posts]
+
+    data = authorized_client.get("/api/board/posts/search", params={"q": "연습"}).json()
+    assert data["total"] == 2
+    assert [post["post_id"] for post in data["posts"]] == [ids[0], ids[1]]  # title match ranks first
+    assert "<mark>연습</mark>" in data["posts"][0]["snippet"]
+    assert "&lt;b&gt;" in data["posts"][0]["snippet"]
+
+    data = authorized_client.get("/api/board/posts/search", params={"q": "연습", "category": "question"}).json()
+    assert [post["post_id"] for post in data["posts"]] == [ids[1]]
+
+    data = authorized_client.get("/api/board/posts", params={"search": "연습"}).json()
+    assert {post["post_id"] for post in data["posts"]} == {ids[0], ids[1]}
+
+def test_post_loads_do_not_select_search_vector(db_session):
+    """
+    Test the search tsvector is deferred (only used in WHERE/ORDER BY, never fetched with posts)
+    """
+    from sqlalchemy import select
+    from app.models.board import Post
+
+    assert "search_vector" not in str(select(Post).compile(db_session.get_bind()))
+
+def test_tag_stats_follow_post_lifecycle(authorized_client):
+    """
+    Test tag filter, autocomplete and trending tags track create/update/delete of posts
+    """
+    def _tags(path, **params):
+        data = authorized_client.get(f"/api/board/tags/{path}", params=params).json()
+        return {tag["tag"]: tag["post_count"] for tag in data["tags"]}
+
+    first = authorized_client.post("/api/board/posts", json={
+        "title": "a", "content": "a", "manual_tags": ["피아노", " 피아노연습 ", "피아노"]
+    }).json()
+    second = authorized_client.post("/api/board/posts", json={
+        "title": "b", "content": "b", "manual_tags": ["피아노", "기타"]
+    }).json()
+    assert first["tags"] == ["피아노", "피아노연습"]
+
+    assert _tags("autocomplete", prefix="피아") == {"피아노": 2, "피아노연습": 1}
+    assert _tags("trending") == {"피아노": 2, "피아노연습": 1, "기타": 1}
+
+    posts = authorized_client.get("/api/board/posts", params={"tag": "피아노"}).json()["posts"]
+    assert {post["post_id"] for post in posts} == {first["post_id"], second["post_id"]}
+
+    authorized_client.put(f"/api/board/posts/{second['post_id']}", json={"manual_tags": ["기타"]})
+    authorized_client.delete(f"/api/board/posts/{first['post_id']}")
+    assert _tags("autocomplete", prefix="피아") == {}
+    assert _tags("trending") == {"기타": 1}
+
+def test_post_views_are_deduplicated_and_flushed(authorized_client, db_session):
+    """
+    Test post views are counted once per viewer window and written in one batch
+    """
+    from app.models.board import Post
+    from app.services import view_counter
+
+    post_id = _create_posts(authorized_client, 1)[0]
+    view_counter.reset()
+
+    assert authorized_client.get(f"/api/board/posts/{post_id}").json()["view_count"] == 1
+    assert authorized_client.get(f"/api/board/posts/{post_id}").json()["view_count"] == 1  # refresh is not counted
+    assert view_counter.record_view(post_id, view_counter.viewer_key(None, "10.0.0.1")) is True
+
+    db_session.expire_all()
+    assert db_session.query(Post).get(post_id).view_count == 0  # not written yet
+
+    assert view_counter.flush(db_session) == 2
+    db_session.expire_all()
+    assert db_session.query(Post).get(post_id).view_count == 2
+
+def test_view_count_flusher_writes_without_detail_traffic(authorized_client, db_session):
+    """
+    Test the background flusher writes pending views even when no further detail requests arrive
+    """
+    import threading
+    import time
+    from app.models.board import Post
+    from app.services import view_counter
+    from tests.conftest import TestingSessionLocal
+
+    post_id = _create_posts(authorized_client, 1)[0]
+    view_counter.reset()
+    view_counter.record_view(post_id, view_counter.viewer_key(None, "10.0.0.2"))
+
+    stop = threading.Event()
+    flusher = threading.Thread(
+        target=view_counter.run_flusher,
+        args=(lambda: TestingSessionLocal(bind=db_session.connection()), stop, 0.05)
+    )
+    flusher.start()
+    try:
+        deadline = time.monotonic() + 5
+        while view_counter.pending_views(post_id) and time.monotonic() < deadline:
+            time.sleep(0.05)
+    finally:
+        stop.set()
+        flusher.join()
+
+    assert view_counter.pending_views(post_id) == 0
+    db_session.expire_all()
+    assert db_session.query(Post).get(post_id).view_count == 1
+    assert view_counter.pending_views(post_id) == 0
+
+def test_reaction_toggles_and_batch(authorized_client):
+    """
+    Test like/bookmark toggles and the batch endpoint report consistent state
+    """
+    post_id = _create_posts(authorized_client, 1)[0]
+    comment_id = authorized_client.post(f"/api/board/posts/{post_id}/comments", json={"content": "c"}).json()["comment_id"]
+
+    assert authorized_client.post(f"/api/board/posts/{post_id}/likes").json() == {"is_liked": True, "like_count": 1}
+    assert authorized_client.post(f"/api/board/posts/{post_id}/likes").json() == {"is_liked": False, "like_count": 0}
+    assert authorized_client.post(f"/api/board/posts/{post_id}/bookmarks").json() == {"is_bookmarked": True}
+    assert authorized_client.post("/api/board/posts/999999/likes").status_code == status.HTTP_404_NOT_FOUND
+
+    response = authorized_client.post("/api/board/reactions/batch", json={"actions": [
+        {"kind": "post_like", "target_id": post_id},
+        {"kind": "comment_like", "target_id": comment_id},
+        {"kind": "post_bookmark", "target_id": post_id},
+        {"kind": "post_like", "target_id": 999999},
+    ]})
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()["results"]
+    assert [(r["found"], r["is_active"], r["count"]) for r in results] == [
+        (True, True, 1), (True, True, 1), (True, False, None), (False, False, None)
+    ]
+
+def test_concurrent_likes_keep_exact_counts():
+    """
+    Test parallel like toggles from many users on separate connections keep like_count exact
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    from app.models.user import User
+    from app.models.board import Post, PostLike
+    from app.services import reactions
+    from tests.conftest import TestingSessionLocal
+
+    setup = TestingSessionLocal()
+    users = [
+        User(email=f"racer{i}@example.com", nickname=f"racer{i}", unique_code=f"RACER{i:07d}",
+             password_hash="hashed_password", is_active=True)
+        for i in range(20)
+    ]
+    setup.add_all(users)
+    setup.flush()
+    post = Post(user_id=users[0].user_id, title="race", content="race", like_count=0)
+    setup.add(post)
+    setup.commit()
+    user_ids = [user.user_id for user in users]
+    post_id = post.post_id
+
+    def _toggle(user_id):
+        session = TestingSessionLocal()
+        try:
+            result = reactions.toggle(session, reactions.POST_LIKE, post_id, user_id)
+            session.commit()
+            return result
+        finally:
+            session.close()
+
+    try:
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            assert all(r.is_active for r in pool.map(_toggle, user_ids))
+        setup.expire_all()
+        assert setup.query(Post).get(post_id).like_count == len(user_ids)
+        assert setup.query(PostLike).filter(PostLike.post_id == post_id).count() == len(user_ids)
+
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            assert not any(r.is_active for r in pool.map(_toggle, user_ids))
+        setup.expire_all()
+        assert setup.query(Post).get(post_id).like_count == 0
+    finally:
+        setup.query(User).filter(User.user_id.in_(user_ids)).delete(synchronize_session=False)
+        setup.commit()
+        setup.close()
+
+def test_comment_tree_single_query_and_cursor(authorized_client, db_session, count_queries):
+    """
+    Test deep reply chains load without per-level queries and top-level comments paginate by cursor
+    """
+    post_id = _create_posts(authorized_client, 1)[0]
+    roots = [
+        authorized_client.post(f"/api/board/posts/{post_id}/comments", json={"content": f"root {i}"}).json()["comment_id"]
+        for i in range(3)
+    ]
+    parent_id = roots[0]
+    for depth in range(5):
+        parent_id = authorized_client.post(
+            f"/api/board/posts/{post_id}/comments",
+            json={"content": f"depth {depth}", "parent_comment_id": parent_id}
+        ).json()["comment_id"]
+
+    db_session.expire_all()
+    response, query_count = count_queries(
+        lambda: authorized_client.get(f"/api/board/posts/{post_id}/comments")
+    )
+    data = response.json()
+    assert [c["comment_id"] for c in data["comments"]] == roots
+    node, depth = data["comments"][0], 0
+    while node["replies"]:
+        node, depth = node["replies"][0], depth + 1
+    assert depth == 5
+
+    # A post with only top-level comments needs the same number of queries
+    flat_post_id = _create_posts(authorized_client, 1)[0]
+    authorized_client.post(f"/api/board/posts/{flat_post_id}/comments", json={"content": "flat"})
+    db_session.expire_all()
+    _, flat_query_count = count_queries(
+        lambda: authorized_client.get(f"/api/board/posts/{flat_post_id}/comments")
+    )
+    assert flat_query_count == query_count
+
+    seen, cursor = [], ""
+    while True:
+        page = authorized_client.get(
+            f"/api/board/posts/{post_id}/comments", params={"cursor": cursor, "page_size": 2}
+        ).json()
+        seen.extend(c["comment_id"] for c in page["comments"])
+        if not page["has_more"]:
+            break
+        cursor = page["next_cursor"]
+    assert seen == roots
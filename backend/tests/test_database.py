@@ -0,0 +1,124 @@
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.core import db_pool
+from tests.conftest import SQLALCHEMY_DATABASE_URL
+
+
+def test_pool_monitor_records_checkouts_waits_and_timeouts():
+    """
+    Pool metrics track checked-out connections, checkout latency and timeouts when the pool is exhausted
+    """
+    engine = create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        poolclass=db_pool.TimedQueuePool,
+        pool_logging_name="test-pool",
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.2,
+    )
+    db_pool.instrument(engine, "test-pool")
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            metrics = db_pool.get_metrics()["test-pool"]
+            assert metrics["capacity"] == 1
+            assert metrics["checked_out"] == 1
+
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        metrics = db_pool.get_metrics()["test-pool"]
+        assert metrics["checked_out"] == 0
+        assert metrics["checkouts"] == 1
+        assert metrics["connects"] == 1
+        assert metrics["timeouts"] == 1
+        assert metrics["waits"] == 1
+        assert metrics["saturation_alarms"] >= 1
+        assert sum(metrics["checkout_histogram_ms"].values()) == 1
+    finally:
+        engine.dispose()
+
+
+def test_admin_pool_metrics_requires_admin(authorized_client):
+    """
+    Pool metrics endpoint is admin only
+    """
+    response = authorized_client.get("/api/admin/database/pool")
+    assert response.status_code == 403
+
+
+def test_ported_endpoints_run_on_real_async_engine():
+    """
+    Ported endpoints work on a real asyncpg AsyncSession (run_sync greenlet dispatch, lazy loads inside
+    run_sync, commit with expire_on_commit=False) - the shared test fixtures replace get_async_db with a sync shim,
+    so this test commits its own data and removes it afterwards
+    """
+    pytest.importorskip("asyncpg")
+    from fastapi.testclient import TestClient
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+    from app.core.database import get_async_db, get_db
+    from app.core.security import create_access_token
+    from app.models.board import Post
+    from app.models.user import User
+    from app.main import app
+    from tests.conftest import TestingSessionLocal
+
+    # NullPool: TestClient runs the app on its own event loop, asyncpg connections must not outlive it
+    async_engine = create_async_engine(db_pool.async_url(SQLALCHEMY_DATABASE_URL), poolclass=NullPool)
+    session_factory = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    setup = TestingSessionLocal()
+    user = User(
+        email="async-engine@example.com",
+        nickname="AsyncEngineUser",
+        unique_code="ASYNCENGINE1",
+        password_hash="hashed_password",
+        is_active=True
+    )
+    setup.add(user)
+    setup.commit()
+    user_id = user.user_id
+    setup.add(Post(user_id=user_id, title="async post", content="async content", category="free"))
+    setup.commit()
+
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    try:
+        with TestClient(app) as client:
+            client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(user_id)})}"
+
+            response = client.get("/api/notifications/unread-count")
+            assert response.status_code == 200
+            assert response.json()["unread_count"] == 0
+
+            # get_practice_stats creates and commits the rollup inside run_sync
+            response = client.get("/api/practice/statistics")
+            assert response.status_code == 200
+            assert response.json()["total_sessions"] == 0
+
+            # Post responses touch relationships inside run_sync
+            response = client.get("/api/board/posts", params={"author_id": user_id})
+            assert response.status_code == 200
+            assert [post["title"] for post in response.json()["posts"]] == ["async post"]
+    finally:
+        app.dependency_overrides.clear()
+        from app.services import view_counter
+        view_counter.reset()
+        setup.execute(text("DELETE FROM users WHERE user_id = :user_id"), {"user_id": user_id})
+        setup.commit()
+        setup.close()
+        async_engine.sync_engine.dispose()
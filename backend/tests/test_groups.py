@@ -0,0 +1,99 @@
+from fastapi import status
+from datetime import date, timedelta
+from app.models.user import User
+from app.models.group import Group, GroupMember
+from app.models.practice import PracticeDailyTotal
+
+def _create_group_with_members(db_session, owner, member_count, prefix):
+    group = Group(group_name=f"{prefix} group", owner_id=owner.user_id, is_public=True, max_members=500)
+    db_session.add(group)
+    db_session.flush()
+    db_session.add(GroupMember(group_id=group.group_id, user_id=owner.user_id, role="owner"))
+
+    today = date.today()
+    for i in range(member_count):
+        user = User(
+            email=f"{prefix}{i}@example.com",
+            nickname=f"{prefix}{i}",
+            # users.unique_code is String(12): 4-char prefix + 8-digit counter stays unique
+            unique_code=f"{prefix[:4].upper()}{i:08d}",
+            password_hash="hashed_password",
+            is_active=True
+        )
+        db_session.add(user)
+        db_session.flush()
+        db_session.add(GroupMember(group_id=group.group_id, user_id=user.user_id, role="member"))
+        # Half of the members have practice records (some of them without a stats rollup row)
+        if i % 2 == 0:
+            db_session.add_all([
+                PracticeDailyTotal(user_id=user.user_id, practice_date=today - timedelta(days=d), total_seconds=600, session_count=1)
+                for d in range(3)
+            ])
+    db_session.commit()
+    return group
+
+def test_member_statistics_query_count_is_flat(authorized_client, db_session, test_user, count_queries):
+    """
+    Query count for member statistics must not grow with group size
+    """
+    query_counts = {}
+    for size, prefix in ((2, "small"), (10, "medium"), (40, "large")):
+        group = _create_group_with_members(db_session, test_user, size, prefix)
+        # Warm-up request: the first request may fill the authenticated user cache (one extra users lookup)
+        authorized_client.get(f"/api/groups/{group.group_id}/members/statistics")
+        response, query_count = count_queries(
+            lambda: authorized_client.get(f"/api/groups/{group.group_id}/members/statistics")
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["total"] == size + 1
+        practiced = [m for m in data["members"] if m["total_sessions"] > 0]
+        assert len(practiced) == (size + 1) // 2
+        assert all(m["consecutive_days"] == 3 for m in practiced)
+        query_counts[size] = query_count
+
+    assert len(set(query_counts.values())) == 1, query_counts
+
+def test_group_statistics_periods(authorized_client, db_session, test_user, count_queries):
+    """
+    Test group statistics for custom periods and that query count does not depend on the range length
+    """
+    group = _create_group_with_members(db_session, test_user, 4, "period")
+    today = date.today()
+
+    def _get(**params):
+        return authorized_client.get(f"/api/groups/{group.group_id}/statistics", params=params)
+
+    response = _get(period="custom", start_date=str(today - timedelta(days=1)), end_date=str(today))
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    # 2 practicing members x 2 days x 600 seconds
+    assert data["total_practice_time"] == 2400
+    assert data["total_sessions"] == 4
+    assert data["most_active_member"]["total_practice_time"] == 1200
+    assert data["start_date"] == str(today - timedelta(days=1))
+
+    _, short_range_queries = count_queries(
+        lambda: _get(period="custom", start_date=str(today - timedelta(days=7)), end_date=str(today))
+    )
+    _, long_range_queries = count_queries(
+        lambda: _get(period="custom", start_date=str(today - timedelta(days=3650)), end_date=str(today))
+    )
+    assert short_range_queries == long_range_queries
+
+    response = _get(period="month")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["start_date"] == str(today.replace(day=1))
+    assert date.fromisoformat(data["end_date"]).month == today.month
+    assert (date.fromisoformat(data["end_date"]) + timedelta(days=1)).day == 1
+    # Practice days inside this month only (records are today, today-1 and today-2)
+    assert data["total_practice_time"] == 2 * 600 * sum(
+        1 for d in range(3) if (today - timedelta(days=d)).month == today.month
+    )
+
+    assert _get(period="custom").status_code == status.HTTP_400_BAD_REQUEST
+    assert _get(
+        period="custom", start_date=str(today), end_date=str(today - timedelta(days=1))
+    ).status_code == status.HTTP_400_BAD_REQUEST
+    assert _get(period="decade").status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,80 @@
+from fastapi import status
+from datetime import date
+from app.models.user import User
+from app.models.group import GroupMember
+from app.models.practice import PracticeSession
+from app.services import leaderboard
+
+def _complete_session(db_session, user_id, seconds):
+    session = PracticeSession(
+        user_id=user_id,
+        practice_date=date.today(),
+        actual_play_time=seconds,
+        status="completed"
+    )
+    db_session.add(session)
+    db_session.flush()
+    leaderboard.apply_session_completed(db_session, session)
+    db_session.commit()
+
+def test_group_leaderboard(authorized_client, db_session, test_user):
+    """
+    Test incremental group leaderboard updates, rank ties and my rank
+    """
+    response = authorized_client.post("/api/groups", json={"group_name": "Leaderboard", "is_public": True})
+    assert response.status_code == status.HTTP_201_CREATED
+    group_id = response.json()["group_id"]
+
+    others = []
+    for i in range(3):
+        user = User(
+            email=f"rank{i}@example.com",
+            nickname=f"rank{i}",
+            unique_code=f"RANKCODE{i:04d}",
+            password_hash="hashed_password",
+            is_active=True
+        )
+        db_session.add(user)
+        db_session.flush()
+        db_session.add(GroupMember(group_id=group_id, user_id=user.user_id, role="member"))
+        db_session.flush()
+        leaderboard.add_group_member(db_session, group_id, user.user_id)
+        others.append(user)
+    db_session.commit()
+
+    _complete_session(db_session, others[0].user_id, 3000)
+    _complete_session(db_session, others[1].user_id, 1000)
+    _complete_session(db_session, others[2].user_id, 1000)
+
+    # Ending a session through the API updates the leaderboard too
+    session = authorized_client.post("/api/practice/sessions", json={"practice_date": str(date.today())}).json()
+    authorized_client.put(f"/api/practice/sessions/{session['session_id']}", json={"actual_play_time": 2000})
+
+    response = authorized_client.get(f"/api/leaderboards/groups/{group_id}", params={"period": "week"})
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert [(e["rank"], e["total_seconds"]) for e in data["entries"]] == [(1, 3000), (2, 2000), (3, 1000), (3, 1000)]
+    assert data["my_entry"]["rank"] == 2
+
+    # Next page starting in the middle of a tie keeps the shared rank
+    response = authorized_client.get(f"/api/leaderboards/groups/{group_id}", params={"period": "all", "page_size": 3})
+    data = response.json()
+    assert [(e["rank"], e["total_seconds"]) for e in data["entries"]] == [(1, 3000), (2, 2000), (3, 1000)]
+    assert data["has_more"] is True
+    response = authorized_client.get(
+        f"/api/leaderboards/groups/{group_id}",
+        params={"period": "all", "page_size": 3, "cursor": data["next_cursor"]}
+    )
+    data = response.json()
+    assert [(e["rank"], e["total_seconds"]) for e in data["entries"]] == [(3, 1000)]
+    assert data["next_cursor"] is None
+    assert data["my_entry"]["rank"] == 2
+
+    response = authorized_client.get(f"/api/leaderboards/groups/{group_id}", params={"cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    # Leaving the group removes the member from the board
+    leaderboard.remove_group_member(db_session, group_id, others[0].user_id)
+    db_session.commit()
+    response = authorized_client.get(f"/api/leaderboards/groups/{group_id}", params={"period": "day"})
+    assert response.json()["entries"][0]["user_id"] == test_user.user_id
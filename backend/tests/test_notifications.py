@@ -0,0 +1,220 @@
+def _create_posts(client, count):
+    return [
+        client.post("/api/board/posts", json={"title": f"Post {i}", "content": "content", "category": "free"}).json()["post_id"]
+        for i in range(count)
+    ]
+
+def test_notifications_go_through_outbox(authorized_client, db_session):
+    """
+    Test board actions only enqueue events and the dispatcher expands them into notifications
+    """
+    from app.models.user import User
+    from app.models.board import Post, Comment
+    from app.models.notification import Notification, NotificationEvent
+    from app.services import notification_outbox
+
+    owner = User(email="owner@example.com", nickname="owner", unique_code="OWNER0000001",
+                 password_hash="hashed_password", is_active=True)
+    db_session.add(owner)
+    db_session.flush()
+    post = Post(user_id=owner.user_id, title="t" * 60, content="content", like_count=0)
+    db_session.add(post)
+    db_session.flush()
+    owner_comment = Comment(post_id=post.post_id, user_id=owner.user_id, content="owner comment", like_count=0)
+    db_session.add(owner_comment)
+    db_session.commit()
+
+    authorized_client.post(f"/api/board/posts/{post.post_id}/likes")
+    authorized_client.post(
+        f"/api/board/posts/{post.post_id}/comments",
+        json={"content": "reply", "parent_comment_id": owner_comment.comment_id}
+    )
+
+    assert db_session.query(Notification).filter(Notification.receiver_id == owner.user_id).count() == 0
+    assert notification_outbox.get_outbox_metrics(db_session)["pending"] == 2
+
+    result = notification_outbox.dispatch_batch(db_session)
+    assert (result.events, result.notifications) == (2, 3)
+    received = db_session.query(Notification).filter(Notification.receiver_id == owner.user_id).all()
+    assert sorted(n.type for n in received) == ["comment", "like", "reply"]
+    assert all(n.content == "t" * 50 + "..." for n in received if n.type != "reply")
+
+    assert db_session.query(NotificationEvent).filter(NotificationEvent.processed_at.is_(None)).count() == 0
+    assert notification_outbox.dispatch_batch(db_session).events == 0
+
+def test_like_notifications_are_aggregated(authorized_client, db_session, test_user):
+    """
+    Test likes on one post collapse into a single unread notification with count and latest senders
+    """
+    from app.models.user import User
+    from app.models.notification import Notification
+    from app.services import notification_outbox
+
+    post_id = _create_posts(authorized_client, 1)[0]
+    likers = [
+        User(email=f"fan{i}@example.com", nickname=f"fan{i}", unique_code=f"FAN{i:09d}",
+             password_hash="hashed_password", is_active=True)
+        for i in range(5)
+    ]
+    db_session.add_all(likers)
+    db_session.commit()
+
+    def _like(user):
+        notification_outbox.enqueue(db_session, notification_outbox.EVENT_POST_LIKED, actor_id=user.user_id, post_id=post_id)
+
+    for user in likers[:3]:
+        _like(user)
+    db_session.commit()
+    notification_outbox.dispatch_batch(db_session)
+    # Second batch merges into the unread row; a repeated sender is not counted twice
+    _like(likers[3])
+    _like(likers[0])
+    db_session.commit()
+    notification_outbox.dispatch_batch(db_session)
+
+    rows = db_session.query(Notification).filter(Notification.receiver_id == test_user.user_id).all()
+    assert len(rows) == 1
+    db_session.refresh(rows[0])
+    assert rows[0].actor_count == 4
+    assert rows[0].sender_id == likers[0].user_id
+    assert rows[0].recent_sender_ids == [likers[0].user_id, likers[3].user_id, likers[2].user_id]
+
+    feed = authorized_client.get("/api/notifications").json()["notifications"]
+    assert feed[0]["actor_count"] == 4
+    assert feed[0]["recent_sender_nicknames"] == ["fan0", "fan3", "fan2"]
+
+    # Once read, new likes start a fresh notification
+    authorized_client.post("/api/notifications/read-all")
+    _like(likers[4])
+    db_session.commit()
+    notification_outbox.dispatch_batch(db_session)
+    assert db_session.query(Notification).filter(Notification.receiver_id == test_user.user_id).count() == 2
+
+def test_unread_counter_and_notification_feed(authorized_client, db_session, test_user):
+    """
+    Test the unread counter follows dispatch/read and the feed paginates by cursor
+    """
+    from app.models.user import User
+    from app.models.notification import Notification
+    from app.services import notification_counters, notification_outbox
+
+    post_ids = _create_posts(authorized_client, 5)
+    fan = User(email="badge@example.com", nickname="badge", unique_code="BADGE0000001",
+               password_hash="hashed_password", is_active=True)
+    db_session.add(fan)
+    db_session.commit()
+    for post_id in post_ids:
+        notification_outbox.enqueue(db_session, notification_outbox.EVENT_POST_LIKED, actor_id=fan.user_id, post_id=post_id)
+    db_session.commit()
+    notification_outbox.dispatch_batch(db_session)
+    # Merged into existing unread rows: the counter does not move
+    notification_outbox.enqueue(db_session, notification_outbox.EVENT_POST_LIKED, actor_id=fan.user_id, post_id=post_ids[0])
+    db_session.commit()
+    notification_outbox.dispatch_batch(db_session)
+
+    assert authorized_client.get("/api/notifications/unread-count").json() == {"unread_count": 5}
+
+    seen, cursor = [], None
+    while True:
+        page = authorized_client.get("/api/notifications", params={"cursor": cursor, "page_size": 2}).json()
+        assert page["unread_count"] == 5
+        seen.extend(n["notification_id"] for n in page["notifications"])
+        if not page["has_more"]:
+            break
+        cursor = page["next_cursor"]
+    assert len(seen) == len(set(seen)) == 5
+
+    authorized_client.patch(f"/api/notifications/{seen[0]}/read")
+    authorized_client.patch(f"/api/notifications/{seen[0]}/read")
+    assert authorized_client.get("/api/notifications/unread-count").json()["unread_count"] == 4
+    authorized_client.post("/api/notifications/read-all")
+    assert authorized_client.get("/api/notifications/unread-count").json()["unread_count"] == 0
+
+    # Drift (e.g. cascade deletes) is repaired by reconcile
+    db_session.query(Notification).filter(Notification.notification_id == seen[1]).update({"is_read": False})
+    db_session.commit()
+    assert notification_counters.reconcile_unread_counts(db_session, [test_user.user_id]) == 1
+    db_session.refresh(test_user)
+    assert test_user.unread_notification_count == 1
+
+def test_notification_push_hub_routing_and_backpressure():
+    """
+    Test NOTIFY payloads reach only the target user's connections and slow connections get a resync
+    """
+    import asyncio
+    import json
+    from app.services import notification_push
+
+    async def _scenario():
+        hub = notification_push.NotificationHub()
+        hub._queue_size = 2
+        mine = hub.register(1)
+        other = hub.register(2)
+        assert hub.connection_count() == 2
+
+        hub.handle_payload(json.dumps({"user_id": 1, "unread_count": 3}))
+        hub.handle_payload(json.dumps({"user_id": 99, "unread_count": 1}))  # not connected here
+        assert mine.queue.get_nowait() == {"type": "unread_count", "unread_count": 3}
+        assert other.queue.empty()
+
+        for count in range(3):
+            hub.handle_payload(json.dumps({"user_id": 2, "unread_count": count}))
+        assert other.queue.qsize() == 1
+        assert other.queue.get_nowait() == {"type": "resync"}
+
+        hub.unregister(mine)
+        hub.unregister(other)
+        metrics = hub.get_metrics()
+        assert (metrics["connections"], metrics["notifies"], metrics["resyncs"]) == (0, 5, 1)
+
+    asyncio.run(_scenario())
+
+def test_push_publish_emits_notify_payloads_on_commit():
+    """
+    Test published payloads reach a LISTEN connection only after the publishing transaction commits
+    (uses committed rows on its own session because the rolled-back test transaction never delivers NOTIFY)
+    """
+    import json
+    import select
+    from sqlalchemy import text
+    from app.models.user import User
+    from app.services import notification_push
+    from tests.conftest import TestingSessionLocal, engine
+
+    listener = engine.raw_connection()
+    db = TestingSessionLocal()
+    user_id = None
+    try:
+        listen_connection = listener.driver_connection
+        listen_connection.autocommit = True
+        with listen_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {notification_push.CHANNEL}")
+
+        user = User(email="push@example.com", nickname="push", unique_code="PUSH00000001",
+                    password_hash="hashed_password", is_active=True, unread_notification_count=2)
+        db.add(user)
+        db.commit()
+        user_id = user.user_id
+
+        notification_push.publish_unread_counts(db, [user_id])
+        notification_push.publish_notifications(db, {user_id: [11, 12]})
+        listen_connection.poll()
+        assert listen_connection.notifies == []  # not delivered before commit
+        db.commit()
+
+        payloads = []
+        while len(payloads) < 2 and select.select([listen_connection], [], [], 5) != ([], [], []):
+            listen_connection.poll()
+            while listen_connection.notifies:
+                payloads.append(json.loads(listen_connection.notifies.pop(0).payload))
+        assert payloads == [
+            {"user_id": user_id, "unread_count": 2},
+            {"user_id": user_id, "unread_count": 2, "notification_ids": [11, 12]},
+        ]
+    finally:
+        if user_id is not None:
+            db.execute(text("DELETE FROM users WHERE user_id = :user_id"), {"user_id": user_id})
+            db.commit()
+        db.close()
+        # Discard instead of returning to the pool: the DBAPI connection is in autocommit mode and LISTENing
+        listener.invalidate()
@@ -76,3 +76,123 @@ def test_get_sessions_list(authorized_client):
     assert "sessions" in data
     # We expect 0 if isolated, or >0 if setup data exists.
     # Since we roll back, it should be 0 unless we add setup data.
+
+def test_statistics_rollup(authorized_client):
+    """
+    Test that statistics follow session completion and deletion
+    """
+    create_payload = {
+        "practice_date": str(date.today()),
+        "instrument": "Piano"
+    }
+    session = authorized_client.post("/api/practice/sessions", json=create_payload).json()
+    session_id = session["session_id"]
+    authorized_client.put(f"/api/practice/sessions/{session_id}", json={"actual_play_time": 1800})
+
+    response = authorized_client.get("/api/practice/statistics")
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total_practice_time"] == 1800
+    assert data["total_sessions"] == 1
+    assert data["consecutive_days"] == 1
+    assert data["last_practice_date"] == str(date.today())
+
+    # Deleting the only session resets the rollup
+    authorized_client.delete(f"/api/practice/sessions/{session_id}")
+    data = authorized_client.get("/api/practice/statistics").json()
+    assert data["total_practice_time"] == 0
+    assert data["total_sessions"] == 0
+    assert data["consecutive_days"] == 0
+    assert data["last_practice_date"] is None
+
+def test_practice_calendar(authorized_client):
+    """
+    Test monthly calendar of daily totals
+    """
+    today = date.today()
+    for play_time in (600, 900):
+        session = authorized_client.post(
+            "/api/practice/sessions",
+            json={"practice_date": str(today), "instrument": "Piano"}
+        ).json()
+        authorized_client.put(
+            f"/api/practice/sessions/{session['session_id']}",
+            json={"actual_play_time": play_time}
+        )
+
+    response = authorized_client.get(
+        "/api/practice/calendar",
+        params={"year": today.year, "month": today.month}
+    )
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert len(data["users"]) == 1
+    days = data["users"][0]["days"]
+    assert days == [{"practice_date": str(today), "total_seconds": 1500, "session_count": 2}]
+    assert data["users"][0]["total_seconds"] == 1500
+
+def test_average_weekly_cohort(authorized_client, db_session, test_user):
+    """
+    Test cohort weekly averages exclude the current user and only match the exact instrument/user-type set
+    """
+    from datetime import timedelta
+    from app.models.user import User
+    from app.models.instrument import Instrument
+    from app.models.user_type import UserType
+    from app.models.practice import PracticeDailyTotal
+    from app.services import practice_cohort
+
+    instrument = Instrument(name="Cohort Piano")
+    hobby = UserType(name="Cohort Hobby")
+    jazz = UserType(name="Cohort Jazz")
+    db_session.add_all([instrument, hobby, jazz])
+    db_session.commit()
+
+    week_start = date.today() - timedelta(days=6)
+    peers = []
+    for i, type_ids in enumerate([[hobby.user_type_id], [hobby.user_type_id], [hobby.user_type_id, jazz.user_type_id]]):
+        user = User(
+            email=f"cohort{i}@example.com",
+            nickname=f"cohort{i}",
+            unique_code=f"COHORT{i:06d}",
+            password_hash="hashed_password",
+            is_active=True
+        )
+        db_session.add(user)
+        db_session.flush()
+        peers.append((user, type_ids))
+    db_session.commit()
+
+    from app.core.security import create_access_token
+    for user, type_ids in peers + [(test_user, [hobby.user_type_id])]:
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': str(user.user_id)})}"}
+        assert authorized_client.put("/api/users/me/instruments", headers=headers, json={
+            "instrument_ids": [instrument.instrument_id],
+            "primary_instrument_id": instrument.instrument_id
+        }).status_code == status.HTTP_200_OK
+        assert authorized_client.put("/api/users/me/user-types", headers=headers, json={
+            "user_type_ids": type_ids
+        }).status_code == status.HTTP_200_OK
+
+    # peer 0 practiced every day, peer 1 only on the first day, the superset peer is excluded
+    db_session.add_all(
+        [PracticeDailyTotal(user_id=peers[0][0].user_id, practice_date=week_start + timedelta(days=d), total_seconds=1200, session_count=1) for d in range(7)]
+        + [PracticeDailyTotal(user_id=peers[1][0].user_id, practice_date=week_start, total_seconds=600, session_count=1)]
+        + [PracticeDailyTotal(user_id=peers[2][0].user_id, practice_date=week_start, total_seconds=9999, session_count=1)]
+        + [PracticeDailyTotal(user_id=test_user.user_id, practice_date=week_start, total_seconds=5000, session_count=1)]
+    )
+    db_session.commit()
+
+    params = {"start_date": str(week_start), "end_date": str(week_start + timedelta(days=6))}
+    response = authorized_client.get("/api/practice/average-weekly", params=params)
+    assert response.status_code == status.HTTP_200_OK
+    data = response.json()
+    assert data["total_users"] == 2
+    assert data["daily_averages"][0] == 900
+    assert data["daily_averages"][1:] == [1200] * 6
+    assert data["consistency_percentage"] == 50
+
+    # The cached aggregate is reused on the next request
+    assert practice_cohort.get_cohort_week(
+        db_session, f"{instrument.instrument_id}:{hobby.user_type_id}", week_start, week_start + timedelta(days=6)
+    ).user_count == 3
@@ -0,0 +1,31 @@
+from datetime import date, timedelta
+from app.models.practice import PracticeDailyTotal
+from app.services import streaks
+
+def test_streaks_gaps_and_islands(db_session, test_user):
+    """
+    Test current/longest streak calculation over practice dates with gaps
+    """
+    today = date.today()
+    # 400-day streak ending today, a gap, then an older 3-day run
+    practice_dates = [today - timedelta(days=i) for i in range(400)]
+    practice_dates += [today - timedelta(days=i) for i in range(402, 405)]
+    db_session.add_all([
+        PracticeDailyTotal(user_id=test_user.user_id, practice_date=d, total_seconds=60, session_count=1)
+        for d in practice_dates
+    ])
+    db_session.commit()
+
+    streak = streaks.get_user_streak(db_session, test_user.user_id)
+    assert streak.last_practice_date == today
+    assert streak.current_streak == 400
+    assert streak.longest_streak == 400
+    assert streak.consecutive_days(today) == 400
+    assert streak.consecutive_days(today + timedelta(days=1)) == 0
+
+def test_streaks_without_practice(db_session, test_user):
+    """
+    Test users without practice records
+    """
+    assert streaks.get_streaks(db_session, [test_user.user_id]) == {}
+    assert streaks.get_user_streak(db_session, test_user.user_id).consecutive_days() == 0
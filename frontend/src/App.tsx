@@ -26,7 +26,7 @@ import { View } from './types'
 import { authApi } from './services/api/auth'
 import { useAuthStore } from './store/slices/authSlice'
 import { groupsApi } from './services/api/groups'
-import { notificationsApi } from './services/api/notifications'
+import { notificationsApi, NotificationListResponse } from './services/api/notifications'
 
 // Protected Route Component
 function ProtectedRoute({ children }: { children: ReactNode }) {
@@ -147,11 +147,44 @@ function App() {
     checkAuth()
   }, [queryClient, setUser])
 
+  // 실시간 알림 연결 (연결된 동안에는 폴링하지 않음)
+  const [isNotificationStreamOpen, setIsNotificationStreamOpen] = useState(false)
+  useEffect(() => {
+    if (!isAuthenticated) return
+    let socket: WebSocket | null = null
+    let retryTimer: ReturnType<typeof setTimeout> | undefined
+    let closed = false
+    const connect = () => {
+      socket = notificationsApi.openStream(
+        (message) => {
+          if (message.type === 'unread_count') {
+            queryClient.setQueryData<NotificationListResponse>(['notifications'], (prev) =>
+              prev ? { ...prev, unread_count: message.unread_count } : prev
+            )
+          } else {
+            queryClient.invalidateQueries({ queryKey: ['notifications'] })
+          }
+        },
+        () => setIsNotificationStreamOpen(true),
+        () => {
+          setIsNotificationStreamOpen(false)
+          if (!closed) retryTimer = setTimeout(connect, 30 * 1000)
+        }
+      )
+    }
+    connect()
+    return () => {
+      closed = true
+      clearTimeout(retryTimer)
+      socket?.close()
+    }
+  }, [isAuthenticated, queryClient])
+
   const { data: notificationsData } = useQuery({
     queryKey: ['notifications'],
     queryFn: () => notificationsApi.getNotifications(),
     enabled: isAuthenticated,
-    refetchInterval: 60 * 1000,
+    refetchInterval: isNotificationStreamOpen ? false : 60 * 1000,
   })
 
   const markAllAsReadMutation = useMutation({
@@ -202,7 +235,9 @@ function App() {
       type: n.type,
       postId: n.post_id?.toString(),
       postTitle: n.content || '',
-      commenter: n.sender_nickname || '알 수 없음',
+      commenter: n.actor_count > 1
+        ? `${n.sender_nickname || '알 수 없음'} 외 ${n.actor_count - 1}명`
+        : n.sender_nickname || '알 수 없음',
       senderNickname: n.sender_nickname || ''
     })) || [],
     groupNotifications: [],
@@ -37,6 +37,23 @@ export interface PostListResponse {
   page: number;
   page_size: number;
   total_pages: number;
+  next_cursor?: string | null;
+  has_more?: boolean;
+  total_is_estimate?: boolean;
+}
+
+export interface PostSearchResult extends Post {
+  rank: number;
+  snippet?: string | null;  // 본문 하이라이트 (HTML 이스케이프 후 일치 부분을 <mark>로 감쌈)
+}
+
+export interface PostSearchResponse {
+  posts: PostSearchResult[];
+  total: number;
+  page: number;
+  page_size: number;
+  total_pages: number;
+  query: string;
 }
 
 export interface PostCreate {
@@ -87,7 +104,9 @@ export interface PostComment {
 
 export interface CommentListResponse {
   comments: PostComment[];
-  total: number;
+  total: number;  // 이번 응답의 최상위 댓글 수
+  next_cursor?: string | null;
+  has_more?: boolean;
 }
 
 export interface CommentCreate {
@@ -104,6 +123,16 @@ export interface LikeResponse {
   like_count: number;
 }
 
+export type ReactionKind = 'post_like' | 'post_bookmark' | 'comment_like';
+
+export interface ReactionResult {
+  kind: ReactionKind;
+  target_id: number;
+  found: boolean;
+  is_active: boolean;
+  count?: number | null;  // 북마크는 null
+}
+
 export interface MessageResponse {
   message: string;
 }
@@ -120,11 +149,28 @@ export const boardApi = {
     search?: string;
     author_id?: number;
     bookmarked_only?: boolean;
+    cursor?: string;
+    with_total?: boolean;
   }): Promise<PostListResponse> => {
     const response = await apiClient.get<PostListResponse>('/board/posts', { params });
     return response.data;
   },
 
+  /**
+   * 게시글 검색 (관련도순)
+   */
+  searchPosts: async (params: {
+    q: string;
+    page?: number;
+    page_size?: number;
+    category?: string;
+    tag?: string;
+    author_id?: number;
+  }): Promise<PostSearchResponse> => {
+    const response = await apiClient.get<PostSearchResponse>('/board/posts/search', { params });
+    return response.data;
+  },
+
   /**
    * 게시글 작성
    */
@@ -184,8 +230,8 @@ export const boardApi = {
   /**
    * 댓글 목록 조회
    */
-  getComments: async (postId: number): Promise<CommentListResponse> => {
-    const response = await apiClient.get<CommentListResponse>(`/board/posts/${postId}/comments`);
+  getComments: async (postId: number, params?: { cursor?: string; page_size?: number }): Promise<CommentListResponse> => {
+    const response = await apiClient.get<CommentListResponse>(`/board/posts/${postId}/comments`, { params });
     return response.data;
   },
 
@@ -220,5 +266,13 @@ export const boardApi = {
     const response = await apiClient.post<LikeResponse>(`/board/comments/${commentId}/likes`);
     return response.data;
   },
+
+  /**
+   * 좋아요/북마크 여러 건 토글 (요청 순서대로 적용)
+   */
+  toggleReactions: async (actions: { kind: ReactionKind; target_id: number }[]): Promise<ReactionResult[]> => {
+    const response = await apiClient.post<{ results: ReactionResult[] }>('/board/reactions/batch', { actions });
+    return response.data.results;
+  },
 };
 
@@ -140,8 +140,13 @@ export interface GroupStatistics {
   average_sessions_per_member: number;
   most_active_member?: GroupMemberStatistics | null;
   weekly_practice_data: number[];
+  period?: GroupStatisticsPeriod;
+  start_date?: string | null;
+  end_date?: string | null;
 }
 
+export type GroupStatisticsPeriod = 'all' | 'week' | 'month' | 'custom';
+
 export interface GroupMemberStatisticsListResponse {
   members: GroupMemberStatistics[];
   total: number;
@@ -261,9 +266,13 @@ export const groupsApi = {
   /**
    * 그룹 전체 통계 조회
    */
-  getGroupStatistics: async (group_id: number, period: 'all' | 'week' = 'all'): Promise<GroupStatistics> => {
+  getGroupStatistics: async (
+    group_id: number,
+    period: GroupStatisticsPeriod = 'all',
+    range?: { start_date: string; end_date: string }
+  ): Promise<GroupStatistics> => {
     const response = await apiClient.get<GroupStatistics>(`/groups/${group_id}/statistics`, {
-      params: { period }
+      params: { period, ...(period === 'custom' ? range : {}) }
     });
     return response.data;
   },
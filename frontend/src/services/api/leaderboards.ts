@@ -0,0 +1,48 @@
+import apiClient from './client';
+
+export type LeaderboardPeriod = 'day' | 'week' | 'month' | 'all';
+
+export interface LeaderboardEntry {
+  rank: number;
+  user_id: number;
+  nickname: string;
+  profile_image_url?: string | null;
+  total_seconds: number;
+}
+
+export interface LeaderboardResponse {
+  scope_type: 'group' | 'instrument';
+  scope_id: number;
+  period: LeaderboardPeriod;
+  period_start: string;
+  entries: LeaderboardEntry[];
+  my_entry?: LeaderboardEntry | null;
+  page_size: number;
+  next_cursor?: string | null;
+  has_more: boolean;
+}
+
+export interface LeaderboardParams {
+  period?: LeaderboardPeriod;
+  date?: string;
+  cursor?: string;
+  page_size?: number;
+}
+
+export const leaderboardsApi = {
+  /**
+   * 그룹 리더보드 조회
+   */
+  getGroupLeaderboard: async (group_id: number, params: LeaderboardParams = {}): Promise<LeaderboardResponse> => {
+    const response = await apiClient.get<LeaderboardResponse>(`/leaderboards/groups/${group_id}`, { params });
+    return response.data;
+  },
+
+  /**
+   * 악기별 리더보드 조회 (주요 악기 기준)
+   */
+  getInstrumentLeaderboard: async (instrument_id: number, params: LeaderboardParams = {}): Promise<LeaderboardResponse> => {
+    const response = await apiClient.get<LeaderboardResponse>(`/leaderboards/instruments/${instrument_id}`, { params });
+    return response.data;
+  },
+};
@@ -5,6 +5,8 @@ export interface Notification {
     receiver_id: number;
     sender_id: number | null;
     sender_nickname: string | null;
+    actor_count: number; // 묶음 알림 발신자 수
+    recent_sender_nicknames: string[];
     type: 'like' | 'comment' | 'reply' | 'excellent_post' | 'report_hidden' | 'report_deleted';
     post_id: number | null;
     comment_id: number | null;
@@ -16,11 +18,31 @@ export interface Notification {
 export interface NotificationListResponse {
     notifications: Notification[];
     unread_count: number;
+    next_cursor: string | null;
+    has_more: boolean;
 }
 
+export type NotificationStreamMessage =
+    | { type: 'notifications'; notifications: Notification[]; unread_count: number }
+    | { type: 'unread_count'; unread_count: number }
+    | { type: 'resync' };
+
+// 실시간 알림 WebSocket 주소 (API 주소의 http(s)를 ws(s)로 변환)
+const getStreamUrl = (token: string): string => {
+    const url = new URL(`${import.meta.env.VITE_API_URL || '/api'}/notifications/ws`, window.location.href);
+    url.protocol = url.protocol === 'https:' ? 'wss:' : 'ws:';
+    url.searchParams.set('token', token);
+    return url.toString();
+};
+
 export const notificationsApi = {
-    getNotifications: async (): Promise<NotificationListResponse> => {
-        const response = await apiClient.get<NotificationListResponse>('/notifications');
+    getNotifications: async (params?: { cursor?: string; page_size?: number }): Promise<NotificationListResponse> => {
+        const response = await apiClient.get<NotificationListResponse>('/notifications', { params });
+        return response.data;
+    },
+
+    getUnreadCount: async (): Promise<{ unread_count: number }> => {
+        const response = await apiClient.get<{ unread_count: number }>('/notifications/unread-count');
         return response.data;
     },
 
@@ -37,4 +59,19 @@ export const notificationsApi = {
         );
         return response.data;
     },
+
+    // 실시간 알림 연결 (연결이 끊기면 onClose 호출, 호출 측에서 폴링으로 대체)
+    openStream: (
+        onMessage: (message: NotificationStreamMessage) => void,
+        onOpen: () => void,
+        onClose: () => void
+    ): WebSocket | null => {
+        const token = localStorage.getItem('access_token');
+        if (!token) return null;
+        const socket = new WebSocket(getStreamUrl(token));
+        socket.onopen = onOpen;
+        socket.onclose = onClose;
+        socket.onmessage = (event) => onMessage(JSON.parse(event.data));
+        return socket;
+    },
 };
@@ -5,6 +5,7 @@ import type {
   PracticeSessionListResponse,
   PracticeSessionCreate,
   PracticeSessionUpdate,
+  PracticeCalendarResponse,
 } from '../../types';
 
 export const practiceApi = {
@@ -62,6 +63,23 @@ export const practiceApi = {
     return response.data;
   },
 
+  /**
+   * 월간 연습 달력 조회 (일별 합계, 여러 사용자 동시 조회 가능)
+   */
+  getCalendar: async (params: {
+    year: number;
+    month: number;
+    user_ids?: number[]; // 그룹 멤버 조회용
+  }): Promise<PracticeCalendarResponse> => {
+    const searchParams = new URLSearchParams({
+      year: String(params.year),
+      month: String(params.month),
+    });
+    params.user_ids?.forEach((userId) => searchParams.append('user_ids', String(userId)));
+    const response = await apiClient.get<PracticeCalendarResponse>('/practice/calendar', { params: searchParams });
+    return response.data;
+  },
+
   /**
    * 진행 중인 세션 조회
    */
@@ -132,6 +132,7 @@ export interface PracticeStatistics {
   total_practice_time: number; // seconds
   total_sessions: number;
   consecutive_days: number;
+  longest_streak?: number;
   last_practice_date?: string; // YYYY-MM-DD
   average_session_time?: number; // seconds
 }
@@ -143,6 +144,24 @@ export interface PracticeSessionListResponse {
   page_size: number;
 }
 
+export interface PracticeDailyTotal {
+  practice_date: string; // YYYY-MM-DD
+  total_seconds: number;
+  session_count: number;
+}
+
+export interface PracticeCalendarResponse {
+  year: number;
+  month: number;
+  start_date: string;
+  end_date: string;
+  users: {
+    user_id: number;
+    total_seconds: number;
+    days: PracticeDailyTotal[];
+  }[];
+}
+
 export interface PracticeSessionCreate {
   practice_date: string; // YYYY-MM-DD
   instrument?: string;
@@ -430,6 +449,9 @@ export interface PostListResponse {
   page: number;
   page_size: number;
   total_pages: number;
+  next_cursor?: string | null;
+  has_more?: boolean;
+  total_is_estimate?: boolean;
 }
 
 export interface PostStatusUpdateRequest {